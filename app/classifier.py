@@ -1,9 +1,10 @@
 from typing import List, Dict, Any
-from .classifiers.simple import es_accidente_simple
-from .classifiers.stemmer import es_accidente_stemmer
-from .classifiers.lemmatizer import es_accidente_lemmatizer
-from .classifiers.ml_weighted import es_accidente_ml_weighted
-from .classifiers import DEFAULT_THRESHOLDS
+from .classifiers.simple import es_accidente_simple, puntaje_simple
+from .classifiers.stemmer import es_accidente_stemmer, puntaje_stemmer
+from .classifiers.lemmatizer import es_accidente_lemmatizer, puntaje_lemmatizer
+from .classifiers.ml_weighted import es_accidente_ml_weighted, puntaje_ml_weighted
+from .classifiers import DEFAULT_THRESHOLDS, VOTOS_MINIMOS, CLASIFICADORES, get_matcher
+from .classifiers.preprocessing import preprocesar, preprocesar_lote
 
 def es_accidente_transito(titulo: str, contenido: str, search_terms: List[str] = None) -> bool:
     if search_terms is None:
@@ -17,12 +18,12 @@ def es_accidente_transito(titulo: str, contenido: str, search_terms: List[str] =
             'heridos', 'fallecidos', 'muertos', 'lesionados'
         ]
     texto = f"{titulo} {contenido}".lower()
-    return any(term in texto for term in search_terms)
+    return get_matcher(search_terms).contiene_alguno(texto)
 
 def determinar_accidente_transito(resultados_clasificadores: Dict[str, bool]) -> bool:
     """
     Determina si es accidente de tránsito basado en voto mayoritario de clasificadores.
-    Retorna True si 2 o más clasificadores dan True.
+    Retorna True si VOTOS_MINIMOS (2) o más clasificadores dan True.
     
     Args:
         resultados_clasificadores: Diccionario con los resultados de cada clasificador
@@ -38,9 +39,9 @@ def determinar_accidente_transito(resultados_clasificadores: Dict[str, bool]) ->
         resultados_clasificadores['ml_weighted']
     ])
     
-    return votos_positivos >= 2
+    return votos_positivos >= VOTOS_MINIMOS
 
-def clasificar_noticia_completa(titulo: str, contenido: str, thresholds: Dict[str, float] = None) -> str:
+def clasificar_noticia_completa(titulo: str, contenido: str, thresholds: Dict[str, float] = None, doc=None) -> str:
     """
     Clasifica una noticia usando todos los clasificadores disponibles y determina
     el resultado final por voto mayoritario. Devuelve 'ACCIDENTE' o 'NO_ACCIDENTE'.
@@ -49,6 +50,7 @@ def clasificar_noticia_completa(titulo: str, contenido: str, thresholds: Dict[st
         titulo: Título de la noticia
         contenido: Contenido de la noticia
         thresholds: Diccionario con thresholds personalizados para cada clasificador
+        doc: Documento ya preprocesado (opcional)
     
     Returns:
         str: 'ACCIDENTE' o 'NO_ACCIDENTE'
@@ -57,11 +59,15 @@ def clasificar_noticia_completa(titulo: str, contenido: str, thresholds: Dict[st
     if thresholds is None:
         thresholds = DEFAULT_THRESHOLDS
     
+    # Preprocesar el texto una sola vez y compartirlo entre los clasificadores
+    if doc is None:
+        doc = preprocesar(titulo, contenido)
+    
     # Ejecutar todos los clasificadores
-    resultado_simple = es_accidente_simple(titulo, contenido, threshold=thresholds['simple'])
-    resultado_stem = es_accidente_stemmer(titulo, contenido, threshold=thresholds['stemmer'])
-    resultado_lemma = es_accidente_lemmatizer(titulo, contenido, threshold=thresholds['lemmatizer'])
-    resultado_ml = es_accidente_ml_weighted(titulo, contenido, threshold=thresholds['ml_weighted'])
+    resultado_simple = es_accidente_simple(titulo, contenido, threshold=thresholds['simple'], doc=doc)
+    resultado_stem = es_accidente_stemmer(titulo, contenido, threshold=thresholds['stemmer'], doc=doc)
+    resultado_lemma = es_accidente_lemmatizer(titulo, contenido, threshold=thresholds['lemmatizer'], doc=doc)
+    resultado_ml = es_accidente_ml_weighted(titulo, contenido, threshold=thresholds['ml_weighted'], doc=doc)
     
     # Resultados individuales
     resultados_clasificadores = {
@@ -75,4 +81,82 @@ def clasificar_noticia_completa(titulo: str, contenido: str, thresholds: Dict[st
     es_accidente_final = determinar_accidente_transito(resultados_clasificadores)
     
     # Devolver tanto el resultado final como los votos individuales
-    return 'ACCIDENTE' if es_accidente_final else 'NO_ACCIDENTE', resultados_clasificadores 
\ No newline at end of file
+    return 'ACCIDENTE' if es_accidente_final else 'NO_ACCIDENTE', resultados_clasificadores
+
+def clasificar_noticias_lote(noticias: List[tuple], thresholds: Dict[str, float] = None,
+                             batch_size: int = 64, n_process: int = 1) -> List[tuple]:
+    """
+    Clasifica varias noticias a la vez. La lematización se hace con `nlp.pipe`
+    en lotes, lo que es mucho más rápido que documento por documento.
+    
+    Args:
+        noticias: Lista de tuplas (titulo, contenido)
+        thresholds: Diccionario con thresholds personalizados para cada clasificador
+        batch_size: Tamaño de lote para spaCy
+        n_process: Procesos que usa spaCy para lematizar
+    
+    Returns:
+        list: Un (resultado_final, votos_individuales) por noticia, en el mismo orden
+    """
+    docs = preprocesar_lote(noticias, batch_size=batch_size, n_process=n_process)
+    return [
+        clasificar_noticia_completa(titulo, contenido, thresholds=thresholds, doc=doc)
+        for (titulo, contenido), doc in zip(noticias, docs)
+    ]
+
+def puntajes_noticia(titulo: str, contenido: str, doc=None) -> Dict[str, Any]:
+    """
+    Puntajes crudos de cada clasificador, antes de aplicar thresholds. El voto de
+    un clasificador es `not excluido and puntaje >= threshold`, así que con estos
+    valores se puede evaluar cualquier combinación de thresholds sin volver a
+    procesar el texto.
+    
+    Returns:
+        dict: {'excluido': bool, 'simple': int, 'stemmer': int, 'lemmatizer': int, 'ml_weighted': float}
+    """
+    if doc is None:
+        doc = preprocesar(titulo, contenido)
+    
+    return {
+        'excluido': doc.excluido,
+        'simple': puntaje_simple(titulo, contenido, doc=doc),
+        'stemmer': puntaje_stemmer(titulo, contenido, doc=doc),
+        'lemmatizer': puntaje_lemmatizer(titulo, contenido, doc=doc),
+        'ml_weighted': puntaje_ml_weighted(titulo, contenido, doc=doc)
+    }
+
+def puntajes_lote(noticias: List[tuple], batch_size: int = 64, n_process: int = 1) -> List[Dict[str, Any]]:
+    """Versión por lotes de `puntajes_noticia` (lematización con `nlp.pipe`)"""
+    docs = preprocesar_lote(noticias, batch_size=batch_size, n_process=n_process)
+    return [
+        puntajes_noticia(titulo, contenido, doc=doc)
+        for (titulo, contenido), doc in zip(noticias, docs)
+    ]
+
+def votos_desde_puntajes(puntajes: Dict[str, Any], thresholds: Dict[str, float] = None) -> Dict[str, bool]:
+    """Votos de cada clasificador a partir de sus puntajes crudos (mismo criterio que es_accidente_*)"""
+    if thresholds is None:
+        thresholds = DEFAULT_THRESHOLDS
+    return {
+        nombre: not puntajes['excluido'] and puntajes[nombre] >= thresholds[nombre]
+        for nombre in CLASIFICADORES
+    }
+
+def clasificar_desde_puntajes(puntajes: Dict[str, Any], thresholds: Dict[str, float] = None) -> tuple:
+    """Igual que `clasificar_noticia_completa` pero partiendo de puntajes ya calculados"""
+    votos = votos_desde_puntajes(puntajes, thresholds)
+    return 'ACCIDENTE' if determinar_accidente_transito(votos) else 'NO_ACCIDENTE', votos
+
+def campos_clasificacion(resultado_final: str, votos_individuales: Dict[str, bool], huella: str) -> Dict[str, Any]:
+    """Columnas de `Noticia` que guardan el resultado de una clasificación"""
+    return {
+        "clasificacion_huella": huella,
+        # Resultado final
+        "classification": resultado_final,
+        "es_accidente_transito": resultado_final == 'ACCIDENTE',
+        # Votos individuales
+        "es_accidente_simple": votos_individuales.get('simple'),
+        "es_accidente_stem": votos_individuales.get('stemmer'),
+        "es_accidente_lemma": votos_individuales.get('lemmatizer'),
+        "es_accidente_ml": votos_individuales.get('ml_weighted'),
+    }
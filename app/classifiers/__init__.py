@@ -1,3 +1,5 @@
+from .matcher import get_matcher
+
 # Términos de búsqueda centralizados para clasificación de accidentes
 SEARCH_TERMS = [
     'accidente', 'choque', 'colisión','colisionó', 'vial',
@@ -28,10 +30,16 @@ DEFAULT_THRESHOLDS = {
     'ml_weighted': 2    # Score mínimo de 2 para clasificar como accidente
 }
 
+# Votos positivos mínimos (de los 4 clasificadores) para clasificar como accidente
+VOTOS_MINIMOS = 2
+
+# Nombres de los clasificadores, en el orden en que votan
+CLASIFICADORES = ('simple', 'stemmer', 'lemmatizer', 'ml_weighted')
+
 # Términos de exclusión para evitar falsos positivos (noticias de salud, medicamentos, etc.)
 EXCLUSION_TERMS = [
     "medicación", "tratamiento", "cardiovascular", "obesidad", "enfermedad", "hospital", "salud", "medicamento", "protección cardiovascular"
 ]
 
 def contiene_exclusion(texto):
-    return any(term in texto.lower() for term in EXCLUSION_TERMS) 
\ No newline at end of file
+    return get_matcher(EXCLUSION_TERMS).contiene_alguno(texto.lower()) 
\ No newline at end of file
@@ -0,0 +1,43 @@
+"""
+Huellas para saber si una noticia necesita volver a clasificarse.
+
+La huella combina el texto de la noticia con una versión de la configuración de
+los clasificadores (términos, pesos, thresholds y exclusiones). Si ninguna de
+las dos cosas cambió desde la última clasificación, el resultado guardado sigue
+siendo válido y se puede omitir la noticia.
+"""
+import hashlib
+import json
+from . import SEARCH_TERMS, DEFAULT_WEIGHTS, DEFAULT_THRESHOLDS, EXCLUSION_TERMS, VOTOS_MINIMOS
+
+# Incrementar cuando cambie la lógica de algún clasificador (no solo su configuración)
+CLASSIFIER_VERSION = 1
+
+def _hash_config(config) -> str:
+    serializada = json.dumps(config, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(serializada.encode("utf-8")).hexdigest()
+
+def version_puntajes() -> str:
+    """Hash de la configuración de la que dependen los puntajes crudos (sin thresholds)."""
+    return _hash_config({
+        "version": CLASSIFIER_VERSION,
+        "search_terms": SEARCH_TERMS,
+        "weights": DEFAULT_WEIGHTS,
+        "exclusion_terms": EXCLUSION_TERMS,
+    })
+
+def version_config(thresholds=None) -> str:
+    """Hash de la configuración de clasificación con la que se va a clasificar."""
+    return _hash_config({
+        "puntajes": version_puntajes(),
+        "thresholds": thresholds or DEFAULT_THRESHOLDS,
+        "votos_minimos": VOTOS_MINIMOS,
+    })
+
+def huella(titulo: str, contenido: str, version: str) -> str:
+    """Hash del texto de la noticia junto con la versión de configuración."""
+    h = hashlib.sha256(version.encode("utf-8"))
+    for parte in (titulo or "", contenido or ""):
+        h.update(b"\0")
+        h.update(parte.encode("utf-8"))
+    return h.hexdigest()
@@ -1,21 +1,24 @@
-import spacy
-import re
-from . import SEARCH_TERMS, DEFAULT_THRESHOLDS, contiene_exclusion
+from . import SEARCH_TERMS, DEFAULT_THRESHOLDS
+from .preprocessing import preprocesar
 
-print("🔄 Cargando modelo de spaCy para español...")
-nlp = spacy.load("es_core_news_sm")
-print("✅ Modelo de spaCy cargado exitosamente")
-
-def es_accidente_lemmatizer(titulo: str, contenido: str, search_terms=None, threshold=None) -> bool:
+def puntaje_lemmatizer(titulo: str, contenido: str, search_terms=None, doc=None) -> int:
+    """Cantidad de términos de búsqueda presentes entre los lemas del texto"""
     if search_terms is None:
         search_terms = SEARCH_TERMS
+    if doc is None:
+        doc = preprocesar(titulo, contenido)
+    
+    if doc.excluido:
+        return 0
+    lemmas = doc.lemmas
+    return sum(1 for term in search_terms if term in lemmas)
+
+def es_accidente_lemmatizer(titulo: str, contenido: str, search_terms=None, threshold=None, doc=None) -> bool:
     if threshold is None:
         threshold = DEFAULT_THRESHOLDS['lemmatizer']
+    if doc is None:
+        doc = preprocesar(titulo, contenido)
     
-    texto = f"{titulo} {contenido}".lower()
-    if contiene_exclusion(texto):
+    if doc.excluido:
         return False
-    doc = nlp(texto)
-    lemmas = [token.lemma_ for token in doc if not token.is_stop]
-    found_terms = sum(1 for term in search_terms if term in lemmas)
-    return found_terms >= threshold 
\ No newline at end of file
+    return puntaje_lemmatizer(titulo, contenido, search_terms, doc=doc) >= threshold
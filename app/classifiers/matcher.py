@@ -0,0 +1,40 @@
+from functools import lru_cache
+from typing import Iterable, Set
+import ahocorasick
+
+class TermMatcher:
+    """
+    Autómata Aho–Corasick compilado una sola vez a partir de una lista de términos.
+    Encuentra todos los términos presentes en un texto en una única pasada lineal,
+    sin importar cuántos términos haya en el vocabulario.
+    """
+
+    def __init__(self, terms: Iterable[str]):
+        self.terms = tuple(dict.fromkeys(terms))
+        self._automaton = ahocorasick.Automaton()
+        for term in self.terms:
+            self._automaton.add_word(term, term)
+        if self.terms:
+            self._automaton.make_automaton()
+
+    def hits(self, texto: str) -> Set[str]:
+        """Términos distintos que aparecen (como subcadena) en el texto."""
+        if not self.terms:
+            return set()
+        return {term for _, term in self._automaton.iter(texto)}
+
+    def contiene_alguno(self, texto: str) -> bool:
+        """Igual que `any(term in texto ...)`, cortando en la primera coincidencia."""
+        if not self.terms:
+            return False
+        for _ in self._automaton.iter(texto):
+            return True
+        return False
+
+@lru_cache(maxsize=32)
+def _matcher_cacheado(terms: tuple) -> TermMatcher:
+    return TermMatcher(terms)
+
+def get_matcher(terms: Iterable[str]) -> TermMatcher:
+    """Devuelve el autómata para esa lista de términos, compilándolo solo la primera vez."""
+    return _matcher_cacheado(tuple(terms))
@@ -1,16 +1,25 @@
 from . import SEARCH_TERMS, DEFAULT_WEIGHTS, DEFAULT_THRESHOLDS
-from . import contiene_exclusion
+from .preprocessing import preprocesar
 
-def es_accidente_ml_weighted(titulo: str, contenido: str, search_terms=None, weights=None, threshold=None) -> bool:
+def puntaje_ml_weighted(titulo: str, contenido: str, search_terms=None, weights=None, doc=None) -> float:
+    """Suma de los pesos de los términos de búsqueda presentes en el texto"""
     if search_terms is None:
         search_terms = SEARCH_TERMS
     if weights is None:
         weights = DEFAULT_WEIGHTS
+    if doc is None:
+        doc = preprocesar(titulo, contenido)
+    
+    if doc.excluido:
+        return 0
+    return sum(weights[term] for term in doc.coincidencias(search_terms))
+
+def es_accidente_ml_weighted(titulo: str, contenido: str, search_terms=None, weights=None, threshold=None, doc=None) -> bool:
     if threshold is None:
         threshold = DEFAULT_THRESHOLDS['ml_weighted']
+    if doc is None:
+        doc = preprocesar(titulo, contenido)
     
-    texto = f"{titulo} {contenido}".lower()
-    if contiene_exclusion(texto):
+    if doc.excluido:
         return False
-    score = sum(weights[term] for term in search_terms if term in texto)
-    return score >= threshold 
\ No newline at end of file
+    return puntaje_ml_weighted(titulo, contenido, search_terms, weights, doc=doc) >= threshold
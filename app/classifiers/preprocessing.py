@@ -0,0 +1,67 @@
+import re
+from functools import cached_property, lru_cache
+from nltk.stem.snowball import SnowballStemmer
+from app.nlp import get_stopwords, lemas, lemas_en_lote
+from . import contiene_exclusion, get_matcher
+
+TOKEN_RE = re.compile(r'\w+')
+
+# Un único stemmer para todo el proceso; las palabras se repiten mucho entre
+# noticias, así que el resultado se memoiza
+_stemmer = SnowballStemmer("spanish")
+
+@lru_cache(maxsize=50000)
+def stem(palabra: str) -> str:
+    return _stemmer.stem(palabra)
+
+class Documento:
+    """
+    Texto de una noticia preprocesado una sola vez y compartido por los cuatro
+    clasificadores. Los pasos costosos (stems, lemas) se calculan recién cuando
+    algún clasificador los pide.
+    """
+
+    def __init__(self, titulo: str, contenido: str):
+        self.texto = f"{titulo} {contenido}".lower()
+        self.excluido = contiene_exclusion(self.texto)
+        self._coincidencias = {}
+
+    def coincidencias(self, search_terms):
+        """Términos de `search_terms` presentes en el texto (una pasada del autómata por lista)."""
+        clave = tuple(search_terms)
+        if clave not in self._coincidencias:
+            self._coincidencias[clave] = get_matcher(clave).hits(self.texto)
+        return self._coincidencias[clave]
+
+    @cached_property
+    def tokens(self):
+        return TOKEN_RE.findall(self.texto)
+
+    @cached_property
+    def tokens_sin_stop(self):
+        stops = get_stopwords()
+        return [t for t in self.tokens if t not in stops]
+
+    @cached_property
+    def stems(self):
+        return frozenset(stem(t) for t in self.tokens_sin_stop)
+
+    @cached_property
+    def lemmas(self):
+        return lemas(self.texto)
+
+def preprocesar(titulo: str, contenido: str) -> Documento:
+    return Documento(titulo, contenido)
+
+def preprocesar_lote(noticias, batch_size: int = 64, n_process: int = 1):
+    """
+    Preprocesa una lista de (titulo, contenido) pasando por spaCy en lotes solo
+    los documentos que no quedan excluidos, que son los únicos que usan lemas.
+    """
+    docs = [Documento(titulo, contenido) for titulo, contenido in noticias]
+    pendientes = [doc for doc in docs if not doc.excluido]
+    if pendientes:
+        lotes = lemas_en_lote([doc.texto for doc in pendientes], batch_size=batch_size, n_process=n_process)
+        for doc, lemmas in zip(pendientes, lotes):
+            doc.lemmas = lemmas
+    return docs
@@ -1,14 +1,23 @@
 from . import SEARCH_TERMS, DEFAULT_THRESHOLDS
-from . import contiene_exclusion
+from .preprocessing import preprocesar
 
-def es_accidente_simple(titulo: str, contenido: str, search_terms=None, threshold=None) -> bool:
+def puntaje_simple(titulo: str, contenido: str, search_terms=None, doc=None) -> int:
+    """Cantidad de términos de búsqueda distintos presentes en el texto"""
     if search_terms is None:
         search_terms = SEARCH_TERMS
+    if doc is None:
+        doc = preprocesar(titulo, contenido)
+    
+    if doc.excluido:
+        return 0
+    return len(doc.coincidencias(search_terms))
+
+def es_accidente_simple(titulo: str, contenido: str, search_terms=None, threshold=None, doc=None) -> bool:
     if threshold is None:
         threshold = DEFAULT_THRESHOLDS['simple']
+    if doc is None:
+        doc = preprocesar(titulo, contenido)
     
-    texto = f"{titulo} {contenido}".lower()
-    if contiene_exclusion(texto):
+    if doc.excluido:
         return False
-    found_terms = sum(1 for term in search_terms if term in texto)
-    return found_terms >= threshold 
\ No newline at end of file
+    return puntaje_simple(titulo, contenido, search_terms, doc=doc) >= threshold
@@ -1,25 +1,30 @@
-import re
-from nltk.corpus import stopwords
-from nltk.stem.snowball import SnowballStemmer
-from . import SEARCH_TERMS, DEFAULT_THRESHOLDS, contiene_exclusion
+from functools import lru_cache
+from . import SEARCH_TERMS, DEFAULT_THRESHOLDS
+from .preprocessing import preprocesar, stem
 
-print("🔄 Cargando stopwords de NLTK...")
-stops = set(stopwords.words("spanish"))
-print("✅ Stopwords de NLTK cargadas exitosamente")
+@lru_cache(maxsize=32)
+def _search_stems(search_terms: tuple) -> tuple:
+    # Se conserva un stem por término (aunque se repitan) para mantener el conteo original
+    return tuple(stem(term) for term in search_terms)
 
-def es_accidente_stemmer(titulo: str, contenido: str, search_terms=None, threshold=None) -> bool:
+def puntaje_stemmer(titulo: str, contenido: str, search_terms=None, doc=None) -> int:
+    """Cantidad de stems de los términos de búsqueda presentes en el texto"""
     if search_terms is None:
         search_terms = SEARCH_TERMS
+    if doc is None:
+        doc = preprocesar(titulo, contenido)
+    
+    if doc.excluido:
+        return 0
+    stems = doc.stems
+    return sum(1 for s in _search_stems(tuple(search_terms)) if s in stems)
+
+def es_accidente_stemmer(titulo: str, contenido: str, search_terms=None, threshold=None, doc=None) -> bool:
     if threshold is None:
         threshold = DEFAULT_THRESHOLDS['stemmer']
+    if doc is None:
+        doc = preprocesar(titulo, contenido)
     
-    stemmer = SnowballStemmer("spanish")
-    texto = f"{titulo} {contenido}".lower()
-    if contiene_exclusion(texto):
+    if doc.excluido:
         return False
-    tokens = re.findall(r'\w+', texto)
-    tokens = [t for t in tokens if t not in stops]
-    stems = [stemmer.stem(t) for t in tokens]
-    search_stems = [stemmer.stem(term) for term in search_terms]
-    found_terms = sum(1 for s in search_stems if s in stems)
-    return found_terms >= threshold 
\ No newline at end of file
+    return puntaje_stemmer(titulo, contenido, search_terms, doc=doc) >= threshold
@@ -0,0 +1,177 @@
+"""
+Resumen diario de noticias (`stats_daily`): cantidad por día, medio y clasificación.
+
+La ingesta y la clasificación avisan qué celdas (día, medio) tocaron y solo esas
+se recalculan desde `noticias`, con una consulta que lee únicamente el índice
+(fecha, media_id, es_accidente_transito), y se escriben con un upsert
+(`INSERT ... SELECT ... ON DUPLICATE KEY UPDATE`), de modo que dos lotes
+concurrentes que tocan la misma celda no chocan en la clave primaria.
+Recalcular la celda completa en lugar de sumar diferencias mantiene el resumen
+correcto aunque una noticia cambie de clasificación o se procese dos veces. Las
+operaciones que borran noticias o modifican toda la base
+(`recalcular_clasificacion`, limpiezas) usan `reconstruir`.
+
+La tabla se crea y se llena con el histórico desde los scripts
+(migrate_add_stats_index.py, rebuild_stats_daily.py), nunca dentro de una
+petición ni de un lote de ingesta.
+
+Así la serie temporal del dashboard lee O(días x medios) filas en lugar de
+recorrer todas las noticias.
+"""
+import threading
+import time
+from typing import Iterable, Set, Tuple
+
+from sqlalchemy import and_, case, delete, func, insert, inspect, or_, select
+from sqlalchemy.dialects import mysql, sqlite
+from sqlalchemy.exc import OperationalError
+
+from app.db import SessionLocal, engine, Noticia, EstadisticaDiaria
+
+# media_id con el que se guardan las noticias sin medio
+SIN_MEDIO = 0
+# Celdas que se recalculan por sentencia
+CELDAS_POR_LOTE = 100
+# Reintentos ante deadlocks o esperas de bloqueo vencidas
+REINTENTOS = 3
+
+_tabla_lista = False
+_tabla_lock = threading.Lock()
+# Celdas que no se pudieron actualizar: se reintentan en la próxima actualización
+_pendientes: Set[Tuple] = set()
+_pendientes_lock = threading.Lock()
+
+_COLUMNAS = [
+    EstadisticaDiaria.fecha, EstadisticaDiaria.media_id, EstadisticaDiaria.total_noticias,
+    EstadisticaDiaria.cantidad_accidentes, EstadisticaDiaria.cantidad_no_accidentes,
+    EstadisticaDiaria.cantidad_sin_clasificar,
+]
+_CONTEOS = [columna.name for columna in _COLUMNAS[2:]]
+
+def _contar(condicion):
+    return func.coalesce(func.sum(case((condicion, 1), else_=0)), 0)
+
+def _agregado():
+    """SELECT que agrupa noticias por (fecha, medio) con las columnas de stats_daily."""
+    return (
+        select(
+            Noticia.fecha,
+            func.coalesce(Noticia.media_id, SIN_MEDIO),
+            func.count(),
+            _contar(Noticia.es_accidente_transito == True),  # noqa: E712
+            _contar(Noticia.es_accidente_transito == False),  # noqa: E712
+            _contar(Noticia.es_accidente_transito.is_(None)),
+        )
+        .group_by(Noticia.fecha, Noticia.media_id)
+    )
+
+def _insertar_agregado(db, condicion=None):
+    consulta = _agregado()
+    if condicion is not None:
+        consulta = consulta.where(condicion)
+    db.execute(insert(EstadisticaDiaria).from_select(_COLUMNAS, consulta))
+
+def _upsert_agregado(db, condicion):
+    """INSERT ... SELECT del agregado que reemplaza los conteos de las celdas que ya existen."""
+    consulta = _agregado().where(condicion)
+    if db.get_bind().dialect.name == "sqlite":
+        sentencia = sqlite.insert(EstadisticaDiaria).from_select(_COLUMNAS, consulta)
+        sentencia = sentencia.on_conflict_do_update(
+            index_elements=[EstadisticaDiaria.fecha, EstadisticaDiaria.media_id],
+            set_={campo: sentencia.excluded[campo] for campo in _CONTEOS},
+        )
+    else:
+        sentencia = mysql.insert(EstadisticaDiaria).from_select(_COLUMNAS, consulta)
+        sentencia = sentencia.on_duplicate_key_update({campo: sentencia.inserted[campo] for campo in _CONTEOS})
+    db.execute(sentencia)
+
+def tabla_disponible() -> bool:
+    """True si la tabla stats_daily existe. Se consulta hasta encontrarla una vez por proceso."""
+    global _tabla_lista
+    if not _tabla_lista:
+        with _tabla_lock:
+            if not _tabla_lista:
+                _tabla_lista = inspect(engine).has_table(EstadisticaDiaria.__tablename__)
+    return _tabla_lista
+
+def asegurar_tabla():
+    """
+    Crea la tabla y la llena con todo el histórico si no existe (bases
+    existentes). Para los scripts de migración: recorre todas las noticias.
+    """
+    if not tabla_disponible():
+        reconstruir()
+
+def reconstruir() -> int:
+    """Recalcula el resumen completo desde noticias. Devuelve la cantidad de celdas."""
+    EstadisticaDiaria.__table__.create(bind=engine, checkfirst=True)
+    db = SessionLocal()
+    try:
+        db.execute(delete(EstadisticaDiaria))
+        _insertar_agregado(db)
+        db.commit()
+        return db.query(EstadisticaDiaria).count()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+def _celdas(db, condicion) -> Set[Tuple]:
+    consulta = select(Noticia.fecha, func.coalesce(Noticia.media_id, SIN_MEDIO)).where(condicion).distinct()
+    return {tuple(fila) for fila in db.execute(consulta)}
+
+def celdas_de_noticias(db, ids: Iterable[int]) -> Set[Tuple]:
+    """Celdas (fecha, medio) a las que pertenecen las noticias con esos ids."""
+    ids = list(ids)
+    return _celdas(db, Noticia.id.in_(ids)) if ids else set()
+
+def celdas_de_urls(db, urls: Iterable[str]) -> Set[Tuple]:
+    """Celdas (fecha, medio) de las noticias con esas URLs (la fecha queda como la guardó la base)."""
+    urls = list(urls)
+    return _celdas(db, Noticia.url.in_(urls)) if urls else set()
+
+def _upsert_celdas(db, celdas):
+    for inicio in range(0, len(celdas), CELDAS_POR_LOTE):
+        lote = celdas[inicio:inicio + CELDAS_POR_LOTE]
+        _upsert_agregado(db, or_(*[
+            and_(
+                Noticia.fecha == fecha,
+                Noticia.media_id.is_(None) if media_id == SIN_MEDIO else Noticia.media_id == media_id
+            )
+            for fecha, media_id in lote
+        ]))
+    db.commit()
+
+def actualizar(db, celdas: Iterable[Tuple]):
+    """
+    Recalcula las celdas (fecha, medio) indicadas, junto con las que quedaron
+    pendientes de una actualización fallida. Ante un deadlock o una espera de
+    bloqueo vencida se reintenta; si aun así falla, las celdas quedan pendientes
+    para la próxima llamada y el error no interrumpe a quien llama (las noticias
+    ya están guardadas).
+    """
+    if not tabla_disponible():
+        print("⚠️  No existe la tabla stats_daily: crearla con scripts/migrate_add_stats_index.py")
+        return
+    with _pendientes_lock:
+        celdas = sorted(set(celdas) | _pendientes)
+        _pendientes.clear()
+    if not celdas:
+        return
+    for intento in range(1, REINTENTOS + 1):
+        try:
+            _upsert_celdas(db, celdas)
+            return
+        except OperationalError as e:
+            db.rollback()
+            error = e
+            time.sleep(0.1 * intento)
+        except Exception as e:
+            db.rollback()
+            error = e
+            break
+    with _pendientes_lock:
+        _pendientes.update(celdas)
+    print(f"❌ No se pudo actualizar stats_daily ({len(celdas)} celdas quedan pendientes "
+          f"para la próxima actualización o scripts/rebuild_stats_daily.py): {error}")
@@ -1,4 +1,4 @@
-from sqlalchemy import create_engine, Column, Integer, String, Text, Date, Boolean, ForeignKey
+from sqlalchemy import create_engine, Column, Integer, String, Text, Date, Boolean, Float, ForeignKey, Index, DDL, event, inspect
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship
 import os
@@ -30,6 +30,14 @@ class Media(Base):
 
 class Noticia(Base):
     __tablename__ = "noticias"
+    __table_args__ = (
+        # Evita duplicados y convierte el chequeo de existencia por URL en una búsqueda por índice
+        Index("ux_noticias_url", "url", unique=True),
+        # Las estadísticas por medio y clasificación se resuelven leyendo solo el índice
+        Index("ix_noticias_media_accidente", "media_id", "es_accidente_transito"),
+        # Recalcular una celda (día, medio) de stats_daily lee solo este índice
+        Index("ix_noticias_fecha_media_accidente", "fecha", "media_id", "es_accidente_transito"),
+    )
     id = Column(Integer, primary_key=True, index=True)
     titulo = Column(String(255), nullable=False)
     contenido = Column(Text, nullable=False)
@@ -51,8 +59,47 @@ class Noticia(Base):
     es_accidente_lemma = Column(Boolean, nullable=True)
     es_accidente_ml = Column(Boolean, nullable=True)
 
+    # Hash del texto y de la configuración de clasificadores usados en la última clasificación
+    clasificacion_huella = Column(String(64), nullable=True)
+
     contenido_crudo = Column(Text, nullable=True)
 
+# Índice FULLTEXT para la búsqueda por relevancia (solo MariaDB/MySQL; en otros
+# motores la búsqueda usa LIKE)
+FULLTEXT_INDEX = "ft_noticias_titulo_contenido"
+event.listen(
+    Noticia.__table__,
+    "after_create",
+    DDL(f"ALTER TABLE noticias ADD FULLTEXT INDEX {FULLTEXT_INDEX} (titulo, contenido)").execute_if(dialect=("mysql", "mariadb"))
+)
+
+class PuntajeClasificacion(Base):
+    """Puntajes crudos de cada clasificador por noticia (antes de aplicar thresholds)"""
+    __tablename__ = "puntajes_clasificacion"
+    noticia_id = Column(Integer, ForeignKey("noticias.id", ondelete="CASCADE"), primary_key=True)
+    # Hash del texto y de la configuración de términos con que se calcularon
+    huella = Column(String(64), nullable=False)
+    excluido = Column(Boolean, nullable=False)
+    simple = Column(Integer, nullable=False)
+    stemmer = Column(Integer, nullable=False)
+    lemmatizer = Column(Integer, nullable=False)
+    ml_weighted = Column(Float, nullable=False)
+
+class EstadisticaDiaria(Base):
+    """Cantidad de noticias por día, medio y clasificación (resumen mantenido por app.daily_stats)"""
+    __tablename__ = "stats_daily"
+    fecha = Column(Date, primary_key=True)
+    # 0 para las noticias sin medio asignado
+    media_id = Column(Integer, primary_key=True)
+    total_noticias = Column(Integer, nullable=False, default=0)
+    cantidad_accidentes = Column(Integer, nullable=False, default=0)
+    cantidad_no_accidentes = Column(Integer, nullable=False, default=0)
+    cantidad_sin_clasificar = Column(Integer, nullable=False, default=0)
+
+def tabla_existe(modelo) -> bool:
+    """True si la tabla del modelo existe (en bases existentes se crea con scripts/migrate_*.py)"""
+    return inspect(engine).has_table(modelo.__tablename__)
+
 def get_db():
     """Obtiene una sesión de la base de datos"""
     db = SessionLocal()
@@ -0,0 +1,201 @@
+"""
+Ingesta en lotes de las noticias scrapeadas.
+
+En lugar de consultar y confirmar cada artículo por separado, `IngestSink`
+acumula los `noticia_data` de los scrapers y, por cada lote, resuelve las URLs
+existentes con una sola consulta `IN` (resuelta por el índice único de `url`) y
+escribe las nuevas con un único `INSERT`. Si otro proceso insertó la misma URL
+entre la consulta y el `INSERT`, el índice único lo rechaza con `IntegrityError`
+y el lote se reintenta de a una noticia, descartando sólo las duplicadas.
+
+Antes de escribir, cada lote pasa por la etapa de clasificación (lematización
+en un solo `nlp.pipe` por lote), así que las noticias se insertan una única vez
+ya clasificadas, junto con sus puntajes, sin una segunda pasada de
+`run_classifiers` sobre la base. Después de cada lote se actualizan las celdas
+(día, medio) del resumen `stats_daily`.
+"""
+import os
+import threading
+from typing import Dict, List
+
+from sqlalchemy import insert, delete
+from sqlalchemy.exc import IntegrityError
+
+from app.db import Noticia, Media, PuntajeClasificacion, tabla_existe
+from app import daily_stats
+from app.classifier import puntajes_lote, clasificar_desde_puntajes, campos_clasificacion
+from app.classifiers.fingerprint import version_config, version_puntajes, huella
+
+INGEST_BATCH_SIZE = int(os.getenv("INGEST_BATCH_SIZE", "50"))
+# Clasificar las noticias al ingerirlas (0 = dejarlas para run_classifiers)
+INGEST_CLASIFICAR = os.getenv("INGEST_CLASIFICAR", "1") == "1"
+
+# Cache de ids de medios compartida por todos los sinks del proceso
+_media_ids: Dict[str, int] = {}
+_media_lock = threading.Lock()
+
+
+class IngestSink:
+    def __init__(self, db, batch_size: int = INGEST_BATCH_SIZE, clasificar: bool = INGEST_CLASIFICAR):
+        self.db = db
+        self.batch_size = batch_size
+        self.clasificar = clasificar
+        self.guardadas = 0
+        # Bases sin migrar: se clasifica igual, sin guardar los puntajes
+        self.guardar_puntajes = tabla_existe(PuntajeClasificacion)
+        # Noticias insertadas sin clasificar (etapa desactivada o con error)
+        self.sin_clasificar = 0
+        self._buffer: List[Dict] = []
+        self._urls_en_buffer = set()
+
+    def add(self, noticia_data: Dict) -> bool:
+        """
+        Encola una noticia para ser guardada. Devuelve False si la URL ya estaba
+        en el lote actual. La existencia en la base se resuelve al hacer `flush`.
+        """
+        if noticia_data["url"] in self._urls_en_buffer:
+            return False
+        self._buffer.append(noticia_data)
+        self._urls_en_buffer.add(noticia_data["url"])
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+        return True
+
+    @property
+    def pendientes(self) -> List[str]:
+        """URLs encoladas que todavía no se escribieron"""
+        return [d["url"] for d in self._buffer]
+
+    def flush(self) -> int:
+        """
+        Escribe el lote pendiente y devuelve la cantidad de noticias nuevas
+        insertadas. Si falla (por ejemplo, se perdió la conexión), el lote vuelve
+        al buffer para reintentarse en el próximo flush y se devuelve 0: no se
+        lanza la excepción, así un flush en un `finally` no oculta el error original.
+        """
+        if not self._buffer:
+            return 0
+        lote, self._buffer, self._urls_en_buffer = self._buffer, [], set()
+        try:
+            return self._escribir(lote)
+        except Exception as e:
+            self.db.rollback()
+            # Escribir de nuevo el lote es seguro: las URLs ya insertadas se filtran con la consulta IN
+            self._buffer = lote + self._buffer
+            self._urls_en_buffer.update(d["url"] for d in lote)
+            print(f"❌ No se pudo guardar el lote ({e}); {len(lote)} noticias quedan pendientes: "
+                  f"{', '.join(d['url'] for d in lote)}")
+            return 0
+
+    def _escribir(self, lote: List[Dict]) -> int:
+        urls = [d["url"] for d in lote]
+        existentes = {url for (url,) in self.db.query(Noticia.url).filter(Noticia.url.in_(urls))}
+        if existentes:
+            print(f"⏭️  {len(existentes)} noticias del lote ya existen")
+
+        filas = [self._fila(d) for d in lote if d["url"] not in existentes]
+        if not filas:
+            return 0
+
+        puntajes = self._clasificar(filas) if self.clasificar else {}
+
+        try:
+            self.db.execute(insert(Noticia), filas)
+            self.db.commit()
+        except Exception as e:
+            # Un registro inválido o una URL insertada por otro proceso no debe hacer perder el lote completo
+            print(f"⚠️  Falló el insert en lote ({e}), reintentando de a una noticia...")
+            self.db.rollback()
+            filas = self._insertar_individualmente(filas)
+        insertadas = len(filas)
+
+        self.guardadas += insertadas
+        urls_insertadas = [fila["url"] for fila in filas]
+        if not puntajes:
+            self.sin_clasificar += insertadas
+        elif self.guardar_puntajes:
+            self._guardar_puntajes({url: puntajes[url] for url in urls_insertadas if url in puntajes})
+        if insertadas:
+            daily_stats.actualizar(self.db, daily_stats.celdas_de_urls(self.db, urls_insertadas))
+        print(f"✅ Lote guardado: {insertadas} noticias nuevas")
+        return insertadas
+
+    def _clasificar(self, filas: List[Dict]) -> Dict[str, Dict]:
+        """
+        Agrega a cada fila su clasificación y devuelve los puntajes por URL. Si
+        la clasificación falla, las noticias se guardan igual sin clasificar.
+        """
+        try:
+            version, version_p = version_config(), version_puntajes()
+            calculados = puntajes_lote(
+                [(fila["titulo"], fila["contenido"]) for fila in filas],
+                batch_size=self.batch_size
+            )
+            campos, puntajes = [], {}
+            for fila, valores in zip(filas, calculados):
+                resultado_final, votos_individuales = clasificar_desde_puntajes(valores)
+                huella_actual = huella(fila["titulo"], fila["contenido"], version)
+                campos.append(campos_clasificacion(resultado_final, votos_individuales, huella_actual))
+                puntajes[fila["url"]] = {"huella": huella(fila["titulo"], fila["contenido"], version_p), **valores}
+        except Exception as e:
+            print(f"⚠️  No se pudo clasificar el lote ({e}), se guarda sin clasificar")
+            return {}
+        # Todas las filas del INSERT en lote deben tener las mismas columnas
+        for fila, valores in zip(filas, campos):
+            fila.update(valores)
+        return puntajes
+
+    def _guardar_puntajes(self, puntajes: Dict[str, Dict]):
+        """Guarda los puntajes de las noticias del lote, ya con su id asignado."""
+        try:
+            ids = dict(self.db.query(Noticia.url, Noticia.id).filter(Noticia.url.in_(list(puntajes))))
+            filas = [{"noticia_id": ids[url], **valores} for url, valores in puntajes.items() if url in ids]
+            if filas:
+                self.db.execute(delete(PuntajeClasificacion).where(PuntajeClasificacion.noticia_id.in_(ids.values())))
+                self.db.execute(insert(PuntajeClasificacion), filas)
+                self.db.commit()
+        except Exception as e:
+            # Las noticias ya quedaron guardadas y clasificadas; los puntajes se recalculan después
+            print(f"⚠️  No se pudieron guardar los puntajes del lote: {e}")
+            self.db.rollback()
+
+    def _insertar_individualmente(self, filas: List[Dict]) -> List[Dict]:
+        """Inserta las filas de a una y devuelve las que se insertaron."""
+        insertadas = []
+        for fila in filas:
+            try:
+                self.db.execute(insert(Noticia), [fila])
+                self.db.commit()
+                insertadas.append(fila)
+            except IntegrityError:
+                # Otro proceso ya la insertó (índice único ux_noticias_url)
+                print(f"⏭️  Noticia ya existente: {fila['url']}")
+                self.db.rollback()
+            except Exception as e:
+                print(f"❌ Error al guardar noticia: {fila['titulo']}: {e}")
+                self.db.rollback()
+        return insertadas
+
+    def _fila(self, noticia_data: Dict) -> Dict:
+        return {
+            "titulo": noticia_data["titulo"],
+            "contenido": noticia_data["contenido"],
+            "contenido_crudo": noticia_data.get("contenido_crudo", ""),
+            "fecha": noticia_data["fecha"],
+            "url": noticia_data["url"],
+            "media_id": self._media_id(noticia_data["media_name"]),
+        }
+
+    def _media_id(self, media_name: str) -> int:
+        media_id = _media_ids.get(media_name)
+        if media_id is not None:
+            return media_id
+        with _media_lock:
+            media = self.db.query(Media).filter_by(name=media_name).first()
+            if media is None:
+                print(f"📰 Creando nuevo medio: {media_name}")
+                media = Media(name=media_name)
+                self.db.add(media)
+                self.db.commit()
+            _media_ids[media_name] = media.id
+            return media.id
@@ -0,0 +1,195 @@
+"""
+Caché de respuestas del LLM para `/consultar`.
+
+La clave combina la pregunta normalizada (minúsculas, sin acentos, sin signos de
+puntuación ni espacios repetidos), las noticias usadas como contexto (id y un
+hash de su texto), el modelo y la versión del prompt. Así "¿Cuántos choques
+hubo en Jujuy?" y "cuantos choques hubo en jujuy" comparten respuesta mientras
+el contexto recuperado sea el mismo; si entran noticias nuevas al contexto, se
+corrige el texto de una noticia o cambia la plantilla del prompt, la clave
+cambia y se vuelve a consultar.
+
+Las entradas vencen a los LLM_CACHE_TTL_SECONDS y, si se supera
+LLM_CACHE_MAX_ENTRIES, se descartan las usadas hace más tiempo. La caché se
+guarda en LLM_CACHE_PATH para que sobreviva a los reinicios de la API: el
+archivo se reescribe cada LLM_CACHE_SAVE_EVERY respuestas nuevas o a los
+LLM_CACHE_SAVE_INTERVAL_SECONDS de la primera sin guardar, y al cerrar la API.
+"""
+import atexit
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Sequence, Tuple
+
+from app.search_index import plegar_acentos
+
+LLM_CACHE_TTL_SECONDS = float(os.getenv("LLM_CACHE_TTL_SECONDS", str(24 * 3600)))
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "1000"))
+# Vacío para no persistir la caché
+LLM_CACHE_PATH = os.getenv("LLM_CACHE_PATH", os.path.join("data", "llm_cache.json"))
+LLM_CACHE_SAVE_EVERY = int(os.getenv("LLM_CACHE_SAVE_EVERY", "20"))
+LLM_CACHE_SAVE_INTERVAL_SECONDS = float(os.getenv("LLM_CACHE_SAVE_INTERVAL_SECONDS", "60"))
+
+_NO_PALABRA_RE = re.compile(r"[^\w]+")
+
+def normalizar_pregunta(pregunta: str) -> str:
+    """'¿Cuántos CHOQUES hubo?' -> 'cuantos choques hubo'"""
+    return " ".join(_NO_PALABRA_RE.split(plegar_acentos(pregunta.lower()))).strip()
+
+def clave_respuesta(pregunta: str, noticias: Sequence[Tuple[int, str]], modelo: str,
+                    version_prompt: str) -> str:
+    """
+    Args:
+        pregunta: Pregunta del usuario
+        noticias: (id, texto) de cada noticia del contexto, en orden
+        modelo: Modelo de Ollama
+        version_prompt: Identifica la plantilla y el armado del contexto del prompt
+    """
+    contexto = [[id_noticia, hashlib.sha256(texto.encode("utf-8")).hexdigest()] for id_noticia, texto in noticias]
+    datos = json.dumps([normalizar_pregunta(pregunta), contexto, modelo, version_prompt])
+    return hashlib.sha256(datos.encode("utf-8")).hexdigest()
+
+class CacheRespuestas:
+    """LRU con vencimiento por TTL, segura entre hilos y persistida en un archivo JSON."""
+
+    def __init__(self, ttl: float = LLM_CACHE_TTL_SECONDS, max_entradas: int = LLM_CACHE_MAX_ENTRIES,
+                 ruta: Optional[str] = LLM_CACHE_PATH, guardar_cada: int = LLM_CACHE_SAVE_EVERY,
+                 intervalo_guardado: float = LLM_CACHE_SAVE_INTERVAL_SECONDS):
+        self.ttl = ttl
+        self.max_entradas = max_entradas
+        self.ruta = ruta or None
+        self.guardar_cada = guardar_cada
+        self.intervalo_guardado = intervalo_guardado
+        # clave -> (momento de creación, respuesta), de la menos a la más usada
+        self._entradas: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Serializa las escrituras del archivo, que se hacen fuera de _lock
+        self._lock_archivo = threading.Lock()
+        # Respuestas nuevas sin guardar y momento de la primera de ellas
+        self._sin_guardar = 0
+        self._pendiente_desde = None
+        self.aciertos = 0
+        self.fallos = 0
+        self.vencidas = 0
+        self.descartadas = 0
+        self._cargar()
+
+    @property
+    def habilitada(self) -> bool:
+        return self.ttl > 0 and self.max_entradas > 0
+
+    def _cargar(self):
+        if not self.habilitada or not self.ruta or not os.path.exists(self.ruta):
+            return
+        try:
+            with open(self.ruta, encoding="utf-8") as f:
+                guardadas = json.load(f)
+        except Exception as e:
+            logging.warning(f"No se pudo leer la caché de respuestas {self.ruta}: {e}")
+            return
+        ahora = time.time()
+        for clave, creada, respuesta in guardadas[-self.max_entradas:]:
+            if ahora - creada < self.ttl:
+                self._entradas[clave] = (creada, respuesta)
+        logging.info(f"Caché de respuestas del LLM: {len(self._entradas)} entradas cargadas de {self.ruta}")
+
+    def persistir(self, forzar: bool = True):
+        """
+        Escribe la caché completa en un archivo temporal y lo reemplaza de forma
+        atómica. Sin `forzar`, sólo si se acumularon `guardar_cada` respuestas
+        nuevas o pasó `intervalo_guardado` desde la primera sin guardar.
+        """
+        if not self.ruta:
+            return
+        with self._lock:
+            if not self._sin_guardar:
+                return
+            if not forzar and self._sin_guardar < self.guardar_cada \
+                    and time.time() - self._pendiente_desde < self.intervalo_guardado:
+                return
+            datos = [[clave, creada, respuesta] for clave, (creada, respuesta) in self._entradas.items()]
+            self._sin_guardar, self._pendiente_desde = 0, None
+        with self._lock_archivo:
+            self._escribir(datos)
+
+    def _escribir(self, datos):
+        try:
+            os.makedirs(os.path.dirname(self.ruta) or ".", exist_ok=True)
+            temporal = f"{self.ruta}.tmp"
+            with open(temporal, "w", encoding="utf-8") as f:
+                json.dump(datos, f, ensure_ascii=False)
+            os.replace(temporal, self.ruta)
+        except Exception as e:
+            logging.warning(f"No se pudo guardar la caché de respuestas en {self.ruta}: {e}")
+
+    def obtener(self, clave: str) -> Optional[str]:
+        if not self.habilitada:
+            return None
+        with self._lock:
+            entrada = self._entradas.get(clave)
+            if entrada is not None and time.time() - entrada[0] >= self.ttl:
+                del self._entradas[clave]
+                self.vencidas += 1
+                entrada = None
+            if entrada is None:
+                self.fallos += 1
+                return None
+            self._entradas.move_to_end(clave)
+            self.aciertos += 1
+            return entrada[1]
+
+    def guardar(self, clave: str, respuesta: str):
+        if not self.habilitada:
+            return
+        with self._lock:
+            self._entradas[clave] = (time.time(), respuesta)
+            self._entradas.move_to_end(clave)
+            while len(self._entradas) > self.max_entradas:
+                self._entradas.popitem(last=False)
+                self.descartadas += 1
+            self._marcar_sin_guardar()
+        self.persistir(forzar=False)
+
+    def limpiar(self):
+        with self._lock:
+            self._entradas.clear()
+            self._marcar_sin_guardar()
+        self.persistir()
+
+    def _marcar_sin_guardar(self):
+        self._sin_guardar += 1
+        if self._pendiente_desde is None:
+            self._pendiente_desde = time.time()
+
+    def estadisticas(self) -> Dict:
+        with self._lock:
+            consultas = self.aciertos + self.fallos
+            return {
+                "habilitada": self.habilitada,
+                "entradas": len(self._entradas),
+                "max_entradas": self.max_entradas,
+                "ttl_segundos": self.ttl,
+                "aciertos": self.aciertos,
+                "fallos": self.fallos,
+                "tasa_aciertos": round(self.aciertos / consultas, 3) if consultas else None,
+                "vencidas": self.vencidas,
+                "descartadas": self.descartadas,
+            }
+
+_cache: Optional[CacheRespuestas] = None
+_cache_lock = threading.Lock()
+
+def get_cache() -> CacheRespuestas:
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = CacheRespuestas()
+                # Las respuestas que todavía no se escribieron se guardan al salir
+                atexit.register(_cache.persistir)
+    return _cache
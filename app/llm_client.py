@@ -1,6 +1,29 @@
 import ollama
 import os
 import logging
+import asyncio
+import threading
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Iterator, Tuple
+
+# Consultas que se envían a Ollama al mismo tiempo; el resto espera su turno
+LLM_MAX_IN_FLIGHT = int(os.getenv("LLM_MAX_IN_FLIGHT", "2"))
+# Consultas que pueden esperar turno; si la cola está llena se rechazan enseguida
+LLM_MAX_QUEUE = int(os.getenv("LLM_MAX_QUEUE", "20"))
+# Tiempo máximo de espera en la cola antes de rechazar la consulta
+LLM_QUEUE_TIMEOUT_SECONDS = float(os.getenv("LLM_QUEUE_TIMEOUT_SECONDS", "120"))
+
+# Cada cuánto se verifica en segundo plano si Ollama responde
+OLLAMA_HEALTH_INTERVAL_SECONDS = float(os.getenv("OLLAMA_HEALTH_INTERVAL_SECONDS", "30"))
+# Timeout de cada verificación (las consultas al modelo usan uno mucho mayor)
+OLLAMA_HEALTH_TIMEOUT_SECONDS = float(os.getenv("OLLAMA_HEALTH_TIMEOUT_SECONDS", "5"))
+
+class LLMOcupado(Exception):
+    """Ollama tiene demasiadas consultas pendientes: la cola está llena o se agotó la espera."""
+
+class LLMError(Exception):
+    """La consulta en streaming a Ollama falló o terminó antes de completarse."""
 
 class LLMClient:
     _instance = None
@@ -21,46 +44,97 @@ class LLMClient:
         logging.basicConfig(level=logging.INFO)
         logging.info(f"Iniciando LLMClient con base_url: {self.base_url}")
 
+        # Crear los clientes no abre conexiones: la disponibilidad la verifica
+        # un hilo en segundo plano, así importar el módulo no bloquea
         try:
             self.client = ollama.Client(host=self.base_url, timeout=300)
-            self._is_available = self._check_availability()
-            if self._is_available:
-                logging.info(f"Conexión con Ollama en {self.base_url} exitosa.")
-            else:
-                logging.warning(f"No se pudo conectar con Ollama en {self.base_url}.")
+            self.async_client = ollama.AsyncClient(host=self.base_url, timeout=300)
+            self._client_sondeo = ollama.Client(host=self.base_url, timeout=OLLAMA_HEALTH_TIMEOUT_SECONDS)
         except Exception as e:
             logging.error(f"Error al inicializar el cliente de Ollama: {e}", exc_info=True)
             self.client = None
-            self._is_available = False
+            self.async_client = None
+            self._client_sondeo = None
+        
+        # Estado que mantiene el sondeo
+        self._is_available = False
+        self._modelos = []
+        self._version = 'unknown'
+        self.ultima_verificacion = None
+        self._primer_sondeo = threading.Event()
+        self._despertar = threading.Event()
+        self._hilo_sondeo = None
+        self._lock_sondeo = threading.Lock()
+        
+        # Control de concurrencia de las consultas asíncronas
+        self._semaforo = asyncio.Semaphore(LLM_MAX_IN_FLIGHT)
+        self._pendientes: Dict[Tuple[str, str], asyncio.Future] = {}
+        self._esperando = 0
+        self._en_curso = 0
+        self.coalescidas = 0
+        self.rechazadas = 0
+        self.vencidas_en_cola = 0
 
     def _check_availability(self):
-        if not self.client:
-            return False
-        try:
-            self.client.list()
-            return True
-        except Exception:
-            return False
+        """Consulta a Ollama (con timeout corto) y actualiza disponibilidad, modelos y versión."""
+        disponible = False
+        if self._client_sondeo:
+            try:
+                models_info = self._client_sondeo.list()
+                self._modelos = [model['name'] for model in models_info.get('models', [])]
+                disponible = True
+                try:
+                    self._version = self._client_sondeo.version().get('version', 'unknown')
+                except Exception:
+                    self._version = 'unknown'
+            except Exception:
+                self._modelos = []
+        
+        if disponible != self._is_available or self.ultima_verificacion is None:
+            if disponible:
+                logging.info(f"Conexión con Ollama en {self.base_url} exitosa.")
+            else:
+                logging.warning(f"No se pudo conectar con Ollama en {self.base_url}.")
+        self._is_available = disponible
+        self.ultima_verificacion = time.time()
+        self._primer_sondeo.set()
+        return disponible
+
+    def _sondear(self):
+        while True:
+            self._check_availability()
+            # Se despierta antes de tiempo si una consulta falló
+            self._despertar.wait(OLLAMA_HEALTH_INTERVAL_SECONDS)
+            self._despertar.clear()
+
+    def iniciar_sondeo(self):
+        """Arranca la verificación periódica en segundo plano (solo la primera vez)."""
+        with self._lock_sondeo:
+            if self._hilo_sondeo is None:
+                self._hilo_sondeo = threading.Thread(target=self._sondear, name="sondeo-ollama", daemon=True)
+                self._hilo_sondeo.start()
+
+    def solicitar_sondeo(self):
+        """Pide una verificación inmediata, por ejemplo después de un error de conexión."""
+        self._despertar.set()
 
     def is_available(self):
+        # Conexión perezosa: si nadie arrancó el sondeo (p. ej. en scripts), se arranca y
+        # se espera la primera verificación. La API lo arranca al iniciar y no espera.
+        if self._hilo_sondeo is None:
+            self.iniciar_sondeo()
+            self._primer_sondeo.wait(OLLAMA_HEALTH_TIMEOUT_SECONDS * 2)
         return self._is_available
 
     def get_version(self):
         if not self.is_available():
             return None
-        try:
-            return self.client.version().get('version', 'unknown')
-        except Exception:
-            return 'unknown'
+        return self._version
 
     def get_available_models(self):
         if not self.is_available():
             return []
-        try:
-            models_info = self.client.list()
-            return [model['name'] for model in models_info.get('models', [])]
-        except Exception:
-            return []
+        return list(self._modelos)
 
     def query(self, prompt: str, model: str = None) -> str:
         if not self.is_available():
@@ -79,7 +153,142 @@ class LLMClient:
             return response['message']['content']
         except Exception as e:
             logging.error(f"Error durante la consulta al LLM: {e}", exc_info=True)
+            self.solicitar_sondeo()
             return f"Error al procesar la solicitud con el modelo {target_model}: {e}"
 
+    def query_stream(self, prompt: str, model: str = None) -> Iterator[str]:
+        """Como query, pero devuelve los fragmentos de la respuesta a medida que el modelo los genera."""
+        if not self.is_available():
+            yield "Error: El cliente LLM no está disponible o no se pudo conectar con Ollama."
+            return
+        
+        target_model = model or self.model
+        
+        try:
+            logging.info(f"Enviando consulta en streaming al modelo {target_model}...")
+            stream = self.client.chat(
+                model=target_model,
+                messages=[{'role': 'user', 'content': prompt}],
+                options={'temperature': 0.1},
+                stream=True
+            )
+            for chunk in stream:
+                contenido = chunk['message']['content']
+                if contenido:
+                    yield contenido
+            logging.info("Respuesta recibida del LLM.")
+        except Exception as e:
+            logging.error(f"Error durante la consulta al LLM: {e}", exc_info=True)
+            self.solicitar_sondeo()
+            yield f"Error al procesar la solicitud con el modelo {target_model}: {e}"
+
+    @asynccontextmanager
+    async def _turno(self):
+        """Espera un lugar entre las consultas en curso, o lanza LLMOcupado."""
+        if self._semaforo.locked() and self._esperando >= LLM_MAX_QUEUE:
+            self.rechazadas += 1
+            raise LLMOcupado(f"Hay {self._esperando} consultas esperando a Ollama. Intenta de nuevo en unos minutos.")
+        self._esperando += 1
+        try:
+            async with asyncio.timeout(LLM_QUEUE_TIMEOUT_SECONDS):
+                await self._semaforo.acquire()
+        except TimeoutError:
+            self.vencidas_en_cola += 1
+            raise LLMOcupado(f"Ollama no atendió la consulta en {LLM_QUEUE_TIMEOUT_SECONDS:.0f} segundos. Intenta de nuevo en unos minutos.")
+        finally:
+            self._esperando -= 1
+        self._en_curso += 1
+        try:
+            yield
+        finally:
+            self._en_curso -= 1
+            self._semaforo.release()
+
+    async def aquery(self, prompt: str, model: str = None) -> str:
+        """
+        Versión asíncrona de query con concurrencia limitada. Si ya hay una
+        consulta idéntica (mismo modelo y prompt) en curso, se espera su
+        resultado en lugar de enviarla otra vez a Ollama.
+        """
+        if not self.is_available():
+            return "Error: El cliente LLM no está disponible o no se pudo conectar con Ollama."
+        
+        target_model = model or self.model
+        clave = (target_model, prompt)
+        pendiente = self._pendientes.get(clave)
+        if pendiente is not None:
+            self.coalescidas += 1
+            logging.info("Consulta idéntica en curso, se espera su respuesta.")
+        else:
+            pendiente = asyncio.ensure_future(self._aquery_con_turno(prompt, target_model))
+            self._pendientes[clave] = pendiente
+            pendiente.add_done_callback(lambda _: self._pendientes.pop(clave, None))
+        # shield: si un cliente se desconecta no se cancela la consulta que comparten los demás
+        return await asyncio.shield(pendiente)
+
+    async def _aquery_con_turno(self, prompt: str, target_model: str) -> str:
+        async with self._turno():
+            try:
+                logging.info(f"Enviando consulta al modelo {target_model}...")
+                response = await self.async_client.chat(
+                    model=target_model,
+                    messages=[{'role': 'user', 'content': prompt}],
+                    options={'temperature': 0.1}
+                )
+                logging.info(f"Respuesta recibida del LLM ({response.get('prompt_eval_count')} tokens de prompt).")
+                return response['message']['content']
+            except Exception as e:
+                logging.error(f"Error durante la consulta al LLM: {e}", exc_info=True)
+                self.solicitar_sondeo()
+                return f"Error al procesar la solicitud con el modelo {target_model}: {e}"
+
+    async def aquery_stream(self, prompt: str, model: str = None) -> AsyncIterator[str]:
+        """
+        Versión asíncrona de query_stream; ocupa un lugar de concurrencia mientras
+        dura. Si Ollama falla, incluso después de enviar parte de la respuesta, o el
+        stream termina sin el fragmento `done`, lanza LLMError en lugar de devolver
+        el error como texto: quien llama no debe tomar la respuesta como completa.
+        """
+        if not self.is_available():
+            raise LLMError("El cliente LLM no está disponible o no se pudo conectar con Ollama.")
+        
+        target_model = model or self.model
+        
+        async with self._turno():
+            try:
+                logging.info(f"Enviando consulta en streaming al modelo {target_model}...")
+                stream = await self.async_client.chat(
+                    model=target_model,
+                    messages=[{'role': 'user', 'content': prompt}],
+                    options={'temperature': 0.1},
+                    stream=True
+                )
+                completa = False
+                async for chunk in stream:
+                    contenido = chunk['message']['content']
+                    if contenido:
+                        yield contenido
+                    if chunk.get('done'):
+                        completa = True
+                        logging.info(f"Respuesta recibida del LLM ({chunk.get('prompt_eval_count')} tokens de prompt).")
+            except Exception as e:
+                logging.error(f"Error durante la consulta al LLM: {e}", exc_info=True)
+                self.solicitar_sondeo()
+                raise LLMError(f"Error al procesar la solicitud con el modelo {target_model}: {e}") from e
+            if not completa:
+                raise LLMError(f"La respuesta del modelo {target_model} terminó antes de completarse.")
+
+    def estado_cola(self) -> Dict:
+        """Consultas en curso y en espera, y contadores de coalescencia y rechazos."""
+        return {
+            "max_en_curso": LLM_MAX_IN_FLIGHT,
+            "max_en_espera": LLM_MAX_QUEUE,
+            "en_curso": self._en_curso,
+            "en_espera": self._esperando,
+            "coalescidas": self.coalescidas,
+            "rechazadas": self.rechazadas,
+            "vencidas_en_cola": self.vencidas_en_cola,
+        }
+
 # Instancia Singleton
 llm_client = LLMClient()
\ No newline at end of file
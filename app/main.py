@@ -5,9 +5,13 @@ from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy.orm import Session
 from app.db import SessionLocal, Noticia, get_db
 from app.query_service import QueryService, Consulta
-from app.llm_client import llm_client
+from app.llm_client import llm_client, LLMOcupado
+from app.llm_cache import get_cache
+from app.nlp import warm_up as warm_up_nlp
+from app.search_index import get_indice, warm_up as warm_up_indice
 from typing import Optional, List, Dict, Any
 import datetime
+import json
 import logging
 import asyncio
 from fastapi.responses import HTMLResponse, StreamingResponse
@@ -33,6 +37,14 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.on_event("startup")
+def cargar_modelos_nlp():
+    """Carga los modelos de NLP una sola vez al iniciar, fuera del camino de cada request"""
+    warm_up_nlp()
+    warm_up_indice()
+    # Verificación periódica de Ollama en segundo plano (no bloquea el arranque)
+    llm_client.iniciar_sondeo()
+
 def get_db():
     """Dependency para obtener la sesión de la base de datos"""
     db = SessionLocal()
@@ -58,17 +70,72 @@ def get_stats(db: Session = Depends(get_db)):
     query_service = QueryService(db)
     return query_service.get_statistics()
 
+@app.get("/estadisticas/serie")
+def serie_estadisticas(
+    desde: Optional[datetime.date] = Query(None, description="Fecha inicial (YYYY-MM-DD)"),
+    hasta: Optional[datetime.date] = Query(None, description="Fecha final (YYYY-MM-DD)"),
+    media: Optional[str] = Query(None, description="Filtrar por nombre de medio"),
+    db: Session = Depends(get_db)
+):
+    """
+    Serie diaria de noticias por clasificación (lee solo el resumen stats_daily)
+    """
+    try:
+        query_service = QueryService(db)
+        return {
+            "desde": desde,
+            "hasta": hasta,
+            "media": media,
+            "serie": query_service.get_daily_series(desde, hasta, media)
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error obteniendo la serie de estadísticas: {str(e)}")
+
 @app.post("/consultar")
-def consultar(
+async def consultar(
     consulta: Consulta, db: Session = Depends(get_db)
 ):
     try:
         query_service = QueryService(db)
         # Devolvemos directamente el objeto que genera el servicio
-        return query_service.query_with_llm(consulta.pregunta)
+        return await query_service.query_with_llm(consulta.pregunta)
+    except LLMOcupado as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except Exception as e:
+        logging.exception("Error en la consulta")
+        raise HTTPException(status_code=500, detail=f"Error en la consulta: {str(e)}")
+
+@app.post("/consultar/stream")
+async def consultar_stream(
+    consulta: Consulta, db: Session = Depends(get_db)
+):
+    """
+    Igual que /consultar pero en streaming (NDJSON, un evento JSON por línea):
+    primero las noticias relevantes y después la respuesta a medida que se genera
+    """
+    try:
+        query_service = QueryService(db)
+        eventos = await query_service.query_with_llm_stream(consulta.pregunta)
     except Exception as e:
         logging.exception("Error en la consulta")
         raise HTTPException(status_code=500, detail=f"Error en la consulta: {str(e)}")
+    
+    async def lineas():
+        try:
+            async for evento in eventos:
+                yield json.dumps(evento, ensure_ascii=False, default=str) + "\n"
+        except LLMOcupado as e:
+            yield json.dumps({"tipo": "error", "detalle": str(e)}, ensure_ascii=False) + "\n"
+        except Exception as e:
+            logging.exception("Error en la consulta")
+            yield json.dumps({"tipo": "error", "detalle": f"Error en la consulta: {str(e)}"}, ensure_ascii=False) + "\n"
+    
+    return StreamingResponse(
+        lineas(),
+        media_type="application/x-ndjson",
+        # Evitar que un proxy acumule la respuesta antes de enviarla
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 @app.get("/buscar")
 def buscar_noticias(
@@ -90,6 +157,16 @@ def buscar_noticias(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error en la búsqueda: {str(e)}")
 
+@app.get("/buscar/indice")
+def estado_indice_busqueda():
+    """
+    Estado del índice BM25 en memoria (SEARCH_BACKEND=bm25)
+    """
+    indice = get_indice()
+    if indice is None:
+        return {"habilitado": False}
+    return {"habilitado": True, **indice.estadisticas()}
+
 @app.get("/estadisticas")
 def obtener_estadisticas(db: SessionLocal = Depends(get_db)):
     """
@@ -120,14 +197,18 @@ def ollama_status():
             "version": version,
             "modelos_disponibles": models,
             "modelo_por_defecto": llm_client.model,
-            "url": llm_client.base_url
+            "url": llm_client.base_url,
+            "ultima_verificacion": llm_client.ultima_verificacion,
+            "cache_respuestas": get_cache().estadisticas(),
+            "cola": llm_client.estado_cola()
         }
     except Exception as e:
         return {
             "ollama_disponible": False,
             "version": "unknown",
             "error": str(e),
-            "url": llm_client.base_url
+            "url": llm_client.base_url,
+            "cache_respuestas": get_cache().estadisticas()
         }
 
 @app.get("/noticias/{noticia_id}")
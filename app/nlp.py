@@ -0,0 +1,76 @@
+"""
+Registro de modelos de NLP compartido por todo el proceso.
+
+Los modelos se cargan de forma perezosa la primera vez que se piden y luego se
+reutilizan, de modo que la API, los clasificadores y los scripts pagan el costo
+de carga una sola vez por proceso.
+"""
+import os
+import threading
+
+SPACY_MODEL = os.getenv("SPACY_MODEL", "es_core_news_sm")
+
+# Componentes del pipeline que no hacen falta para obtener lemas y stopwords
+COMPONENTES_NO_USADOS_LEMAS = ("parser", "ner")
+
+_lock = threading.Lock()
+# El pipeline de spaCy no es seguro para usar desde varios hilos a la vez (scrapers en paralelo)
+_lock_pipeline = threading.Lock()
+_nlp = None
+_stopwords = None
+
+def get_nlp():
+    """Devuelve el modelo de spaCy para español, cargándolo si todavía no existe."""
+    global _nlp
+    if _nlp is None:
+        with _lock:
+            if _nlp is None:
+                import spacy
+                print("🔄 Cargando modelo de spaCy para español...")
+                _nlp = spacy.load(SPACY_MODEL)
+                print("✅ Modelo de spaCy cargado exitosamente")
+    return _nlp
+
+def get_stopwords():
+    """Devuelve el conjunto de stopwords en español de NLTK."""
+    global _stopwords
+    if _stopwords is None:
+        with _lock:
+            if _stopwords is None:
+                from nltk.corpus import stopwords
+                print("🔄 Cargando stopwords de NLTK...")
+                _stopwords = frozenset(stopwords.words("spanish"))
+                print("✅ Stopwords de NLTK cargadas exitosamente")
+    return _stopwords
+
+def _componentes_a_desactivar(nlp):
+    return [nombre for nombre in COMPONENTES_NO_USADOS_LEMAS if nombre in nlp.pipe_names]
+
+def lemas(texto: str):
+    """Lemas de las palabras que no son stopwords, sin ejecutar parser ni NER."""
+    nlp = get_nlp()
+    with _lock_pipeline:
+        doc = nlp(texto, disable=_componentes_a_desactivar(nlp))
+    return [token.lemma_ for token in doc if not token.is_stop]
+
+def lemas_en_lote(textos, batch_size: int = 64, n_process: int = 1):
+    """
+    Versión por lotes de `lemas` usando `nlp.pipe`. Devuelve una lista de lemas
+    por cada texto, en el mismo orden. Con `n_process` > 1 spaCy reparte los
+    lotes entre varios procesos.
+    """
+    nlp = get_nlp()
+    with _lock_pipeline:
+        docs = nlp.pipe(textos, batch_size=batch_size, n_process=n_process, disable=_componentes_a_desactivar(nlp))
+        return [[token.lemma_ for token in doc if not token.is_stop] for doc in docs]
+
+def vectores_en_lote(textos, batch_size: int = 64):
+    """Vector de spaCy (`doc.vector`) de cada texto, en el mismo orden."""
+    nlp = get_nlp()
+    with _lock_pipeline:
+        return [doc.vector for doc in nlp.pipe(textos, batch_size=batch_size)]
+
+def warm_up():
+    """Carga todos los modelos por adelantado (se usa al iniciar la aplicación)."""
+    get_stopwords()
+    get_nlp()
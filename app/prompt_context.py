@@ -0,0 +1,135 @@
+"""
+Armado del contexto de noticias para el prompt del LLM con un presupuesto de tokens.
+
+En lugar de pasar los primeros caracteres de cada noticia, se parten los
+contenidos completos en oraciones, se puntúa cada oración por los términos de la
+pregunta que contiene (con el mismo tokenizador sin acentos y con stemming que
+usa la búsqueda BM25) y se eligen las mejores hasta llenar el presupuesto del
+modelo. Las oraciones elegidas se muestran en su orden original dentro de cada
+noticia.
+
+El presupuesto se configura con LLM_CONTEXT_TOKENS: un número para todos los
+modelos, o valores por modelo, ej. "1024,llama3=3000" (el número sin nombre es
+el valor por defecto). Los tokens se estiman por largo de texto; Ollama informa
+el conteo exacto (`prompt_eval_count`) que se registra en el log.
+"""
+import math
+import os
+import re
+from typing import Dict, List, Optional, Tuple
+
+from app.search_index import tokenizar
+
+# Ollama usa por defecto una ventana de 2048 tokens: se deja lugar para la respuesta
+PRESUPUESTO_POR_DEFECTO = 1024
+# Caracteres por token aproximados para texto en español
+CARACTERES_POR_TOKEN = 3.5
+# Ventaja de la primera oración (el copete suele resumir el hecho)
+BONO_PRIMERA_ORACION = 0.5
+# Penalización por posición de la noticia en el ranking de búsqueda
+PENALIZACION_RANKING = 0.1
+
+_ORACION_RE = re.compile(r"(?<=[.!?…])\s+|\n+")
+
+def _leer_presupuestos(valor: str) -> Dict[Optional[str], int]:
+    presupuestos: Dict[Optional[str], int] = {None: PRESUPUESTO_POR_DEFECTO}
+    for parte in filter(None, (p.strip() for p in valor.split(","))):
+        modelo, _, tokens = parte.rpartition("=")
+        presupuestos[modelo or None] = int(tokens)
+    return presupuestos
+
+PRESUPUESTOS = _leer_presupuestos(os.getenv("LLM_CONTEXT_TOKENS", ""))
+
+def presupuesto_modelo(modelo: str) -> int:
+    """Tokens de contexto para el modelo; 'mistral:7b' usa el valor de 'mistral' si no tiene uno propio."""
+    if modelo in PRESUPUESTOS:
+        return PRESUPUESTOS[modelo]
+    return PRESUPUESTOS.get(modelo.split(":")[0], PRESUPUESTOS[None])
+
+def estimar_tokens(texto: str) -> int:
+    return math.ceil(len(texto) / CARACTERES_POR_TOKEN)
+
+def dividir_oraciones(texto: str) -> List[str]:
+    return [oracion.strip() for oracion in _ORACION_RE.split(texto or "") if oracion.strip()]
+
+def _recortar(oracion: str, tokens: int) -> str:
+    """Primeras palabras de la oración que entran en `tokens`, terminadas en '…'."""
+    limite = int(tokens * CARACTERES_POR_TOKEN) - 1
+    if limite <= 0:
+        return ""
+    recorte = oracion[:limite].rsplit(" ", 1)[0] if " " in oracion[:limite] else oracion[:limite]
+    return recorte.rstrip(" ,;:") + "…"
+
+def _encabezado(numero: int, noticia: Dict) -> str:
+    return f"[{numero}] {noticia['titulo']} ({noticia['fecha'][:10]}, {noticia.get('medio') or 'medio desconocido'})"
+
+def empaquetar_contexto(pregunta: str, noticias: List[Dict], contenidos: Dict[int, str],
+                        presupuesto: int) -> Tuple[str, Dict]:
+    """
+    Arma el bloque de noticias del prompt sin pasar de `presupuesto` tokens.
+
+    Args:
+        pregunta: Pregunta del usuario
+        noticias: Noticias recuperadas, de la más a la menos relevante (con el nombre del medio en "medio")
+        contenidos: Contenido completo de cada noticia por id
+        presupuesto: Tokens disponibles para el bloque de noticias
+
+    Returns:
+        El texto del contexto y un resumen con noticias y oraciones incluidas y tokens estimados.
+    """
+    terminos = set(tokenizar(pregunta))
+
+    # Los encabezados van primero, en orden de relevancia, mientras entren
+    usados = 0
+    incluidas = []
+    for posicion, noticia in enumerate(noticias):
+        tokens = estimar_tokens(_encabezado(posicion + 1, noticia))
+        if usados + tokens > presupuesto:
+            break
+        usados += tokens
+        incluidas.append(noticia)
+
+    candidatas = []
+    for rango, noticia in enumerate(incluidas):
+        texto = contenidos.get(noticia["id"]) or noticia["contenido"]
+        for posicion, oracion in enumerate(dividir_oraciones(texto)):
+            coincidencias = len(terminos.intersection(tokenizar(oracion)))
+            puntaje = (coincidencias
+                       + (BONO_PRIMERA_ORACION if posicion == 0 else 0)
+                       - PENALIZACION_RANKING * rango)
+            candidatas.append((puntaje, rango, posicion, oracion))
+
+    elegidas: Dict[int, List[Tuple[int, str]]] = {rango: [] for rango in range(len(incluidas))}
+    total_oraciones = 0
+    for puntaje, rango, posicion, oracion in sorted(candidatas, key=lambda c: (-c[0], c[1], c[2])):
+        disponibles = presupuesto - usados - 1
+        if disponibles <= 0:
+            break
+        if estimar_tokens(oracion) > disponibles:
+            # La oración no entra completa: se recorta al presupuesto que queda
+            oracion = _recortar(oracion, disponibles)
+            if not oracion:
+                continue
+        usados += estimar_tokens(oracion) + 1
+        elegidas[rango].append((posicion, oracion))
+        total_oraciones += 1
+
+    bloques = []
+    for rango, noticia in enumerate(incluidas):
+        partes = []
+        anterior = -1
+        for posicion, oracion in sorted(elegidas[rango]):
+            if posicion != anterior + 1:
+                partes.append("…")
+            partes.append(oracion)
+            anterior = posicion
+        bloques.append("\n".join([_encabezado(rango + 1, noticia)] + ([" ".join(partes)] if partes else [])))
+
+    resumen = {
+        "noticias": len(incluidas),
+        "oraciones": total_oraciones,
+        "oraciones_disponibles": len(candidatas),
+        "tokens_contexto": usados,
+        "presupuesto": presupuesto,
+    }
+    return "\n\n".join(bloques), resumen
@@ -1,103 +1,255 @@
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, AsyncIterator
 from sqlalchemy.orm import Session
-from sqlalchemy import text, or_, and_, func
-from app.db import Noticia, Media
-from app.llm_client import llm_client
+from sqlalchemy import text, or_, and_, func, case, select
+from sqlalchemy.dialects.mysql import match
+from starlette.concurrency import run_in_threadpool
+from app.db import Noticia, Media, EstadisticaDiaria, FULLTEXT_INDEX
+from app import daily_stats
+from app.llm_client import llm_client, LLMError
 import re
 import logging
 from pydantic import BaseModel
-import spacy
+from app.nlp import get_nlp
+from app.search_index import get_indice
+from app import semantic_search
+from app.llm_cache import get_cache, clave_respuesta
+from app.prompt_context import empaquetar_contexto, presupuesto_modelo, estimar_tokens
+import textwrap
 
 class Consulta(BaseModel):
     pregunta: str
 
+# Subir al cambiar la plantilla de _build_llm_prompt o el armado del contexto
+# (app/prompt_context.py): las respuestas guardadas en caché dejan de usarse
+VERSION_PROMPT = 3
+
+# Las plantillas se quitan la sangría una sola vez y se completan con format: el
+# texto del usuario nunca pasa por dedent ni se interpreta como parte de la plantilla
+PLANTILLA_PROMPT = textwrap.dedent("""\
+    Eres un asistente especializado en noticias sobre accidentes de tránsito en Argentina. Responde en español, de forma clara y concisa, usando solo las noticias de abajo; si no alcanzan para responder, indícalo. Incluye cifras cuando las haya.
+
+    Noticias:
+    {contexto}
+
+    Pregunta: {pregunta}
+    Respuesta:""")
+
+PLANTILLA_SIN_NOTICIAS = textwrap.dedent("""\
+    Pregunta: {pregunta}
+
+    No se encontraron noticias relevantes en la base de datos. Responde indicando que no hay información disponible sobre este tema en la base de datos actual.""")
+
+# Se averigua una vez por proceso si la base tiene el índice FULLTEXT
+_fulltext_disponible = None
+
+def fulltext_disponible(db: Session) -> bool:
+    """True si la base es MariaDB/MySQL y existe el índice FULLTEXT de noticias"""
+    global _fulltext_disponible
+    if _fulltext_disponible is None:
+        bind = db.get_bind()
+        if bind.dialect.name not in ("mysql", "mariadb"):
+            _fulltext_disponible = False
+        else:
+            _fulltext_disponible = db.execute(text("""
+                SELECT 1 FROM INFORMATION_SCHEMA.STATISTICS
+                WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'noticias' AND INDEX_NAME = :indice
+                LIMIT 1
+            """), {"indice": FULLTEXT_INDEX}).scalar() == 1
+            if not _fulltext_disponible:
+                logging.warning("No existe el índice FULLTEXT de noticias; la búsqueda usa LIKE "
+                                "(ver scripts/migrate_add_fulltext_index.py)")
+    return _fulltext_disponible
+
 class QueryService:
     def __init__(self, db: Session):
         self.db = db
-        self.nlp = spacy.load("es_core_news_sm")
         self.llm_client = llm_client
+
+    @property
+    def nlp(self):
+        # El modelo se comparte entre todas las instancias del proceso
+        return get_nlp()
     
     def search_news(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
         """
-        Busca noticias en la base de datos basándose en una consulta
+        Busca noticias en la base de datos basándose en una consulta.
+        Con SEARCH_BACKEND=bm25 se usa el índice invertido en memoria. Si no, con
+        el índice FULLTEXT (MariaDB) los resultados se ordenan por relevancia con
+        MATCH ... AGAINST; si no está disponible (p. ej. SQLite) se usa LIKE
+        sobre título y contenido ordenando por fecha.
         """
+        indice = get_indice()
+        if indice is not None and indice.listo:
+            return self._search_news_bm25(indice, query, limit)
+        
         # Limpiar y preparar la consulta
         search_terms = self._extract_search_terms(query)
         
         # Construir la consulta SQL
         db_query = self.db.query(Noticia)
         
-        if search_terms:
-            # Buscar en título y contenido
-            conditions = []
-            for term in search_terms:
-                conditions.append(
-                    or_(
-                        Noticia.titulo.ilike(f"%{term}%"),
-                        Noticia.contenido.ilike(f"%{term}%")
+        if search_terms and fulltext_disponible(self.db):
+            # Los términos se combinan con OR (modo lenguaje natural) y se ordena por relevancia
+            relevancia = match(
+                Noticia.titulo, Noticia.contenido, against=" ".join(search_terms)
+            ).in_natural_language_mode()
+            db_query = db_query.filter(relevancia > 0).order_by(relevancia.desc(), Noticia.fecha.desc())
+        else:
+            if search_terms:
+                # Buscar en título y contenido
+                conditions = []
+                for term in search_terms:
+                    conditions.append(
+                        or_(
+                            Noticia.titulo.ilike(f"%{term}%"),
+                            Noticia.contenido.ilike(f"%{term}%")
+                        )
                     )
-                )
+                
+                if conditions:
+                    db_query = db_query.filter(or_(*conditions))
             
-            if conditions:
-                db_query = db_query.filter(or_(*conditions))
+            # Ordenar por fecha descendente
+            db_query = db_query.order_by(Noticia.fecha.desc())
         
         # Filtrar por accidentes de tránsito si la consulta lo sugiere
         if self._is_traffic_accident_query(query):
             db_query = db_query.filter(Noticia.es_accidente_transito == True)
         
-        # Ordenar por fecha descendente
-        db_query = db_query.order_by(Noticia.fecha.desc())
-        
         # Limitar resultados
         news = db_query.limit(limit).all()
         
         # Convertir a diccionarios
-        return [
-            {
-                "id": noticia.id,
-                "titulo": noticia.titulo,
-                "contenido": noticia.contenido[:200] + "..." if len(noticia.contenido) > 200 else noticia.contenido,
-                "fecha": noticia.fecha.isoformat(),
-                "url": noticia.url,
-                "media_id": noticia.media_id,
-                "es_accidente_transito": noticia.es_accidente_transito
-            }
-            for noticia in news
-        ]
+        return [self._noticia_a_dict(noticia) for noticia in news]
     
-    def get_statistics(self):
-        # Estadísticas generales
-        total_noticias = self.db.query(Noticia).count()
-        cantidad_accidentes = self.db.query(Noticia).filter_by(es_accidente_transito=True).count()
-        cantidad_no_accidentes = self.db.query(Noticia).filter_by(es_accidente_transito=False).count()
-        cantidad_sin_clasificar = self.db.query(Noticia).filter(Noticia.es_accidente_transito.is_(None)).count()
-
-        estadisticas_generales = {
-            "total_noticias": total_noticias,
-            "cantidad_accidentes": cantidad_accidentes,
-            "cantidad_no_accidentes": cantidad_no_accidentes,
-            "cantidad_sin_clasificar": cantidad_sin_clasificar,
-        }
-
-        # Estadísticas por medio
-        resultados_por_medio = self.db.query(
-            Media.name,
-            func.count(Noticia.id).label('total_noticias')
-        ).join(Noticia, Media.id == Noticia.media_id).group_by(Media.name).all()
-
-        estadisticas_por_medio = {
-            name: {"total_noticias": total}
-            for name, total in resultados_por_medio
+    def _buscar_contexto(self, query: str, limit: int) -> List[Dict[str, Any]]:
+        """
+        Noticias para el contexto del LLM. Con RETRIEVAL_BACKEND=semantic se
+        eligen por similitud de embeddings; con hybrid se combina esa similitud
+        con el ranking por palabras clave. Si no hay embeddings o falla el
+        modelo, se usa search_news.
+        """
+        if semantic_search.RETRIEVAL_BACKEND not in ("semantic", "hybrid"):
+            return self.search_news(query, limit=limit)
+        
+        try:
+            palabras_clave = []
+            if semantic_search.RETRIEVAL_BACKEND == "hybrid":
+                palabras_clave = [n["id"] for n in self.search_news(query, limit=limit * 10)]
+            ranking = semantic_search.buscar_semantico(query, limite=limit, palabras_clave=palabras_clave)
+        except Exception as e:
+            logging.warning(f"Falló la búsqueda semántica ({e}), se usa búsqueda por palabras clave")
+            ranking = []
+        if not ranking:
+            return self.search_news(query, limit=limit)
+        
+        puntajes = dict(ranking)
+        news = self.db.query(Noticia).filter(Noticia.id.in_(list(puntajes))).all()
+        news.sort(key=lambda noticia: puntajes[noticia.id], reverse=True)
+        return [self._noticia_a_dict(noticia) for noticia in news]
+    
+    def _search_news_bm25(self, indice, query: str, limit: int) -> List[Dict[str, Any]]:
+        """Búsqueda rankeada con el índice BM25; la base solo se consulta por id"""
+        filtrar_accidentes = self._is_traffic_accident_query(query)
+        # Si después se filtra por accidentes se piden más candidatos al índice
+        candidatos = indice.buscar(query, limite=limit * 10 if filtrar_accidentes else limit)
+        if not candidatos:
+            return []
+        
+        puntajes = dict(candidatos)
+        db_query = self.db.query(Noticia).filter(Noticia.id.in_(list(puntajes)))
+        if filtrar_accidentes:
+            db_query = db_query.filter(Noticia.es_accidente_transito == True)
+        news = sorted(db_query.all(), key=lambda noticia: puntajes[noticia.id], reverse=True)[:limit]
+        return [self._noticia_a_dict(noticia) for noticia in news]
+    
+    def _noticia_a_dict(self, noticia: Noticia) -> Dict[str, Any]:
+        return {
+            "id": noticia.id,
+            "titulo": noticia.titulo,
+            "contenido": noticia.contenido[:200] + "..." if len(noticia.contenido) > 200 else noticia.contenido,
+            "fecha": noticia.fecha.isoformat(),
+            "url": noticia.url,
+            "media_id": noticia.media_id,
+            "es_accidente_transito": noticia.es_accidente_transito
         }
+    
+    def get_statistics(self):
+        """
+        Totales generales y por medio en una sola pasada: los conteos por
+        clasificación se agregan con SUM(CASE ...) agrupando por medio, lo que
+        se resuelve leyendo solo el índice (media_id, es_accidente_transito)
+        """
+        def contar(condicion):
+            return func.coalesce(func.sum(case((condicion, 1), else_=0)), 0)
+        
+        por_medio = (
+            select(
+                Noticia.media_id.label("media_id"),
+                func.count().label("total_noticias"),
+                contar(Noticia.es_accidente_transito == True).label("cantidad_accidentes"),
+                contar(Noticia.es_accidente_transito == False).label("cantidad_no_accidentes"),
+                contar(Noticia.es_accidente_transito.is_(None)).label("cantidad_sin_clasificar"),
+            )
+            .group_by(Noticia.media_id)
+            .subquery()
+        )
+        filas = self.db.execute(
+            select(Media.name, por_medio).outerjoin(Media, Media.id == por_medio.c.media_id)
+        ).all()
+        
+        campos = ("total_noticias", "cantidad_accidentes", "cantidad_no_accidentes", "cantidad_sin_clasificar")
+        estadisticas_generales = {campo: 0 for campo in campos}
+        estadisticas_por_medio = {}
+        for fila in filas:
+            conteos = {campo: int(getattr(fila, campo)) for campo in campos}
+            for campo in campos:
+                estadisticas_generales[campo] += conteos[campo]
+            # Las noticias sin medio cuentan en los totales pero no en el detalle por medio
+            if fila.name is not None:
+                estadisticas_por_medio[fila.name] = conteos
         
         return {
             "estadisticas_generales": estadisticas_generales,
             "estadisticas_por_medio": estadisticas_por_medio
         }
     
-    def query_with_llm(self, user_query: str) -> str:
+    def get_daily_series(self, desde=None, hasta=None, media: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Serie diaria de noticias por clasificación, leída del resumen stats_daily
+        (O(días x medios) filas, sin recorrer noticias). Con `media` se filtra por
+        nombre de medio. Si la tabla todavía no se creó, la serie queda vacía.
+        """
+        if not daily_stats.tabla_disponible():
+            logging.warning("No existe la tabla stats_daily: crearla con scripts/migrate_add_stats_index.py")
+            return []
+        campos = ("total_noticias", "cantidad_accidentes", "cantidad_no_accidentes", "cantidad_sin_clasificar")
+        consulta = (
+            select(
+                EstadisticaDiaria.fecha,
+                *[func.sum(getattr(EstadisticaDiaria, campo)).label(campo) for campo in campos]
+            )
+            .group_by(EstadisticaDiaria.fecha)
+            .order_by(EstadisticaDiaria.fecha)
+        )
+        if desde:
+            consulta = consulta.where(EstadisticaDiaria.fecha >= desde)
+        if hasta:
+            consulta = consulta.where(EstadisticaDiaria.fecha <= hasta)
+        if media:
+            consulta = consulta.where(EstadisticaDiaria.media_id.in_(select(Media.id).where(Media.name == media)))
+        
+        return [
+            {"fecha": fila.fecha.isoformat(), **{campo: int(getattr(fila, campo)) for campo in campos}}
+            for fila in self.db.execute(consulta)
+        ]
+    
+    async def query_with_llm(self, user_query: str) -> str:
         """
-        Procesa una pregunta usando el LLM y la base de datos
+        Procesa una pregunta usando el LLM y la base de datos.
+        
+        La búsqueda (sincrónica) corre en el threadpool y la consulta al LLM es
+        asíncrona, con concurrencia limitada (puede lanzar LLMOcupado).
         """
         # Verificar si Ollama está disponible
         if not self.llm_client.is_available():
@@ -106,27 +258,116 @@ class QueryService:
                 "sugerencia": "Ejecuta: docker-compose up -d ollama"
             }
         
-        # Buscar noticias relevantes
-        logging.info(f"Buscando noticias relevantes para: '{user_query}'")
-        relevant_news = self.search_news(user_query, limit=5)
-        logging.info(f"Encontradas {len(relevant_news)} noticias relevantes.")
-        
-        # Construir el prompt para el LLM
-        prompt = self._build_llm_prompt(user_query, relevant_news)
-        logging.info(f"Prompt para el LLM:\n{prompt}")
-        
-        # Obtener respuesta del LLM
-        logging.info("Enviando prompt al LLM...")
-        llm_response = self.llm_client.query(prompt)
-        logging.info(f"Respuesta del LLM: {llm_response}")
+        relevant_news, clave, llm_response, prompt = await run_in_threadpool(self._preparar_consulta, user_query)
+        en_cache = llm_response is not None
+        if not en_cache:
+            # Obtener respuesta del LLM
+            logging.info("Enviando prompt al LLM...")
+            llm_response = await self.llm_client.aquery(prompt)
+            logging.info(f"Respuesta del LLM: {llm_response}")
+            await run_in_threadpool(self._guardar_respuesta, clave, llm_response)
         
         return {
             "pregunta": user_query,
             "respuesta": llm_response,
+            "respuesta_en_cache": en_cache,
+            "tokens_prompt": estimar_tokens(prompt) if prompt else None,
             "noticias_relevantes": relevant_news,
             "total_noticias_encontradas": len(relevant_news)
         }
     
+    async def query_with_llm_stream(self, user_query: str) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Variante de query_with_llm que devuelve eventos a medida que están listos:
+        primero las noticias relevantes, después los fragmentos de la respuesta
+        del LLM y al final un evento de cierre.
+        
+        La búsqueda en la base se hace antes de devolver el iterador, así el
+        streaming no depende de que la sesión siga abierta.
+        """
+        if not self.llm_client.is_available():
+            return self._evento_error(
+                "Ollama no está disponible. Asegúrate de que esté corriendo.",
+                "Ejecuta: docker-compose up -d ollama"
+            )
+        
+        relevant_news, clave, llm_response, prompt = await run_in_threadpool(self._preparar_consulta, user_query)
+        return self._eventos_respuesta(user_query, relevant_news, clave, llm_response, prompt)
+    
+    async def _evento_error(self, detalle: str, sugerencia: str) -> AsyncIterator[Dict[str, Any]]:
+        yield {"tipo": "error", "detalle": detalle, "sugerencia": sugerencia}
+    
+    async def _eventos_respuesta(self, user_query, relevant_news, clave, respuesta_en_cache, prompt) -> AsyncIterator[Dict[str, Any]]:
+        yield {
+            "tipo": "noticias",
+            "pregunta": user_query,
+            "noticias_relevantes": relevant_news,
+            "total_noticias_encontradas": len(relevant_news)
+        }
+        
+        if respuesta_en_cache is not None:
+            yield {"tipo": "fragmento", "contenido": respuesta_en_cache}
+            yield {"tipo": "fin", "respuesta_en_cache": True}
+            return
+        
+        fragmentos = []
+        try:
+            async for fragmento in self.llm_client.aquery_stream(prompt):
+                fragmentos.append(fragmento)
+                yield {"tipo": "fragmento", "contenido": fragmento}
+        except LLMError as e:
+            # La respuesta quedó incompleta: se informa el error y no se guarda en caché
+            yield {"tipo": "error", "detalle": str(e)}
+            return
+        llm_response = "".join(fragmentos)
+        logging.info(f"Respuesta del LLM: {llm_response}")
+        await run_in_threadpool(self._guardar_respuesta, clave, llm_response)
+        yield {"tipo": "fin", "respuesta_en_cache": False, "tokens_prompt": estimar_tokens(prompt)}
+    
+    def _preparar_consulta(self, user_query: str):
+        """
+        Noticias de contexto, clave de caché, respuesta guardada (o None) y, si
+        no hay respuesta guardada, el prompt para el LLM
+        """
+        # Buscar noticias relevantes
+        logging.info(f"Buscando noticias relevantes para: '{user_query}'")
+        relevant_news = self._buscar_contexto(user_query, limit=5)
+        logging.info(f"Encontradas {len(relevant_news)} noticias relevantes.")
+        
+        # El prompt usa el contenido completo, no el extracto que se muestra en la interfaz,
+        # y el nombre del medio de cada noticia
+        contenidos, medios = {}, {}
+        if relevant_news:
+            filas = (self.db.query(Noticia.id, Noticia.contenido, Media.name)
+                     .outerjoin(Media, Media.id == Noticia.media_id)
+                     .filter(Noticia.id.in_([n["id"] for n in relevant_news])).all())
+            contenidos = {id_noticia: contenido for id_noticia, contenido, _ in filas}
+            medios = {id_noticia: nombre for id_noticia, _, nombre in filas}
+        for noticia in relevant_news:
+            noticia["medio"] = medios.get(noticia["id"])
+        
+        # La misma pregunta con las mismas noticias, modelo y prompt ya tiene respuesta
+        modelo = self.llm_client.model
+        clave = clave_respuesta(
+            user_query,
+            [(n["id"], f"{n['titulo']}\n{contenidos.get(n['id']) or ''}") for n in relevant_news],
+            modelo,
+            f"{VERSION_PROMPT}:{presupuesto_modelo(modelo)}",
+        )
+        llm_response = get_cache().obtener(clave)
+        if llm_response is not None:
+            logging.info("Respuesta obtenida de la caché.")
+            return relevant_news, clave, llm_response, None
+        
+        prompt = self._build_llm_prompt(user_query, relevant_news, contenidos)
+        logging.info(f"Prompt para el LLM:\n{prompt}")
+        return relevant_news, clave, None, prompt
+    
+    def _guardar_respuesta(self, clave: str, llm_response: str):
+        # Los errores de Ollama no se guardan para que la próxima consulta lo reintente
+        if llm_response and not llm_response.startswith("Error"):
+            get_cache().guardar(clave, llm_response)
+    
     def _extract_search_terms(self, query: str) -> List[str]:
         """
         Extrae términos de búsqueda relevantes de la consulta
@@ -169,42 +410,23 @@ class QueryService:
         query_lower = query.lower()
         return any(indicator in query_lower for indicator in traffic_indicators)
     
-    def _build_llm_prompt(self, question: str, news: List[Dict[str, Any]]) -> str:
+    def _build_llm_prompt(self, question: str, news: List[Dict[str, Any]],
+                          contenidos: Optional[Dict[int, str]] = None) -> str:
         """
-        Construye el prompt para el LLM basándose en la pregunta y las noticias
+        Construye el prompt para el LLM basándose en la pregunta y las noticias.
+        Las oraciones de cada noticia se eligen por relevancia para la pregunta
+        hasta llenar el presupuesto de tokens del modelo (LLM_CONTEXT_TOKENS).
         """
         if not news:
-            return f"""
-            Pregunta: {question}
-            
-            No se encontraron noticias relevantes en la base de datos.
-            
-            Por favor, responde de manera informativa indicando que no hay información disponible sobre este tema en la base de datos actual.
-            """
-        
-        # Construir contexto con las noticias
-        context = "\n\n".join([
-            f"Noticia {i+1}:\nTítulo: {n['titulo']}\nContenido: {n['contenido']}\nFecha: {n['fecha']}\nMedio: {n['media_id']}"
-            for i, n in enumerate(news)
-        ])
+            return PLANTILLA_SIN_NOTICIAS.format(pregunta=question)
         
-        prompt = f"""
-        Eres un asistente especializado en análisis de noticias sobre accidentes de tránsito en Argentina.
-        
-        Pregunta del usuario: {question}
-        
-        Contexto - Noticias relevantes de la base de datos:
-        {context}
-        
-        Instrucciones:
-        1. Analiza la pregunta del usuario
-        2. Utiliza la información de las noticias proporcionadas para responder
-        3. Si la pregunta no puede responderse con las noticias disponibles, indícalo claramente
-        4. Proporciona una respuesta clara, concisa y útil
-        5. Si hay estadísticas relevantes, inclúyelas
-        6. Responde en español
-        
-        Respuesta:
-        """
+        # Construir contexto con las oraciones más relevantes de las noticias
+        presupuesto = presupuesto_modelo(self.llm_client.model)
+        context, resumen = empaquetar_contexto(question, news, contenidos or {}, presupuesto)
+        logging.info(
+            f"Contexto del prompt: {resumen['noticias']} noticias, "
+            f"{resumen['oraciones']}/{resumen['oraciones_disponibles']} oraciones, "
+            f"~{resumen['tokens_contexto']}/{presupuesto} tokens"
+        )
         
-        return prompt 
\ No newline at end of file
+        return PLANTILLA_PROMPT.format(contexto=context, pregunta=question) 
\ No newline at end of file
@@ -2,43 +2,170 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from app.db import SessionLocal, Noticia
+from app.db import SessionLocal, Noticia, PuntajeClasificacion, engine, tabla_existe
 from app.scrapers import SCRAPERS, FECHA_LIMITE_GLOBAL
-from app.classifier import clasificar_noticia_completa
-from app.classifiers import DEFAULT_THRESHOLDS
-from sqlalchemy import or_
+from app.classifier import puntajes_lote, clasificar_desde_puntajes, campos_clasificacion
+from app.classifiers import DEFAULT_THRESHOLDS, VOTOS_MINIMOS, CLASIFICADORES
+from app.classifiers.fingerprint import version_config, version_puntajes, huella
+from app.nlp import warm_up
+from app import semantic_search
+from app import daily_stats
+from sqlalchemy import and_, or_, case, delete, insert, select, update, func
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed, wait, FIRST_COMPLETED
 import datetime
 import time
 import argparse
 
-def run_classifiers(custom_thresholds=None, force_reclassify=False):
-    """Ejecuta todos los clasificadores en las noticias sin clasificar"""
+SIN_TABLA_PUNTAJES = ("No existe la tabla puntajes_clasificacion: crearla con "
+                      "scripts/migrate_add_puntajes_clasificacion.py.")
+
+# Cantidad de scrapers que se ejecutan en paralelo (1 = secuencial)
+SCRAPER_WORKERS = int(os.getenv("SCRAPER_WORKERS", len(SCRAPERS)))
+
+# Noticias por lote de clasificación (lote de spaCy y de commit) y procesos de spaCy
+CLASSIFIER_BATCH_SIZE = int(os.getenv("CLASSIFIER_BATCH_SIZE", "64"))
+CLASSIFIER_N_PROCESS = int(os.getenv("CLASSIFIER_N_PROCESS", "1"))
+# Procesos que clasifican en paralelo (1 = en el proceso actual)
+CLASSIFIER_WORKERS = int(os.getenv("CLASSIFIER_WORKERS", "1"))
+
+def _filtros_clasificacion(force_reclassify):
+    """Condiciones para elegir las noticias a clasificar (ninguna si se fuerza)"""
+    if force_reclassify:
+        return []
+    return [or_(Noticia.classification.is_(None), Noticia.classification == 'SIN_CLASIFICAR')]
+
+def _consulta_clasificacion():
+    """Texto, huellas y puntajes guardados de cada noticia (los puntajes pueden no existir)"""
+    return (
+        select(
+            Noticia.id, Noticia.titulo, Noticia.contenido, Noticia.clasificacion_huella,
+            PuntajeClasificacion.huella,
+            PuntajeClasificacion.excluido,
+            *[getattr(PuntajeClasificacion, nombre) for nombre in CLASIFICADORES]
+        )
+        .outerjoin(PuntajeClasificacion, PuntajeClasificacion.noticia_id == Noticia.id)
+    )
+
+def _fila_clasificacion(noticia_id, resultado_final, votos_individuales, huella_actual):
+    """Valores a escribir para una noticia en el UPDATE en lote"""
+    return {"id": noticia_id, **campos_clasificacion(resultado_final, votos_individuales, huella_actual)}
+
+def _clasificar(noticias, thresholds, versiones, batch_size, n_process=1):
+    """
+    Clasifica las filas de `_consulta_clasificacion`. Devuelve las filas para el
+    UPDATE de noticias, los puntajes nuevos a guardar y cuántas se omitieron.
+
+    - Misma huella de clasificación: nada cambió, se omite.
+    - Mismo texto y términos pero otros thresholds: los votos salen de los
+      puntajes guardados, sin volver a ejecutar NLP.
+    - Resto: se calculan los puntajes con NLP (en lote) y se guardan.
+    """
+    version, version_p = versiones
+    filas, filas_puntajes, pendientes = [], [], []
+    omitidas = 0
+    for noticia_id, titulo, contenido, huella_guardada, huella_puntajes, *guardados in noticias:
+        huella_actual = huella(titulo, contenido, version)
+        huella_p = huella(titulo, contenido, version_p)
+        if huella_p == huella_puntajes:
+            if huella_actual == huella_guardada:
+                omitidas += 1
+                continue
+            puntajes = dict(zip(('excluido',) + CLASIFICADORES, guardados))
+            resultado_final, votos_individuales = clasificar_desde_puntajes(puntajes, thresholds)
+            filas.append(_fila_clasificacion(noticia_id, resultado_final, votos_individuales, huella_actual))
+        else:
+            pendientes.append((noticia_id, titulo, contenido, huella_actual, huella_p))
+
+    if pendientes:
+        calculados = puntajes_lote(
+            [(titulo, contenido) for _, titulo, contenido, _, _ in pendientes],
+            batch_size=batch_size,
+            n_process=n_process
+        )
+        for (noticia_id, _, _, huella_actual, huella_p), puntajes in zip(pendientes, calculados):
+            resultado_final, votos_individuales = clasificar_desde_puntajes(puntajes, thresholds)
+            filas.append(_fila_clasificacion(noticia_id, resultado_final, votos_individuales, huella_actual))
+            filas_puntajes.append({"noticia_id": noticia_id, "huella": huella_p, **puntajes})
+    return filas, filas_puntajes, omitidas
+
+def _inicializar_worker():
+    """Se ejecuta una vez por proceso del pool: conexiones propias y modelos cargados"""
+    # Las conexiones heredadas del proceso padre no se pueden compartir
+    engine.dispose(close=False)
+    warm_up()
+
+def _clasificar_ids(ids, thresholds, versiones, batch_size):
+    """Clasifica en un proceso del pool las noticias de un grupo de ids (ver `_clasificar`)"""
+    db = SessionLocal()
+    try:
+        noticias = db.execute(_consulta_clasificacion().where(Noticia.id.in_(ids))).all()
+    finally:
+        db.close()
+    return _clasificar(noticias, thresholds, versiones, batch_size)
+
+def _guardar_lote(escritura, resultado, stats):
+    """
+    Un UPDATE en lote por clave primaria, reemplazo de los puntajes recalculados
+    y commit por lote para evitar pérdida de datos
+    """
+    filas, filas_puntajes, omitidas = resultado
+    if filas_puntajes:
+        ids = [fila["noticia_id"] for fila in filas_puntajes]
+        escritura.execute(delete(PuntajeClasificacion).where(PuntajeClasificacion.noticia_id.in_(ids)))
+        escritura.execute(insert(PuntajeClasificacion), filas_puntajes)
+    if filas:
+        escritura.execute(update(Noticia), filas)
+    if filas or filas_puntajes:
+        escritura.commit()
+    if filas:
+        daily_stats.actualizar(escritura, daily_stats.celdas_de_noticias(escritura, [fila["id"] for fila in filas]))
+    for fila in filas:
+        stats[fila["classification"]] += 1
+    stats['SIN_CAMBIOS'] += omitidas
+    stats['SIN_NLP'] += len(filas) - len(filas_puntajes)
+    return len(filas)
+
+def run_classifiers(custom_thresholds=None, force_reclassify=False,
+                    batch_size=CLASSIFIER_BATCH_SIZE, n_process=CLASSIFIER_N_PROCESS,
+                    workers=CLASSIFIER_WORKERS):
+    """
+    Ejecuta todos los clasificadores en las noticias sin clasificar.
+    Las noticias se leen en streaming (cursor del lado del servidor, solo id,
+    título y contenido) y los resultados se escriben con UPDATEs en lote, por lo
+    que la memoria usada no depende del tamaño del archivo.
+    Con `workers` > 1 los ids se reparten en grupos entre un pool de procesos.
+    Las noticias cuyo texto y configuración de clasificadores no cambiaron desde
+    la última clasificación (misma huella) se omiten, y si solo cambiaron los
+    thresholds se reutilizan los puntajes guardados en `puntajes_clasificacion`.
+    """
     print("🔄 Iniciando proceso de clasificación...")
     start_time = time.time()
     
-    db = SessionLocal()
+    if not tabla_existe(PuntajeClasificacion):
+        print(f"❌ {SIN_TABLA_PUNTAJES}")
+        return 0
+    
+    # El cursor de lectura queda abierto mientras se escribe, así que se usan dos sesiones
+    lectura = SessionLocal()
+    escritura = SessionLocal()
     
     try:
         # Usar thresholds personalizados o los por defecto
         thresholds = custom_thresholds or DEFAULT_THRESHOLDS
         print(f"📊 Thresholds configurados: {thresholds}")
+        versiones = (version_config(thresholds), version_puntajes())
         
         # Clasificar noticias sin clasificar o todas si force_reclassify=True
         if force_reclassify:
             print("🔍 Forzando re-clasificación de TODAS las noticias...")
-            noticias_a_procesar = db.query(Noticia).all()
         else:
             print("🔍 Buscando noticias sin clasificar...")
-            noticias_a_procesar = db.query(Noticia).filter(
-                or_(
-                    Noticia.classification.is_(None),
-                    Noticia.classification == 'SIN_CLASIFICAR'
-                )
-            ).all()
+        filtros = _filtros_clasificacion(force_reclassify)
+        total = lectura.scalar(select(func.count(Noticia.id)).where(*filtros))
         
-        print(f"📰 Encontradas {len(noticias_a_procesar)} noticias para procesar")
+        print(f"📰 Encontradas {total} noticias para procesar")
         
-        if len(noticias_a_procesar) == 0:
+        if total == 0:
             if force_reclassify:
                 print("✅ No hay noticias en la base de datos")
             else:
@@ -46,49 +173,153 @@ def run_classifiers(custom_thresholds=None, force_reclassify=False):
             return 0
         
         # Contadores
-        stats = {'ACCIDENTE': 0, 'NO_ACCIDENTE': 0}
+        stats = {'ACCIDENTE': 0, 'NO_ACCIDENTE': 0, 'SIN_CAMBIOS': 0, 'SIN_NLP': 0}
+        procesadas = 0
+        
+        if workers > 1:
+            print(f"🚀 Iniciando clasificación de noticias (lotes de {batch_size}, {workers} procesos)...")
+            procesadas = _clasificar_en_paralelo(lectura, escritura, filtros, thresholds, versiones, batch_size, workers, total, stats)
+            return _reportar_clasificacion(start_time, stats, procesadas)
         
-        print("🚀 Iniciando clasificación de noticias...")
-        for i, noticia in enumerate(noticias_a_procesar, 1):
-            print(f"  📝 Procesando noticia {i}/{len(noticias_a_procesar)}: {noticia.titulo[:50]}...")
-            
-            # Clasificar y obtener el resultado final y los votos individuales
-            resultado_final, votos_individuales = clasificar_noticia_completa(
-                noticia.titulo, 
-                noticia.contenido, 
-                thresholds=thresholds
+        print(f"🚀 Iniciando clasificación de noticias (lotes de {batch_size}, {n_process} proceso(s) de spaCy)...")
+        consulta = _consulta_clasificacion().where(*filtros).execution_options(yield_per=batch_size)
+        for lote in lectura.execute(consulta).partitions():
+            # Clasificar solo las noticias que cambiaron y obtener el resultado final y los votos individuales
+            resultado = _clasificar(lote, thresholds, versiones, batch_size, n_process)
+            procesadas += _guardar_lote(escritura, resultado, stats)
+            print(f"💾 Guardado progreso ({procesadas + stats['SIN_CAMBIOS']}/{total})")
+
+        return _reportar_clasificacion(start_time, stats, procesadas)
+    finally:
+        lectura.close()
+        escritura.close()
+
+def _clasificar_en_paralelo(lectura, escritura, filtros, thresholds, versiones, batch_size, workers, total, stats):
+    """
+    Lee solo los ids en streaming y los reparte en grupos entre el pool. Se
+    mantienen como mucho 2 grupos en vuelo por proceso para no acumular memoria.
+    """
+    procesadas = 0
+    consulta_ids = select(Noticia.id).where(*filtros).execution_options(yield_per=batch_size)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_inicializar_worker) as executor:
+        en_vuelo = set()
+        for particion in lectura.execute(consulta_ids).partitions():
+            ids = [noticia_id for (noticia_id,) in particion]
+            en_vuelo.add(executor.submit(_clasificar_ids, ids, thresholds, versiones, batch_size))
+            if len(en_vuelo) >= workers * 2:
+                terminados, en_vuelo = wait(en_vuelo, return_when=FIRST_COMPLETED)
+                for futuro in terminados:
+                    procesadas += _guardar_resultado(escritura, futuro, stats, procesadas, total)
+        for futuro in as_completed(en_vuelo):
+            procesadas += _guardar_resultado(escritura, futuro, stats, procesadas, total)
+    return procesadas
+
+def _guardar_resultado(escritura, futuro, stats, procesadas, total):
+    guardadas = _guardar_lote(escritura, futuro.result(), stats)
+    print(f"💾 Guardado progreso ({procesadas + guardadas + stats['SIN_CAMBIOS']}/{total})")
+    return guardadas
+
+def _reportar_clasificacion(start_time, stats, procesadas):
+    end_time = time.time()
+    
+    print(f"\n🎉 Clasificación completada en {end_time - start_time:.2f} segundos")
+    print("📊 Resumen de clasificación:")
+    print(f"  - Accidentes: {stats['ACCIDENTE']}")
+    print(f"  - No Accidentes: {stats['NO_ACCIDENTE']}")
+    print(f"  - Sin cambios (omitidas): {stats['SIN_CAMBIOS']}")
+    print(f"  - Re-clasificadas con puntajes guardados (sin NLP): {stats['SIN_NLP']}")
+    print(f"💾 Total noticias clasificadas: {procesadas}")
+    
+    return procesadas
+
+def _descartar_puntajes_desactualizados(batch_size: int = 1000) -> int:
+    """
+    Borra los puntajes cuya huella no coincide con el texto actual de la noticia
+    y la configuración de términos actual. Solo calcula hashes, sin NLP.
+    """
+    version_p = version_puntajes()
+    db = SessionLocal()
+    try:
+        consulta = (
+            select(Noticia.id, Noticia.titulo, Noticia.contenido, PuntajeClasificacion.huella)
+            .join(PuntajeClasificacion, PuntajeClasificacion.noticia_id == Noticia.id)
+            .execution_options(yield_per=batch_size)
+        )
+        desactualizados = [
+            noticia_id
+            for lote in db.execute(consulta).partitions()
+            for noticia_id, titulo, contenido, huella_puntajes in lote
+            if huella(titulo, contenido, version_p) != huella_puntajes
+        ]
+        for inicio in range(0, len(desactualizados), batch_size):
+            ids = desactualizados[inicio:inicio + batch_size]
+            db.execute(delete(PuntajeClasificacion).where(PuntajeClasificacion.noticia_id.in_(ids)))
+        db.commit()
+        return len(desactualizados)
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+def recalcular_clasificacion(thresholds=None, votos_minimos=VOTOS_MINIMOS):
+    """
+    Recalcula votos y clasificación final de todas las noticias con puntajes
+    guardados mediante un único UPDATE en la base, sin leer texto ni ejecutar
+    NLP. Sirve para aplicar nuevos thresholds o una nueva regla de votación.
+    Las noticias sin puntajes no se modifican (se clasifican con run_classifiers),
+    y tampoco las que tienen puntajes desactualizados: calculados con otro texto
+    o con otra configuración de términos (huella distinta). Esos puntajes se
+    descartan y la noticia se vuelve a puntuar en el próximo run_classifiers.
+    """
+    thresholds = thresholds or DEFAULT_THRESHOLDS
+    print(f"🔄 Recalculando clasificación desde puntajes guardados: {thresholds}, votos mínimos: {votos_minimos}")
+    start_time = time.time()
+    
+    if not tabla_existe(PuntajeClasificacion):
+        print(f"❌ {SIN_TABLA_PUNTAJES}")
+        return 0
+    descartados = _descartar_puntajes_desactualizados()
+    if descartados:
+        print(f"⚠️  {descartados} noticias tienen puntajes desactualizados (cambió su texto o la "
+              f"configuración de términos): no se recalculan, ejecutar run_classifiers para puntuarlas")
+    votos = {
+        nombre: and_(PuntajeClasificacion.excluido == False, getattr(PuntajeClasificacion, nombre) >= thresholds[nombre])  # noqa: E712
+        for nombre in CLASIFICADORES
+    }
+    votos_positivos = sum(case((voto, 1), else_=0) for voto in votos.values())
+    es_accidente = votos_positivos >= votos_minimos
+    
+    db = SessionLocal()
+    try:
+        resultado = db.execute(
+            update(Noticia)
+            .where(Noticia.id == PuntajeClasificacion.noticia_id)
+            .values(
+                classification=case((es_accidente, 'ACCIDENTE'), else_='NO_ACCIDENTE'),
+                es_accidente_transito=es_accidente,
+                es_accidente_simple=votos['simple'],
+                es_accidente_stem=votos['stemmer'],
+                es_accidente_lemma=votos['lemmatizer'],
+                es_accidente_ml=votos['ml_weighted'],
+                # La huella depende de los thresholds; la próxima re-clasificación la
+                # regenera desde los puntajes guardados, sin NLP
+                clasificacion_huella=None
             )
-            
-            # Guardar el resultado final
-            noticia.classification = resultado_final
-            noticia.es_accidente_transito = (resultado_final == 'ACCIDENTE')
-            
-            # Guardar los votos individuales
-            noticia.es_accidente_simple = votos_individuales.get('simple')
-            noticia.es_accidente_stem = votos_individuales.get('stemmer')
-            noticia.es_accidente_lemma = votos_individuales.get('lemmatizer')
-            noticia.es_accidente_ml = votos_individuales.get('ml_weighted')
-
-            stats[resultado_final] += 1
-                
-            print(f"    -> Resultado: {resultado_final}")
-            
-            # Guardar cada 10 noticias para evitar pérdida de datos
-            if i % 10 == 0:
-                db.commit()
-                print(f"💾 Guardado progreso ({i}/{len(noticias_a_procesar)})")
-
-        # Guardar cambios finales
+            .execution_options(synchronize_session=False)
+        )
         db.commit()
-        end_time = time.time()
-        
-        print(f"\n🎉 Clasificación completada en {end_time - start_time:.2f} segundos")
-        print("📊 Resumen de clasificación:")
-        print(f"  - Accidentes: {stats['ACCIDENTE']}")
-        print(f"  - No Accidentes: {stats['NO_ACCIDENTE']}")
-        print(f"💾 Total noticias clasificadas: {len(noticias_a_procesar)}")
-        
-        return len(noticias_a_procesar)
+        print(f"✅ {resultado.rowcount} noticias recalculadas en {time.time() - start_time:.2f} segundos")
+        # Cambió la clasificación de toda la base: el resumen diario se rehace completo
+        try:
+            daily_stats.reconstruir()
+        except Exception as e:
+            print(f"⚠️  No se pudo reconstruir stats_daily: {e}")
+        return resultado.rowcount
+    except Exception as e:
+        print(f"❌ Error recalculando la clasificación: {e}")
+        db.rollback()
+        raise
     finally:
         db.close()
 
@@ -97,70 +328,121 @@ def run_classifiers_with_custom_thresholds(thresholds):
     print(f"Ejecutando clasificadores con thresholds personalizados: {thresholds}")
     return run_classifiers(custom_thresholds=thresholds)
 
-def force_reclassify_all():
+def force_reclassify_all(**kwargs):
     """Fuerza la re-clasificación de todas las noticias"""
     print("🔄 Forzando re-clasificación de todas las noticias...")
-    return run_classifiers(force_reclassify=True)
+    return run_classifiers(force_reclassify=True, **kwargs)
 
-def run_all_scrapers(fecha_limite_arg=None):
+def ejecutar_scraper(ScraperClass, fecha_limite):
+    """
+    Ejecuta un scraper con su propia sesión de DB, de modo que pueda correr en
+    paralelo con los demás. Devuelve un resumen con guardadas, error y duración.
+    """
+    nombre = ScraperClass.__name__
+    resultado = {"scraper": nombre, "guardadas": 0, "sin_clasificar": 0, "error": None, "duracion": 0.0}
+    print(f"▶️  Ejecutando scraper: {nombre}")
+    inicio = time.time()
     db = SessionLocal()
-    total_noticias_scrapeadas = 0
+    scraper = None
     try:
-        # Decidir qué fecha límite usar
-        fecha_a_usar = None
-        if fecha_limite_arg:
-            try:
-                fecha_a_usar = datetime.datetime.strptime(fecha_limite_arg, '%Y-%m-%d').date()
-                print(f"🗓️  Usando fecha límite de la interfaz: {fecha_a_usar.strftime('%Y-%m-%d')}")
-            except ValueError:
-                print(f"⚠️  Fecha inválida '{fecha_limite_arg}'. Usando la fecha global por defecto.")
-                fecha_a_usar = FECHA_LIMITE_GLOBAL
-        else:
-            fecha_a_usar = FECHA_LIMITE_GLOBAL
-            print(f"🗓️  Usando fecha límite global por defecto: {fecha_a_usar.strftime('%Y-%m-%d')}")
-
-        # Instanciamos los scrapers pasándoles la fecha límite decidida
-        scrapers_con_limite = [ScraperClass(fecha_limite=fecha_a_usar) for ScraperClass in SCRAPERS]
-
-        for scraper in scrapers_con_limite:
-            print(f"▶️  Ejecutando scraper: {scraper.__class__.__name__}")
-            try:
-                guardadas = scraper.scrape(db)
-                print(f"  ✅ Noticias guardadas: {guardadas}")
-                total_noticias_scrapeadas += guardadas
-            except Exception as e:
-                print(f"  ❌ Error en scraper {scraper.__class__.__name__}: {e}")
-                db.rollback() # Asegurarse de revertir en caso de error en un scraper
+        scraper = ScraperClass(fecha_limite=fecha_limite)
+        resultado["guardadas"] = scraper.run(db)
+        print(f"  ✅ {nombre}: noticias guardadas: {resultado['guardadas']}")
+    except Exception as e:
+        print(f"  ❌ Error en scraper {nombre}: {e}")
+        resultado["error"] = str(e)
+        db.rollback() # Asegurarse de revertir en caso de error en un scraper
     finally:
         db.close()
+        resultado["sin_clasificar"] = scraper.sin_clasificar if scraper else 0
+        resultado["duracion"] = time.time() - inicio
+    return resultado
+
+def run_all_scrapers(fecha_limite_arg=None, workers=None):
+    if workers is None:
+        workers = SCRAPER_WORKERS
+
+    # Decidir qué fecha límite usar
+    fecha_a_usar = None
+    if fecha_limite_arg:
+        try:
+            fecha_a_usar = datetime.datetime.strptime(fecha_limite_arg, '%Y-%m-%d').date()
+            print(f"🗓️  Usando fecha límite de la interfaz: {fecha_a_usar.strftime('%Y-%m-%d')}")
+        except ValueError:
+            print(f"⚠️  Fecha inválida '{fecha_limite_arg}'. Usando la fecha global por defecto.")
+            fecha_a_usar = FECHA_LIMITE_GLOBAL
+    else:
+        fecha_a_usar = FECHA_LIMITE_GLOBAL
+        print(f"🗓️  Usando fecha límite global por defecto: {fecha_a_usar.strftime('%Y-%m-%d')}")
+
+    if not tabla_existe(PuntajeClasificacion):
+        print(f"⚠️  {SIN_TABLA_PUNTAJES} Las noticias se clasifican igual, sin guardar puntajes.")
+    
+    inicio = time.time()
+    resultados = []
+    if workers <= 1:
+        for ScraperClass in SCRAPERS:
+            resultados.append(ejecutar_scraper(ScraperClass, fecha_a_usar))
+    else:
+        print(f"⚡ Ejecutando {len(SCRAPERS)} scrapers con {workers} workers en paralelo")
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futuros = [executor.submit(ejecutar_scraper, ScraperClass, fecha_a_usar) for ScraperClass in SCRAPERS]
+            for futuro in as_completed(futuros):
+                resultados.append(futuro.result())
+    duracion_total = time.time() - inicio
+    total_noticias_scrapeadas = sum(r["guardadas"] for r in resultados)
+    pendientes = sum(r["sin_clasificar"] for r in resultados)
+
+    print(f"\n⏱️  Scrapers finalizados en {duracion_total:.1f} segundos:")
+    for r in sorted(resultados, key=lambda r: r["duracion"], reverse=True):
+        estado = f"❌ {r['error']}" if r["error"] else "✅"
+        print(f"  - {r['scraper']}: {r['guardadas']} guardadas en {r['duracion']:.1f}s {estado}")
     
-    # Ejecutar clasificadores después de scrapear.
-    # Esta función ahora manejará su propia sesión de DB.
-    print("\n🏁 Scraping finalizado. Iniciando clasificación de noticias nuevas...")
-    clasificadas = run_classifiers()
+    # Las noticias se clasifican al ingerirlas; solo hace falta una pasada de
+    # run_classifiers si alguna quedó sin clasificar (etapa desactivada o con error)
+    clasificadas = total_noticias_scrapeadas - pendientes
+    if pendientes:
+        print(f"\n🏁 Scraping finalizado. Clasificando {pendientes} noticias que quedaron pendientes...")
+        clasificadas += run_classifiers()
+    else:
+        print("\n🏁 Scraping finalizado. Todas las noticias nuevas se clasificaron al ingerirlas.")
     
     print(f"\n📈 Resumen final:")
     print(f"  - Total noticias nuevas scrapeadas: {total_noticias_scrapeadas}")
     print(f"  - Total noticias nuevas clasificadas: {clasificadas}")
+    
+    # Embeddings de las noticias nuevas para la recuperación semántica
+    if semantic_search.RETRIEVAL_BACKEND != "keyword" and total_noticias_scrapeadas:
+        try:
+            print(f"  - Embeddings nuevos: {semantic_search.actualizar_embeddings()}")
+        except Exception as e:
+            print(f"❌ Error al calcular embeddings: {e}")
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Ejecutar scrapers y clasificadores.")
     parser.add_argument("--classify-only", action="store_true", help="Ejecuta solo clasificadores en noticias sin clasificar")
     parser.add_argument("--force-reclassify", action="store_true", help="Re-clasifica TODAS las noticias")
     parser.add_argument("--fecha-limite", type=str, help="Fecha límite para los scrapers en formato YYYY-MM-DD")
+    parser.add_argument("--workers", type=int, default=SCRAPER_WORKERS, help="Scrapers a ejecutar en paralelo (1 = secuencial)")
+    parser.add_argument("--batch-size", type=int, default=CLASSIFIER_BATCH_SIZE, help="Noticias por lote de clasificación")
+    parser.add_argument("--n-process", type=int, default=CLASSIFIER_N_PROCESS, help="Procesos que usa spaCy para lematizar")
+    parser.add_argument("--classifier-workers", type=int, default=CLASSIFIER_WORKERS, help="Procesos que clasifican en paralelo")
+    parser.add_argument("--recalcular", action="store_true", help="Recalcula la clasificación desde los puntajes guardados (sin NLP)")
     
     args = parser.parse_args()
 
     # Verificar argumentos de línea de comandos
     if args.classify_only:
         print("Ejecutando solo clasificadores...")
-        clasificadas = run_classifiers()
+        clasificadas = run_classifiers(batch_size=args.batch_size, n_process=args.n_process, workers=args.classifier_workers)
         print(f"Clasificación completada. Total noticias clasificadas: {clasificadas}")
+    elif args.recalcular:
+        recalcular_clasificacion()
     elif args.force_reclassify:
         print("Ejecutando re-clasificación forzada...")
-        clasificadas = force_reclassify_all()
+        clasificadas = force_reclassify_all(batch_size=args.batch_size, n_process=args.n_process, workers=args.classifier_workers)
         print(f"Re-clasificación completada. Total noticias procesadas: {clasificadas}")
     else:
         # Ejecutar scraping completo, pasando la fecha si se proveyó
-        run_all_scrapers(fecha_limite_arg=args.fecha_limite)
+        run_all_scrapers(fecha_limite_arg=args.fecha_limite, workers=args.workers)
         print("Scraping y guardado completados.") 
\ No newline at end of file
@@ -1,54 +1,102 @@
 from typing import List, Dict
-from app.db import Noticia, Media
-from sqlalchemy.orm.exc import NoResultFound
+from app.ingest import IngestSink
+from .fetch import get_fetch_engine
 
 class BaseScraper:
-    def __init__(self, fecha_limite=None):
+    def __init__(self, fecha_limite=None, fetcher=None):
         self.fecha_limite = fecha_limite
+        self.fetcher = fetcher or get_fetch_engine()
+        self._prefetched = {}
+        self._sink = None
+
     def scrape(self, db) -> int:
-        """Método que debe implementar cada scraper. Debe guardar noticias usando la sesión db y devolver la cantidad guardada."""
+        """
+        Método que debe implementar cada scraper. Encola noticias con
+        `_guardar_noticia` y devuelve la cantidad encolada; las insertadas
+        efectivamente las devuelve `run`.
+        """
         raise NotImplementedError 
 
-    def _guardar_noticia(self, db, noticia_data: Dict):
+    def _get(self, url, **kwargs):
         """
-        Guarda una noticia en la base de datos, manejando la creación del medio si no existe.
+        GET a través del motor de descarga compartido. Si la URL fue precargada
+        con `_prefetch`, devuelve esa respuesta sin volver a la red.
         """
-        try:
-            # Verificar si la noticia ya existe por URL
-            db.query(Noticia).filter_by(url=noticia_data["url"]).one()
-            print(f"⏭️  Noticia ya existe: {noticia_data['titulo']}")
-            return False
-        except NoResultFound:
-            # La noticia no existe, continuar
-            pass
-        except Exception as e:
-            print(f"🚨 Error al verificar existencia de noticia: {e}")
+        if url in self._prefetched and not kwargs.get("params"):
+            precargada = self._prefetched.pop(url)
+            if isinstance(precargada, Exception):
+                raise precargada
+            return precargada
+        return self.fetcher.get(url, **kwargs)
+
+    def _post(self, url, **kwargs):
+        return self.fetcher.post(url, **kwargs)
+
+    def _prefetch(self, urls, **kwargs):
+        """
+        Descarga en paralelo los artículos de una página del listado. Reemplaza
+        lo precargado anteriormente para no acumular páginas no consumidas.
+        """
+        self._prefetched = self.fetcher.fetch_all(urls, **kwargs)
+
+    def _fuera_de_fecha_limite(self, fecha) -> bool:
+        """True si la fecha (date o datetime) es anterior a la fecha límite del scraper."""
+        if not self.fecha_limite or not fecha:
             return False
+        if hasattr(fecha, "date"):
+            fecha = fecha.date()
+        return fecha < self.fecha_limite
 
+    def _hasta_fecha_limite(self, candidatos) -> List[str]:
+        """
+        URLs a precargar de una página del listado. `candidatos` son pares
+        (url, fecha) en el orden del listado, ya sin los artículos que se van a
+        omitir (sin título, vistos). Se corta en el primero anterior a la fecha
+        límite, igual que el recorrido de la página, para no descargar artículos
+        que se descartarían. Una fecha None no corta: se resuelve en el artículo.
+        """
+        urls = []
+        for url, fecha in candidatos:
+            if self._fuera_de_fecha_limite(fecha):
+                break
+            urls.append(url)
+        return urls
+
+    def _guardar_noticia(self, db, noticia_data: Dict):
+        """
+        Encola una noticia en el sink de ingesta de la sesión. La escritura se
+        hace en lotes; las noticias que ya existen se descartan al hacer flush.
+        Devuelve True si la noticia quedó encolada, no si ya fue insertada:
+        la cantidad de nuevas la devuelve `run`.
+        """
         try:
-            media_name = noticia_data.pop("media_name")
-            media = None
-            try:
-                media = db.query(Media).filter_by(name=media_name).one()
-            except NoResultFound:
-                print(f"📰 Creando nuevo medio: {media_name}")
-                media = Media(name=media_name)
-                db.add(media)
-
-            noticia_obj = Noticia(
-                titulo=noticia_data["titulo"],
-                contenido=noticia_data["contenido"],
-                contenido_crudo=noticia_data.get("contenido_crudo", ""),
-                fecha=noticia_data["fecha"],
-                url=noticia_data["url"],
-                media=media
-            )
-            
-            db.add(noticia_obj)
-            db.commit()
-            print(f"✅ Noticia guardada: {noticia_data['titulo']}")
-            return True
+            return self._sink_para(db).add(noticia_data)
         except Exception as e:
             print(f"❌ Error al guardar noticia: {e}")
             db.rollback()
-            return False 
\ No newline at end of file
+            return False
+
+    def _sink_para(self, db) -> IngestSink:
+        if self._sink is None or self._sink.db is not db:
+            self._sink = IngestSink(db)
+        return self._sink
+
+    @property
+    def sin_clasificar(self) -> int:
+        """Noticias insertadas que quedaron pendientes para run_classifiers"""
+        return self._sink.sin_clasificar if self._sink else 0
+
+    def run(self, db) -> int:
+        """
+        Ejecuta el scraper y escribe el último lote pendiente.
+        Devuelve la cantidad de noticias nuevas efectivamente insertadas.
+        """
+        sink = self._sink_para(db)
+        try:
+            self.scrape(db)
+        finally:
+            # Lo encolado antes de un error también se guarda (flush no lanza excepciones)
+            sink.flush()
+            if sink.pendientes:
+                print(f"❌ {len(sink.pendientes)} noticias no se pudieron guardar: {', '.join(sink.pendientes)}")
+        return sink.guardadas
@@ -3,7 +3,6 @@ import requests
 from bs4 import BeautifulSoup
 from datetime import datetime
 import locale
-import time
 from urllib.parse import urljoin
 import dateparser
 
@@ -31,7 +30,7 @@ class ElSubmarinoJujuyScraper(BaseScraper):
             print(f"📄 Scrapeando página {page}: {current_url}")
             
             try:
-                response = requests.get(current_url, timeout=15)
+                response = self._get(current_url, timeout=15)
                 if response.status_code == 404:
                     print("🔚 No hay más páginas, se recibió un 404.")
                     break
@@ -48,6 +47,14 @@ class ElSubmarinoJujuyScraper(BaseScraper):
                 print("🔚 No se encontraron más artículos en la página.")
                 break
 
+            # Descarga en paralelo los artículos de la página
+            candidatos = []
+            for article_el in article_elements:
+                link = article_el.select_one('h2.post-title a')
+                if link and link.has_attr('href'):
+                    candidatos.append((link['href'], self._fecha_listado(article_el)))
+            self._prefetch(self._hasta_fecha_limite(candidatos), timeout=15)
+
             detener_por_fecha = False
             for article_el in article_elements:
                 url_articulo_tag = article_el.select_one('h2.post-title a')
@@ -57,11 +64,9 @@ class ElSubmarinoJujuyScraper(BaseScraper):
                 url_articulo = url_articulo_tag['href']
 
                 # --- Extraer fecha primero para chequear límite ---
-                date_tag = article_el.select_one('span.tie-date')
-                fecha_texto = date_tag.get_text(strip=True) if date_tag else ''
-                fecha_articulo = dateparser.parse(fecha_texto, languages=['es'])
+                fecha_articulo = self._fecha_listado(article_el)
 
-                if self.fecha_limite and fecha_articulo and fecha_articulo.date() < self.fecha_limite:
+                if self._fuera_de_fecha_limite(fecha_articulo):
                     print(f"📅 Se alcanzó la fecha límite ({fecha_articulo.date()}). Deteniendo.")
                     detener_por_fecha = True
                     break
@@ -77,19 +82,24 @@ class ElSubmarinoJujuyScraper(BaseScraper):
                     print(f"❌ Error scrapeando artículo {url_articulo}: {e}")
                     db.rollback()
 
-                time.sleep(1) 
-
             if detener_por_fecha:
                 break
             
             page += 1
         
-        print(f"✅ Scraping completado para {self.media_name}. Total de noticias guardadas: {noticias_guardadas}")
+        print(f"✅ Scraping completado para {self.media_name}. Total de noticias encoladas: {noticias_guardadas}")
         return noticias_guardadas
 
+    @staticmethod
+    def _fecha_listado(article_el):
+        """Fecha del artículo en el listado (span.tie-date), o None."""
+        date_tag = article_el.select_one('span.tie-date')
+        fecha_texto = date_tag.get_text(strip=True) if date_tag else ''
+        return dateparser.parse(fecha_texto, languages=['es'])
+
     def _scrape_article(self, url):
         try:
-            response = requests.get(url, timeout=15)
+            response = self._get(url, timeout=15)
             response.raise_for_status()
             soup = BeautifulSoup(response.text, 'html.parser')
 
@@ -132,5 +142,5 @@ if __name__ == '__main__':
     # Poner una fecha límite de hace 30 días para la prueba
     fecha_limite_prueba = datetime.now().date() - timedelta(days=30)
     scraper = ElSubmarinoJujuyScraper(fecha_limite=fecha_limite_prueba)
-    scraper.scrape(db_session)
+    print(f"✅ Noticias nuevas guardadas: {scraper.run(db_session)}")
     db_session.close() 
\ No newline at end of file
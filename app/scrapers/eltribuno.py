@@ -1,11 +1,9 @@
 from .base import BaseScraper
 from typing import List, Dict
-import requests
 from bs4 import BeautifulSoup
 import datetime
 import re
 from urllib.parse import urljoin
-import time
 
 class ElTribunoScraper(BaseScraper):
     BASE_URL = "https://eltribunodejujuy.com/seccion/policiales"
@@ -28,7 +26,7 @@ class ElTribunoScraper(BaseScraper):
             print(f"📄 Scraping página {pagina}: {url_pagina}")
             
             try:
-                response = requests.get(url_pagina, headers=headers, timeout=10)
+                response = self._get(url_pagina, headers=headers, timeout=10)
                 response.raise_for_status()
                 soup = BeautifulSoup(response.text, "html.parser")
                 
@@ -40,6 +38,19 @@ class ElTribunoScraper(BaseScraper):
                     break
 
                 found_articles = False
+
+                # Descarga en paralelo los artículos de la página que se van a procesar:
+                # con título y hasta la fecha límite (la fecha está en la URL)
+                candidatos = []
+                for item in items:
+                    link = item.find('a')
+                    if not link or not link.get('href') or not self._titulo_listado(item):
+                        continue
+                    url = urljoin(self.BASE_URL, link['href'])
+                    fecha = self._fecha_desde_url(url)
+                    if fecha:
+                        candidatos.append((url, fecha))
+                self._prefetch(self._hasta_fecha_limite(candidatos), headers=headers, timeout=10)
                 
                 for item in items:
                     try:
@@ -51,15 +62,12 @@ class ElTribunoScraper(BaseScraper):
                         url = urljoin(self.BASE_URL, link_element['href'])
                         
                         # Extrae la fecha del enlace
-                        # Formato esperado: .../2025-1-29-0-31-0-titulo-de-la-noticia
-                        date_parts = url.split('/')[-1].split('-')[:3]
-                        if len(date_parts) < 3:
+                        article_date = self._fecha_desde_url(url)
+                        if not article_date:
                             continue
-                            
-                        article_date = datetime.date(int(date_parts[0]), int(date_parts[1]), int(date_parts[2]))
                         
                         # Si el artículo es anterior a la fecha límite, terminar
-                        if self.fecha_limite and article_date < self.fecha_limite:
+                        if self._fuera_de_fecha_limite(article_date):
                             print(f"📅 Se alcanzó la fecha límite ({self.fecha_limite}), finalizando búsqueda")
                             seguir = False
                             break
@@ -67,16 +75,14 @@ class ElTribunoScraper(BaseScraper):
                         found_articles = True
                         
                         # Obtiene el título
-                        title_element = item.find('h2') or item.find('h3') or item.find(class_='title')
-                        if not title_element:
+                        titulo = self._titulo_listado(item)
+                        if titulo is None:
                             continue
-                            
-                        titulo = title_element.text.strip()
                         
                         # Scrapea la página individual del artículo para más detalles
                         try:
                             print(f"🔍 Scrapeando artículo: {url}")
-                            nota_resp = requests.get(url, headers=headers, timeout=10)
+                            nota_resp = self._get(url, headers=headers, timeout=10)
                             nota_resp.raise_for_status()
                             nota_soup = BeautifulSoup(nota_resp.text, "html.parser")
                             
@@ -96,9 +102,6 @@ class ElTribunoScraper(BaseScraper):
                             if self._guardar_noticia(db, noticia_data):
                                 noticias_guardadas += 1
                             
-                            # Espera entre requests de artículos individuales
-                            time.sleep(2)
-                            
                         except Exception as e:
                             print(f"❌ Error scraping artículo individual {url}: {str(e)}")
                             db.rollback()
@@ -112,7 +115,6 @@ class ElTribunoScraper(BaseScraper):
                     print(f"🤷 No se encontraron artículos válidos en la página {pagina}")
                 
                 pagina += 1
-                time.sleep(3)  # Espera entre páginas
                 
             except Exception as e:
                 print(f"❌ Error scraping El Tribuno: {e}")
@@ -120,6 +122,23 @@ class ElTribunoScraper(BaseScraper):
                 
         return noticias_guardadas
 
+    @staticmethod
+    def _fecha_desde_url(url):
+        """Fecha del artículo desde su URL (formato .../2025-1-29-0-31-0-titulo-de-la-noticia), o None."""
+        date_parts = url.split('/')[-1].split('-')[:3]
+        if len(date_parts) < 3:
+            return None
+        try:
+            return datetime.date(int(date_parts[0]), int(date_parts[1]), int(date_parts[2]))
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _titulo_listado(item):
+        """Título del artículo en el listado, o None si no tiene."""
+        title_element = item.find('h2') or item.find('h3') or item.find(class_='title')
+        return title_element.text.strip() if title_element else None
+
     def _extract_content(self, soup):
         """Extrae el contenido limpio y el HTML crudo del artículo."""
         try:
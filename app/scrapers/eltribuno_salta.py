@@ -1,11 +1,9 @@
 from .base import BaseScraper
 from typing import List, Dict
-import requests
 from bs4 import BeautifulSoup
 import datetime
 import re
 from urllib.parse import urljoin
-import time
 
 class ElTribunoSaltaScraper(BaseScraper):
     BASE_URL = "https://www.eltribuno.com"
@@ -30,7 +28,7 @@ class ElTribunoSaltaScraper(BaseScraper):
             print(f"📄 Scraping página {pagina}: {url_pagina}")
             
             try:
-                response = requests.get(url_pagina, headers=headers, timeout=10)
+                response = self._get(url_pagina, headers=headers, timeout=10)
                 response.raise_for_status()
                 soup = BeautifulSoup(response.text, "html.parser")
                 
@@ -43,6 +41,17 @@ class ElTribunoSaltaScraper(BaseScraper):
                     break
 
                 found_articles = False
+
+                # Descarga en paralelo los artículos nuevos de la página hasta la fecha límite
+                # (la fecha está en la URL)
+                urls_pagina = [urljoin(self.BASE_URL, link['href']) for link in article_links]
+                candidatos = [
+                    (url, self._fecha_desde_url(url)) for url in urls_pagina if url not in urls_vistas
+                ]
+                self._prefetch(
+                    self._hasta_fecha_limite([(url, fecha) for url, fecha in candidatos if fecha]),
+                    headers=headers, timeout=10
+                )
                 
                 for link in article_links:
                     try:
@@ -54,16 +63,12 @@ class ElTribunoSaltaScraper(BaseScraper):
                         urls_vistas.add(url)
                         
                         # Extrae la fecha del enlace
-                        # Formato: /policiales/2025-6-20-13-38-0-titulo-de-la-noticia
-                        date_match = re.search(r'/policiales/(\d{4})-(\d{1,2})-(\d{1,2})-\d{1,2}-\d{1,2}-\d{1,2}-', url)
-                        if not date_match:
+                        article_date = self._fecha_desde_url(url)
+                        if not article_date:
                             continue
-                            
-                        year, month, day = date_match.groups()
-                        article_date = datetime.date(int(year), int(month), int(day))
                         
                         # Si el artículo es anterior a la fecha límite, terminar
-                        if self.fecha_limite and article_date < self.fecha_limite:
+                        if self._fuera_de_fecha_limite(article_date):
                             print(f"📅 Se alcanzó la fecha límite ({self.fecha_limite}), finalizando búsqueda")
                             seguir = False
                             break
@@ -93,7 +98,7 @@ class ElTribunoSaltaScraper(BaseScraper):
                         # Scrapea la página individual del artículo para más detalles
                         try:
                             print(f"🔍 Scrapeando artículo: {url}")
-                            nota_resp = requests.get(url, headers=headers, timeout=10)
+                            nota_resp = self._get(url, headers=headers, timeout=10)
                             nota_resp.raise_for_status()
                             nota_soup = BeautifulSoup(nota_resp.text, "html.parser")
                             
@@ -113,9 +118,6 @@ class ElTribunoSaltaScraper(BaseScraper):
                             if self._guardar_noticia(db, noticia_data):
                                 noticias_guardadas += 1
                             
-                            # Espera entre requests de artículos individuales
-                            time.sleep(2)
-                            
                         except Exception as e:
                             print(f"❌ Error scraping artículo individual {url}: {str(e)}")
                             db.rollback()
@@ -129,7 +131,6 @@ class ElTribunoSaltaScraper(BaseScraper):
                     print(f"🤷 No se encontraron artículos válidos en la página {pagina}")
                 
                 pagina += 1
-                time.sleep(3)  # Espera entre páginas
                 
             except Exception as e:
                 print(f"❌ Error scraping El Tribuno Salta: {e}")
@@ -137,6 +138,18 @@ class ElTribunoSaltaScraper(BaseScraper):
                 
         return noticias_guardadas
 
+    @staticmethod
+    def _fecha_desde_url(url):
+        """Fecha del artículo desde su URL (formato /policiales/2025-6-20-13-38-0-titulo-de-la-noticia), o None."""
+        date_match = re.search(r'/policiales/(\d{4})-(\d{1,2})-(\d{1,2})-\d{1,2}-\d{1,2}-\d{1,2}-', url)
+        if not date_match:
+            return None
+        year, month, day = date_match.groups()
+        try:
+            return datetime.date(int(year), int(month), int(day))
+        except ValueError:
+            return None
+
     def _extract_content(self, soup):
         """Extrae el contenido limpio y el HTML crudo del artículo."""
         try:
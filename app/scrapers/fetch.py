@@ -0,0 +1,107 @@
+"""
+Capa de descarga compartida por todos los scrapers.
+
+Mantiene una única `requests.Session` con pools de conexiones keep-alive, un
+presupuesto de cortesía por dominio (intervalo mínimo entre requests al mismo
+host) y un descargador concurrente basado en asyncio acotado por host.
+"""
+import asyncio
+import os
+import threading
+import time
+from typing import Dict, Iterable
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+DEFAULT_TIMEOUT = 15
+
+# Requests simultáneos permitidos contra un mismo dominio
+MAX_POR_HOST = int(os.getenv("SCRAPER_MAX_POR_HOST", "4"))
+# Segundos mínimos entre el inicio de dos requests al mismo dominio
+INTERVALO_MINIMO = float(os.getenv("SCRAPER_INTERVALO_MINIMO", "0.5"))
+
+class PolitenessBudget:
+    """Reparte turnos por dominio para no superar un request cada `intervalo_minimo` segundos."""
+
+    def __init__(self, intervalo_minimo: float = INTERVALO_MINIMO):
+        self.intervalo_minimo = intervalo_minimo
+        self._proximo_turno: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def esperar(self, url: str):
+        host = urlparse(url).netloc
+        with self._lock:
+            ahora = time.monotonic()
+            turno = max(ahora, self._proximo_turno.get(host, 0.0))
+            self._proximo_turno[host] = turno + self.intervalo_minimo
+        if turno > ahora:
+            time.sleep(turno - ahora)
+
+class FetchEngine:
+    """Sesión HTTP reutilizable con reintentos, cortesía por dominio y descarga concurrente."""
+
+    def __init__(self, max_por_host: int = MAX_POR_HOST, intervalo_minimo: float = INTERVALO_MINIMO):
+        self.max_por_host = max_por_host
+        self.politeness = PolitenessBudget(intervalo_minimo)
+
+        self.session = requests.Session()
+        self.session.headers.update(DEFAULT_HEADERS)
+        retries = Retry(
+            total=2,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["GET"]),
+        )
+        adapter = HTTPAdapter(pool_connections=20, pool_maxsize=max_por_host, max_retries=retries)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+        self.politeness.esperar(url)
+        return self.session.request(method, url, **kwargs)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def fetch_all(self, urls: Iterable[str], **kwargs) -> Dict[str, object]:
+        """
+        Descarga varias URLs en paralelo (como máximo `max_por_host` a la vez por dominio).
+        Devuelve un diccionario url -> Response, o url -> Exception si la descarga falló.
+        """
+        return asyncio.run(self._fetch_all(list(dict.fromkeys(urls)), **kwargs))
+
+    async def _fetch_all(self, urls, **kwargs):
+        semaforos = {}
+
+        async def fetch(url):
+            host = urlparse(url).netloc
+            semaforo = semaforos.setdefault(host, asyncio.Semaphore(self.max_por_host))
+            async with semaforo:
+                try:
+                    return url, await asyncio.to_thread(self.get, url, **kwargs)
+                except Exception as e:
+                    return url, e
+
+        return dict(await asyncio.gather(*(fetch(url) for url in urls)))
+
+_engine = None
+_engine_lock = threading.Lock()
+
+def get_fetch_engine() -> FetchEngine:
+    """Devuelve el motor de descarga compartido por todo el proceso."""
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = FetchEngine()
+    return _engine
@@ -5,7 +5,6 @@ from bs4 import BeautifulSoup
 import datetime
 import re
 from urllib.parse import urljoin
-import time
 
 class InformateSaltaScraper(BaseScraper):
     BASE_URL = "https://informatesalta.com.ar"
@@ -34,13 +33,13 @@ class InformateSaltaScraper(BaseScraper):
                     # La primera página se obtiene con GET de la URL principal
                     url_pagina = self.POLICIALES_URL
                     print(f"📄 Scraping página 1: {url_pagina}")
-                    response = requests.get(url_pagina, headers=headers, timeout=15)
+                    response = self._get(url_pagina, headers=headers, timeout=15)
                 else:
                     # Las páginas siguientes se obtienen con GET al endpoint de paginación
                     print(f"📄 Scraping página {pagina} (AJAX GET)...")
                     # El parámetro es 'p', no 'pagina'
                     params = {'categoria': self.CATEGORY_ID, 'p': pagina}
-                    response = requests.get(self.AJAX_URL, headers=headers, params=params, timeout=15)
+                    response = self._get(self.AJAX_URL, headers=headers, params=params, timeout=15)
 
                 response.raise_for_status()
                 
@@ -65,6 +64,18 @@ class InformateSaltaScraper(BaseScraper):
                     break
 
                 found_articles_on_page = False
+
+                # Descarga en paralelo los artículos nuevos de la página
+                candidatos = []
+                for article in articles:
+                    link = article.find('a', class_='post__imagen')
+                    title_element = article.find('h2', class_='post__titulo')
+                    if not link or not link.get('href') or not title_element or not title_element.get_text().strip():
+                        continue
+                    url = urljoin(self.BASE_URL, link['href'])
+                    if url not in urls_vistas:
+                        candidatos.append((url, self._fecha_listado(article)))
+                self._prefetch(self._hasta_fecha_limite(candidatos), headers=headers, timeout=10)
                 
                 for article in articles:
                     try:
@@ -90,23 +101,14 @@ class InformateSaltaScraper(BaseScraper):
                             continue
                         
                         # Extraer fecha
-                        fecha_element = article.find('span', class_='post__fecha')
-                        if fecha_element:
-                            fecha_texto = fecha_element.get_text().strip()
-                            # Formato: DD/MM/YYYY
-                            try:
-                                day, month, year = map(int, fecha_texto.split('/'))
-                                article_date = datetime.date(year, month, day)
-                            except ValueError:
-                                # Si hay error en el formato, intentar otros o usar hoy
-                                print(f"⚠️  Formato de fecha no reconocido: '{fecha_texto}'. Usando fecha actual.")
-                                article_date = datetime.date.today()
-                        else:
-                            # Si no hay fecha, usar la de hoy y seguir
+                        article_date = self._fecha_listado(article)
+                        if article_date is None:
+                            # Si no hay fecha o no se reconoce el formato, usar la de hoy y seguir
+                            print(f"⚠️  Fecha no reconocida en el listado. Usando fecha actual.")
                             article_date = datetime.date.today()
                         
                         # Si el artículo es anterior a la fecha límite, terminar
-                        if self.fecha_limite and article_date < self.fecha_limite:
+                        if self._fuera_de_fecha_limite(article_date):
                             print(f"📅 Se alcanzó la fecha límite ({self.fecha_limite}), finalizando búsqueda.")
                             seguir = False
                             break
@@ -116,7 +118,7 @@ class InformateSaltaScraper(BaseScraper):
                         # Scrapea la página individual del artículo para más detalles
                         try:
                             print(f"🔍 Scrapeando artículo: {url}")
-                            nota_resp = requests.get(url, headers=headers, timeout=10)
+                            nota_resp = self._get(url, headers=headers, timeout=10)
                             nota_resp.raise_for_status()
                             nota_soup = BeautifulSoup(nota_resp.text, "html.parser")
                             
@@ -134,9 +136,6 @@ class InformateSaltaScraper(BaseScraper):
                             if self._guardar_noticia(db, noticia_data):
                                 noticias_guardadas += 1
                             
-                            # Espera entre requests de artículos individuales
-                            time.sleep(2)
-                            
                         except Exception as e:
                             print(f"❌ Error scraping artículo individual {url}: {str(e)}")
                             db.rollback()
@@ -154,7 +153,6 @@ class InformateSaltaScraper(BaseScraper):
                     break
                 
                 pagina += 1
-                time.sleep(3)  # Espera entre páginas
                 
             except requests.exceptions.RequestException as e:
                 print(f"❌ Error de red scraping Informate Salta (página {pagina}): {e}")
@@ -167,6 +165,18 @@ class InformateSaltaScraper(BaseScraper):
                 
         return noticias_guardadas
 
+    @staticmethod
+    def _fecha_listado(article):
+        """Fecha del artículo en el listado (formato DD/MM/YYYY), o None."""
+        fecha_element = article.find('span', class_='post__fecha')
+        if not fecha_element:
+            return None
+        try:
+            day, month, year = map(int, fecha_element.get_text().strip().split('/'))
+            return datetime.date(year, month, day)
+        except ValueError:
+            return None
+
     def _extract_content(self, soup):
         """Extrae el contenido limpio y el HTML crudo del artículo."""
         try:
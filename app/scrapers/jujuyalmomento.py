@@ -1,6 +1,5 @@
 import json
 from datetime import datetime
-import time
 import requests
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
@@ -54,6 +53,9 @@ class JujuyAlMomentoScraper(BaseScraper):
                 if not nuevas_urls:
                     print(f"🤷 No se encontraron más artículos nuevos en la página {pagina}, finalizando.")
                     break
+
+                # Descarga en paralelo los artículos nuevos de la página
+                self._prefetch(nuevas_urls, headers={'User-Agent': 'Mozilla/5.0'}, timeout=15)
                 
                 for url in nuevas_urls:
                     if url in urls_vistas:
@@ -79,10 +81,7 @@ class JujuyAlMomentoScraper(BaseScraper):
                     if self._guardar_noticia(db, datos_articulo):
                         noticias_guardadas += 1
 
-                    time.sleep(1)
-
                 pagina += 1
-                time.sleep(2)
 
             except Exception as e:
                 print(f"❌ Error en la página {pagina}: {e}")
@@ -93,7 +92,7 @@ class JujuyAlMomentoScraper(BaseScraper):
 
     def _get_page_content(self, url: str):
         try:
-            response = requests.get(url, headers={'User-Agent': 'Mozilla/5.0'}, timeout=15)
+            response = self._get(url, headers={'User-Agent': 'Mozilla/5.0'}, timeout=15)
             response.raise_for_status()
             return response.text
         except requests.RequestException as e:
@@ -202,6 +201,8 @@ class JujuyAlMomentoTagScraper(BaseScraper):
                 if not nuevas_urls:
                     print(f"🤷 No se encontraron más artículos nuevos en la página {pagina}, finalizando etiqueta '{tag}'.")
                     break
+                # Descarga en paralelo los artículos nuevos de la página
+                self._prefetch(nuevas_urls, headers={'User-Agent': 'Mozilla/5.0'}, timeout=15)
                 for url in nuevas_urls:
                     if url in urls_vistas:
                         continue
@@ -219,9 +220,7 @@ class JujuyAlMomentoTagScraper(BaseScraper):
                     datos_articulo['media_name'] = self.media_name
                     if self._guardar_noticia(db, datos_articulo):
                         noticias_guardadas += 1
-                    time.sleep(1)
                 pagina += 1
-                time.sleep(2)
             except Exception as e:
                 print(f"❌ Error en la página {pagina} de '{tag}': {e}")
                 break
@@ -229,7 +228,7 @@ class JujuyAlMomentoTagScraper(BaseScraper):
 
     def _get_page_content(self, url: str):
         try:
-            response = requests.get(url, headers={'User-Agent': 'Mozilla/5.0'}, timeout=15)
+            response = self._get(url, headers={'User-Agent': 'Mozilla/5.0'}, timeout=15)
             response.raise_for_status()
             return response.text
         except requests.RequestException as e:
@@ -1,7 +1,5 @@
 import json
 from datetime import datetime
-import time
-import requests
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
 from app.scrapers.base import BaseScraper
@@ -25,7 +23,7 @@ class JujuyDiceScraper(BaseScraper):
             print(f"📄 Procesando página {pagina}: {url_pagina}")
             
             try:
-                response = requests.get(url_pagina, headers={'User-Agent': 'Mozilla/5.0'}, timeout=15)
+                response = self._get(url_pagina, headers={'User-Agent': 'Mozilla/5.0'}, timeout=15)
                 response.raise_for_status()
                 
                 soup = BeautifulSoup(response.text, "html.parser")
@@ -41,6 +39,19 @@ class JujuyDiceScraper(BaseScraper):
                 
                 articulos_procesados = 0
                 articulos_antiguos = 0
+
+                # Descarga en paralelo los artículos nuevos de la página
+                # (se omiten los que la fecha del listado ya deja fuera de la fecha límite)
+                urls_pagina = []
+                for articulo in articulos:
+                    encabezado = articulo.find("h2", class_="h2")
+                    link = encabezado.find("a") if encabezado else None
+                    if not link or not link.get("href"):
+                        continue
+                    url = urljoin(self.base_url, link.get("href"))
+                    if url not in urls_vistas and not self._fuera_de_fecha_limite(self._fecha_listado(articulo)):
+                        urls_pagina.append(url)
+                self._prefetch(urls_pagina, headers={'User-Agent': 'Mozilla/5.0'}, timeout=15)
                 
                 for articulo in articulos:
                     try:
@@ -65,9 +76,7 @@ class JujuyDiceScraper(BaseScraper):
                             titulo = titulo_element.get_text(strip=True) if titulo_element else ""
                         if not fecha_articulo:
                             # Fallback: usar la fecha de la lista
-                            fecha_element = articulo.find("span", class_="fecha")
-                            fecha_texto = fecha_element.get_text(strip=True).replace(".", "") if fecha_element else ""
-                            fecha_articulo = self._parsear_fecha(fecha_texto)
+                            fecha_articulo = self._fecha_listado(articulo)
                         if not contenido:
                             contenido = ""
                         if not titulo or not fecha_articulo:
@@ -101,13 +110,18 @@ class JujuyDiceScraper(BaseScraper):
                     print(f"🛑 No se procesaron artículos en la página {pagina}, deteniendo")
                     break
                 pagina += 1
-                time.sleep(1)
             except Exception as e:
                 print(f"❌ Error procesando página {pagina}: {e}")
                 break
         print(f"🎉 Scraping completado. Se guardaron {noticias_guardadas} noticias.")
         return noticias_guardadas
 
+    def _fecha_listado(self, articulo):
+        """Fecha del artículo en el listado (span.fecha), o None."""
+        fecha_element = articulo.find("span", class_="fecha")
+        fecha_texto = fecha_element.get_text(strip=True).replace(".", "") if fecha_element else ""
+        return self._parsear_fecha(fecha_texto)
+
     def _parsear_fecha(self, fecha_texto):
         """Parsea la fecha del formato DD/MM/YYYY"""
         try:
@@ -120,7 +134,7 @@ class JujuyDiceScraper(BaseScraper):
     def _extraer_contenido_articulo(self, url_articulo):
         """Extrae el contenido completo de un artículo individual"""
         try:
-            response = requests.get(url_articulo, headers={'User-Agent': 'Mozilla/5.0'}, timeout=15)
+            response = self._get(url_articulo, headers={'User-Agent': 'Mozilla/5.0'}, timeout=15)
             response.raise_for_status()
             soup = BeautifulSoup(response.text, "html.parser")
 
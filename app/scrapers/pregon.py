@@ -1,11 +1,8 @@
 import json
 from datetime import datetime
-import time
-import requests
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
 from app.scrapers.base import BaseScraper
-from app.db import Noticia
 
 class PregonScraper(BaseScraper):
     def __init__(self, fecha_limite=None):
@@ -22,12 +19,15 @@ class PregonScraper(BaseScraper):
         
         # Obtener la página inicial
         try:
-            response = requests.get(self.seccion_url, headers={'User-Agent': 'Mozilla/5.0'}, timeout=15)
+            response = self._get(self.seccion_url, headers={'User-Agent': 'Mozilla/5.0'}, timeout=15)
             response.raise_for_status()
             soup = BeautifulSoup(response.text, "html.parser")
             
             # Extraer URLs de artículos de la página inicial
             urls_articulos = self._extraer_urls_articulos(soup)
+
+            # Descarga en paralelo los artículos de la página inicial
+            self._prefetch(urls_articulos, headers={'User-Agent': 'Mozilla/5.0'}, timeout=15)
             
             # Procesar cada artículo inicial
             for url_articulo in urls_articulos:
@@ -43,11 +43,6 @@ class PregonScraper(BaseScraper):
                 if contenido_articulo:
                     titulo, contenido, fecha_articulo, contenido_crudo = contenido_articulo
                     
-                    # Verificar si ya existe en la base de datos
-                    if db.query(Noticia).filter(Noticia.url == url_articulo).first():
-                        print(f"⏭️ Artículo ya existe: {titulo[:50]}...")
-                        continue
-                    
                     # Verificar fecha límite
                     if self.fecha_limite and fecha_articulo and fecha_articulo.date() < self.fecha_limite:
                         print(f"📅 Artículo muy antiguo ({fecha_articulo.date()}), deteniendo scraping")
@@ -66,8 +61,6 @@ class PregonScraper(BaseScraper):
                     if self._guardar_noticia(db, noticia_data):
                         noticias_guardadas += 1
                 
-                time.sleep(1)  # Pausa entre requests
-            
             # Usar el método "Ver Más" para cargar artículos más antiguos
             noticias_adicionales = self._cargar_mas_articulos_vermas(db, urls_vistas)
             noticias_guardadas += noticias_adicionales
@@ -75,7 +68,7 @@ class PregonScraper(BaseScraper):
         except Exception as e:
             print(f"❌ Error en scraping inicial: {e}")
         
-        print(f"✅ Scraping completado. Total de noticias guardadas: {noticias_guardadas}")
+        print(f"✅ Scraping completado. Total de noticias encoladas: {noticias_guardadas}")
         return noticias_guardadas
 
     def _extraer_urls_articulos(self, soup):
@@ -98,7 +91,7 @@ class PregonScraper(BaseScraper):
     def _extraer_contenido_articulo(self, url_articulo):
         """Extrae el contenido completo de un artículo individual"""
         try:
-            response = requests.get(url_articulo, headers={'User-Agent': 'Mozilla/5.0'}, timeout=15)
+            response = self._get(url_articulo, headers={'User-Agent': 'Mozilla/5.0'}, timeout=15)
             response.raise_for_status()
             soup = BeautifulSoup(response.text, "html.parser")
 
@@ -179,7 +172,7 @@ class PregonScraper(BaseScraper):
                     
                     print(f"📤 Solicitando página {page} con {len(content_ids)} IDs existentes")
                     
-                    response = requests.post(self.ajax_endpoint, json=data, headers=headers, timeout=15)
+                    response = self._post(self.ajax_endpoint, json=data, headers=headers, timeout=15)
                     response.raise_for_status()
                     
                     json_data = response.json()
@@ -195,6 +188,12 @@ class PregonScraper(BaseScraper):
                         
                         print(f"📰 Encontrados {len(nuevos_ids_a_procesar)} nuevos artículos para procesar.")
                         
+                        # Descarga en paralelo los artículos del lote que no se procesaron antes
+                        # (la API sólo devuelve ids: la fecha se conoce recién en el artículo)
+                        urls_lote = [f"https://www.pregon.com.ar/nota/{contenido_id}/" for contenido_id in nuevos_ids_a_procesar]
+                        self._prefetch([url for url in urls_lote if url not in urls_vistas],
+                                       headers={'User-Agent': 'Mozilla/5.0'}, timeout=15)
+
                         detener_por_fecha = False
                         for contenido_id in nuevos_ids_a_procesar:
                             # La API no devuelve la URL completa, hay que construirla
@@ -229,8 +228,6 @@ class PregonScraper(BaseScraper):
                                 if self._guardar_noticia(db, noticia_data):
                                     noticias_adicionales += 1
 
-                            time.sleep(1)
-
                         if detener_por_fecha:
                             print("🛑 Deteniendo scraping por fecha límite.")
                             return noticias_adicionales
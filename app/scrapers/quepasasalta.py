@@ -5,7 +5,6 @@ from bs4 import BeautifulSoup
 import datetime
 import re
 from urllib.parse import urljoin
-import time
 import json
 
 class QuePasaSaltaScraper(BaseScraper):
@@ -37,7 +36,7 @@ class QuePasaSaltaScraper(BaseScraper):
                     # La primera página se obtiene con GET de la URL principal
                     url_pagina = self.POLICIALES_URL
                     print(f"📄 Scraping página 1: {url_pagina}")
-                    response = requests.get(url_pagina, headers=headers, timeout=15)
+                    response = self._get(url_pagina, headers=headers, timeout=15)
                 else:
                     # Las páginas siguientes se obtienen con POST al endpoint AJAX
                     print(f"📄 Scraping página {pagina} (AJAX POST)...")
@@ -50,7 +49,7 @@ class QuePasaSaltaScraper(BaseScraper):
                         'pieceProperties': 'YUZobW1nQUM2MWM2ZVpodENXSlZyM2tMTU13TFNLSlBaaW5XYlJ4dFg3NG1UeXpLWFZyc1ZTOCt6bTVISVVpclpVVXAzMXdFK2xSbU5jQjJBR2NTckRwZktJNVdGL3NGT242VmJsTXJUZU5pRVcvU0dFWG1WQ2wxM0haQUtoem9LVWhwbkVnQnFBUTdPNUErVER0THB6aFNKOHNaV1BsUUkybkphbGR3SExnNkhIM0JBUUM5RHpwemh6MVZhUW5qYVExZ2xRdEx2Ujk0T0lCeVNXNE05R1FaZnBVZFhPa1RJM25NZmhScEcrY3hUQ2ZJUmgybEgzcDV6R2xWSlZIMkpsWnNuVm9hb0FobWZzbCtVamNQb3lGRU1zaEdIYVVmTkh6VmIxVTNINzl3WEhiY1VRN3JTblF1MXk0Yk9RVDVkMWgzaWgxWTkwMDRmWlFrU2pzRHRDWlVKcEZXQ2YxSVAzMlJMUVp4QStWaUdIWGJHbGl0QW04MXdHTkNQVkNvZmhJMHdSMU01VVo1TFpFakNDd1I1R0ZhTVlkY0NLMUhZV25ZTXcwN1F2UnVWQytaQ1FhcUhpd2p5MnNMT2x1bkxoOTdnbGhMcEJrMUxzcHRDM3dVNzI4Vll0RVFDL1pDWmpYVWVWTTZCcmh4VzNQTUZRL2lReTV0MkhJWk5BSHVLQTRqanhVZTRrTm5kNDhpWFhwTDRDNUFldG9BRXEwWmN5aWNLd3h4V09GNEdUZVRTUXI5WGp4KzMyVVVlRTc4TGxvdmlVOUU3bFE3TFpvNFdqSkErMkFGZXRsZUQ2RkxPMkhWYVFOcUY3UTVTQ2FXQUJMdldESW96VHNDT3h5bmJFOS95MTFGb0Y1bU5wcHZEVHdNNldKUllZeFZETGdNT25uV2VBd2xUTzg5RkhiTkdFS2xRbjBzMFRaZWV4dWdaUWdoa1RoVXBSUWtNTXhpVnpBYnN5UkRKcEVFVTZBRFlYUFdZbElpU3VSd0hHL0JEUWF6VW1ob3h6RVRjd0tzTmxZK2d3Y2RxVVY3SWMwc1VqOUl2VE5NTzRBTkFhNUFhRCtMWlVVdFYvVWdReU9XQzFEbUNDNTEyaWRQTmszaU13b3BpMG9jckJrcmI5OGtSU3BLNXlBVWI4SmREck5ST0dESE1rTjdBcTltWGo2QVZ4V3BSblV1Mm53Q04waStZVmdsMDBRZjRGNHRjWXQ4QkRaUnZ6ME1jNW9XQXJGTk15ZVNMaGg1QWZac0dIT2ZYRXIzUUM5d3dub0RhMUdrWkE1em53MFpyeHN2Y01KNkZ6UkdwV1FPZDV4SUZlQkJLWHVFSUY0c0JPZzZSV1dBV3gvcFJTODkwalpmTEFMb2JCbzF5aFVPNkJRaE5NcG5WMmtQK0RZYmE1VlZWYVFETkNiVVpsTi9BdlFuRm0zV1YxS21CMjF3a2owY1pWZmxKbGRrMzE1U3FVNHdOc2c4QkNRUXZtTkJmZHRVWDZWZElUclhKQWNvSEtvMkdTeVFBd0drSGk1MnpYb1VkRTNvSWt3OWtGb2U5MDAvY0lRa0h5aFUvUzRmWk5GUUh2Y2VQbithZXg4blV1cHNUajJFQkNuL0NXMUZtaWhNSTFMbU8wbzJrZ0FrNGdVd0ZKSjlVM0FIb0RZZWRNa05jUHNRUGtQS1BGbHdCL00zRVdxV0RYSHpCMzRZQUdrTlJ3L2tZU0o3eGw1c1lRdGtUZ0pxV2xGQjhUUnplb0lVT21zRkpCaFFkZzVDUUtCOUxUWFNIaTVxVkcwVVcyNGVTQmZwYlhJazJVOGtlVlU0Vnc0OFYxQkt2Q1UxTDlKY01uMWZQVk1PTDBoUVM3c3BKQ0xVV0RCNlhXMEtXR3dMSDFIdUtTUWkxRnN3YVZ3MVZSNHZHeDBZOW1oK2FwTkNQSHBLSTFzZkp3MFFBLzU4WldhTVJqOTJSbndLUUh3RlIxMy9LREEwbTE1bklRUnNWeEYwWEZnT3FqRTlZTmtVYW5VZExsdEVMVmhTRHFwb2FXRExIWGR5SDNnRkFYWUZERnFkWkc0MitJdHJJUUt4V2hZNEVFd05pMlFwWS8rVE9YbFc1MUFOUHhaTUU1cGxkaU9naUQ0dkJMSVBIRDVIVkJqVEpERnN1cEIvZFZ2eEdGZGdVRjBKem5JMU91eUNJbVZhdUFBVk0wbEdBTlFvSVNMdjNXTndSLzhRRlNSYkd4WFZlU0JtNzR0NWVrci9IQmMrVGhwRWhqMGdjN3llZXpVRjl4aFpZQjlCQWNnbmV5TzgxU01xV3FGQ1RYaE9EMC9aZEMwbjY1b3hkMHFyQkUxb1ZoWlUwU1I2TmFqQ2Fqa05wd2xjTDBFSVJjRjdLaWVnbkhwbUdiNUJGU01WUkVMU2ZDbzJ0NDkxTHdIcUIwcGdEa1pYem1kOFl2V0piMmhiczAwYlBoUkdVOFZnS1NHMnd5eHBYL0lYR21WQ0VrT01PMkltcnNZdE9CSDhEMVowQUJFY21uTXJMYXFMZkhSUDd4VVZPRWtKUU05ck1pbjFobkZoVVBWTFVHRllCUm5PUEd4NHBzOXBQUVM3U3dadFdRVWZ6bUoySmYrQmVEQmE1QnhaTzFSTUI1STNPSFh6aFc4cFhyNGNFMjVEVVJyUk1Hc3I0b1ErTVZYaFhWUWpDa2xiaTJnbFBxbUFMejFDc1JVZkxsTldCSmcyTlhEeDJHWnJYYXRjV20xWlcxTEtQRGczcVpGK0tnU3pSVmsrVUZsRTJqNDhNNm1DY21NYzV4Wk9kQjVhV3RGcWVHR2lnbjhwSEtBUFFIbFFTVkdZS0N3MXVzTnFKaEQ1U0VoMUUxOFBqbTUvTDY2T08ycE8$'
                     }
                     
-                    response = requests.post(self.AJAX_URL, headers=headers, data=payload, timeout=15)
+                    response = self._post(self.AJAX_URL, headers=headers, data=payload, timeout=15)
 
                 response.raise_for_status()
                 
@@ -82,6 +81,19 @@ class QuePasaSaltaScraper(BaseScraper):
                     break
 
                 found_articles_on_page = False
+
+                # Descarga en paralelo los artículos nuevos de la página
+                # (la fecha de cada uno se lee una vez y se reutiliza abajo)
+                fechas_listado = {}
+                for article in articles:
+                    link = article.find('a', href=True)
+                    if not link or not self._titulo_listado(article):
+                        continue
+                    url = urljoin(self.BASE_URL, link['href'])
+                    if url not in urls_vistas and any(pattern in url for pattern in ['/nota/', '/articulo/', '/policiales/']):
+                        if url not in fechas_listado:
+                            fechas_listado[url] = self._fecha_listado(article)
+                self._prefetch(self._hasta_fecha_limite(list(fechas_listado.items())), headers=headers, timeout=10)
                 
                 for article in articles:
                     try:
@@ -102,30 +114,15 @@ class QuePasaSaltaScraper(BaseScraper):
                         urls_vistas.add(url)
                         
                         # Extraer título
-                        title_element = article.find(['h1', 'h2', 'h3', 'h4'], class_=re.compile(r'(titulo|title)'))
-                        if not title_element:
-                            # Fallback: buscar cualquier elemento de título
-                            title_element = article.find(['h1', 'h2', 'h3', 'h4'])
-                        
-                        if not title_element:
-                            continue
-                            
-                        titulo = title_element.get_text().strip()
+                        titulo = self._titulo_listado(article)
                         if not titulo:
                             continue
                         
                         # Extraer fecha
-                        fecha_element = article.find(['span', 'time', 'div'], class_=re.compile(r'(fecha|date|time)'))
-                        if fecha_element:
-                            fecha_texto = fecha_element.get_text().strip()
-                            # Intentar diferentes formatos de fecha
-                            article_date = self._parse_date(fecha_texto)
-                        else:
-                            # Si no hay fecha, usar la de hoy y seguir
-                            article_date = datetime.date.today()
+                        article_date = fechas_listado[url]
                         
                         # Si el artículo es anterior a la fecha límite, terminar
-                        if self.fecha_limite and article_date < self.fecha_limite:
+                        if self._fuera_de_fecha_limite(article_date):
                             print(f"📅 Se alcanzó la fecha límite ({self.fecha_limite}), finalizando búsqueda.")
                             seguir = False
                             break
@@ -135,7 +132,7 @@ class QuePasaSaltaScraper(BaseScraper):
                         # Scrapea la página individual del artículo para más detalles
                         try:
                             print(f"🔍 Scrapeando artículo: {url}")
-                            nota_resp = requests.get(url, headers=headers, timeout=10)
+                            nota_resp = self._get(url, headers=headers, timeout=10)
                             nota_resp.raise_for_status()
                             nota_soup = BeautifulSoup(nota_resp.text, "html.parser")
                             
@@ -153,9 +150,6 @@ class QuePasaSaltaScraper(BaseScraper):
                             if self._guardar_noticia(db, noticia_data):
                                 noticias_guardadas += 1
                             
-                            # Espera entre requests de artículos individuales
-                            time.sleep(2)
-                            
                         except Exception as e:
                             print(f"❌ Error scraping artículo individual {url}: {str(e)}")
                             continue
@@ -172,7 +166,6 @@ class QuePasaSaltaScraper(BaseScraper):
                     break
                 
                 pagina += 1
-                time.sleep(3)  # Espera entre páginas
                 
             except requests.exceptions.RequestException as e:
                 print(f"❌ Error de red scraping Que Pasa Salta (página {pagina}): {e}")
@@ -185,6 +178,23 @@ class QuePasaSaltaScraper(BaseScraper):
                 
         return noticias_guardadas
 
+    @staticmethod
+    def _titulo_listado(article) -> str:
+        """Título del artículo en el listado, o cadena vacía."""
+        title_element = article.find(['h1', 'h2', 'h3', 'h4'], class_=re.compile(r'(titulo|title)'))
+        if not title_element:
+            # Fallback: buscar cualquier elemento de título
+            title_element = article.find(['h1', 'h2', 'h3', 'h4'])
+        return title_element.get_text().strip() if title_element else ""
+
+    def _fecha_listado(self, article):
+        """Fecha del artículo en el listado; si no hay, la de hoy."""
+        fecha_element = article.find(['span', 'time', 'div'], class_=re.compile(r'(fecha|date|time)'))
+        if fecha_element:
+            # Intentar diferentes formatos de fecha
+            return self._parse_date(fecha_element.get_text().strip())
+        return datetime.date.today()
+
     def _parse_date(self, fecha_texto):
         """Parsea diferentes formatos de fecha."""
         try:
@@ -1,10 +1,8 @@
 from .base import BaseScraper
-import requests
 from bs4 import BeautifulSoup
 import datetime
 import re
 from urllib.parse import urljoin
-import time
 import json
 
 class SomosJujuyScraper(BaseScraper):
@@ -31,7 +29,7 @@ class SomosJujuyScraper(BaseScraper):
             print(f"📄 Scraping página {pagina}: {url_pagina}")
 
             try:
-                response = requests.get(url_pagina, headers=headers, timeout=10)
+                response = self._get(url_pagina, headers=headers, timeout=10)
                 response.raise_for_status()
 
                 if response.text == last_page_content:
@@ -56,12 +54,18 @@ class SomosJujuyScraper(BaseScraper):
                     print(f"🤷 No se encontraron más artículos en la página {pagina}")
                     break
 
+                # Descarga en paralelo los artículos de la página
+                self._prefetch(
+                    [urljoin(self.BASE_URL, link['href']) for link in links_filtrados],
+                    headers=headers, timeout=10
+                )
+
                 for link in links_filtrados:
                     try:
                         url_articulo = urljoin(self.BASE_URL, link['href'])
                         
                         print(f"🔍 Scrapeando artículo: {url_articulo}")
-                        nota_resp = requests.get(url_articulo, headers=headers, timeout=10)
+                        nota_resp = self._get(url_articulo, headers=headers, timeout=10)
                         nota_resp.raise_for_status()
                         nota_soup = BeautifulSoup(nota_resp.text, "html.parser")
 
@@ -100,8 +104,6 @@ class SomosJujuyScraper(BaseScraper):
                         if self._guardar_noticia(db, noticia_data):
                             noticias_guardadas += 1
                         
-                        time.sleep(2)
-
                     except Exception as e:
                         print(f"❌ Error procesando artículo: {str(e)}")
                         continue
@@ -110,7 +112,6 @@ class SomosJujuyScraper(BaseScraper):
                     break
 
                 pagina += 1
-                time.sleep(3)
 
             except Exception as e:
                 print(f"❌ Error scraping SomosJujuy: {e}")
@@ -1,11 +1,9 @@
 from .base import BaseScraper
 from typing import List, Dict
-import requests
 from bs4 import BeautifulSoup
 import datetime
 import re
 from urllib.parse import urljoin
-import time
 
 class TodoJujuyScraper(BaseScraper):
     BASE_URL = "https://www.todojujuy.com"
@@ -29,7 +27,7 @@ class TodoJujuyScraper(BaseScraper):
             print(f"📄 Scraping página {pagina}: {url_pagina}")
             
             try:
-                response = requests.get(url_pagina, headers=headers, timeout=10)
+                response = self._get(url_pagina, headers=headers, timeout=10)
                 response.raise_for_status()
                 soup = BeautifulSoup(response.text, "html.parser")
                 
@@ -42,6 +40,13 @@ class TodoJujuyScraper(BaseScraper):
                     break
 
                 found_articles = False
+
+                # Descarga en paralelo los artículos de la página
+                # (la fecha sólo está en el artículo: se omiten los enlaces sin título)
+                self._prefetch(
+                    [urljoin(self.BASE_URL, link['href']) for link in article_links if self._titulo_enlace(link)],
+                    headers=headers, timeout=10
+                )
                 
                 for link in article_links:
                     try:
@@ -57,20 +62,14 @@ class TodoJujuyScraper(BaseScraper):
                         found_articles = True
                         
                         # Obtiene el título del enlace
-                        titulo = link.get_text().strip()
-                        if not titulo:
-                            # Si no hay texto en el enlace, busca en elementos hijos
-                            title_element = link.find('h2') or link.find('h3') or link.find(class_='title')
-                            if title_element:
-                                titulo = title_element.get_text().strip()
-                        
+                        titulo = self._titulo_enlace(link)
                         if not titulo:
                             continue
                         
                         # Scrapea la página individual del artículo para más detalles
                         try:
                             print(f"🔍 Scrapeando artículo: {url}")
-                            nota_resp = requests.get(url, headers=headers, timeout=10)
+                            nota_resp = self._get(url, headers=headers, timeout=10)
                             nota_resp.raise_for_status()
                             nota_soup = BeautifulSoup(nota_resp.text, "html.parser")
                             
@@ -101,9 +100,6 @@ class TodoJujuyScraper(BaseScraper):
                             if self._guardar_noticia(db, noticia_data):
                                 noticias_guardadas += 1
                             
-                            # Espera entre requests de artículos individuales
-                            time.sleep(2)
-                            
                         except Exception as e:
                             print(f"❌ Error scraping artículo individual {url}: {str(e)}")
                             db.rollback()
@@ -117,7 +113,6 @@ class TodoJujuyScraper(BaseScraper):
                     print(f"🤷 No se encontraron artículos válidos en la página {pagina}")
                 
                 pagina += 1
-                time.sleep(3)  # Espera entre páginas
                 
             except Exception as e:
                 print(f"❌ Error scraping TodoJujuy: {e}")
@@ -125,6 +120,16 @@ class TodoJujuyScraper(BaseScraper):
                 
         return noticias_guardadas
     
+    @staticmethod
+    def _titulo_enlace(link) -> str:
+        """Título del enlace del listado; si el enlace no tiene texto, busca en elementos hijos."""
+        titulo = link.get_text().strip()
+        if not titulo:
+            title_element = link.find('h2') or link.find('h3') or link.find(class_='title')
+            if title_element:
+                titulo = title_element.get_text().strip()
+        return titulo
+
     def _extract_title(self, soup, fallback_title):
         """Extrae el título del artículo desde el HTML"""
         try:
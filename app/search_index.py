@@ -0,0 +1,235 @@
+"""
+Índice invertido en memoria con ranking BM25 para la búsqueda de noticias.
+
+Alternativa al índice FULLTEXT para instalaciones donde no se puede modificar
+la base. Se activa con SEARCH_BACKEND=bm25: se construye en segundo plano al
+iniciar la API y el mismo hilo lo actualiza de forma incremental con las
+noticias nuevas (ids mayores al último indexado) cada BM25_REFRESH_SECONDS, sin
+demorar ninguna búsqueda.
+
+Solo se agregan noticias nuevas: las noticias editadas conservan el texto con
+que se indexaron y las borradas siguen en el índice (la búsqueda las descarta
+al no encontrarlas en la base). Después de editar o borrar noticias hay que
+reiniciar la API para reconstruir el índice.
+
+Los tokens se pasan a minúsculas, se les quitan los acentos y se reducen con el
+mismo stemmer Snowball que usan los clasificadores, de modo que "choque",
+"choques" y "CHOQUÉ" caen en el mismo término.
+"""
+import math
+import os
+import sys
+import threading
+import time
+import unicodedata
+from array import array
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import select
+
+from app.db import SessionLocal, Noticia
+from app.nlp import get_stopwords
+from app.classifiers.preprocessing import TOKEN_RE, stem
+
+SEARCH_BACKEND = os.getenv("SEARCH_BACKEND", "sql")
+BM25_REFRESH_SECONDS = float(os.getenv("BM25_REFRESH_SECONDS", "30"))
+
+# Parámetros habituales de BM25
+BM25_K1 = 1.5
+BM25_B = 0.75
+# Las palabras del título cuentan doble
+PESO_TITULO = 2
+
+def plegar_acentos(texto: str) -> str:
+    """Quita tildes y diéresis (la ñ pasa a n): 'colisión' -> 'colision'."""
+    descompuesto = unicodedata.normalize("NFKD", texto)
+    return "".join(c for c in descompuesto if not unicodedata.combining(c))
+
+@lru_cache(maxsize=1)
+def _stopwords_plegadas() -> frozenset:
+    return frozenset(plegar_acentos(palabra) for palabra in get_stopwords())
+
+@lru_cache(maxsize=200000)
+def _termino(token: str) -> Optional[str]:
+    """Término de un token ya en minúsculas, o None si es stopword (memoizado por token)."""
+    plegado = plegar_acentos(token)
+    if plegado in _stopwords_plegadas():
+        return None
+    return stem(plegado)
+
+def tokenizar(texto: str) -> List[str]:
+    """Términos indexables de un texto: sin acentos, sin stopwords y con stemming."""
+    return [termino for termino in map(_termino, TOKEN_RE.findall(texto.lower())) if termino]
+
+class IndiceBM25:
+    """
+    Índice invertido compacto: para cada término guarda dos arreglos paralelos
+    (posición interna del documento, frecuencia). Las posiciones internas son
+    consecutivas y se mapean a ids de noticia con `_ids`, lo que permite puntuar
+    una consulta con operaciones vectorizadas de NumPy.
+    """
+
+    def __init__(self, k1: float = BM25_K1, b: float = BM25_B):
+        self.k1 = k1
+        self.b = b
+        self._postings: Dict[str, Tuple[array, array]] = {}
+        self._ids = array("i")
+        self._largos = array("I")
+        self._largo_total = 0
+        self._ultimo_id = 0
+        # Normalización por largo de documento, se recalcula solo si cambia el índice
+        self._normalizacion = None
+        self._lock = threading.RLock()
+        self._lock_refresco = threading.Lock()
+        self.listo = False
+        self.segundos_construccion = None
+
+    def __len__(self):
+        return len(self._ids)
+
+    def agregar(self, noticia_id: int, titulo: str, contenido: str):
+        """Indexa una noticia (los ids deben llegar en orden creciente)."""
+        frecuencias: Dict[str, int] = {}
+        for termino in tokenizar(titulo):
+            frecuencias[termino] = frecuencias.get(termino, 0) + PESO_TITULO
+        for termino in tokenizar(contenido):
+            frecuencias[termino] = frecuencias.get(termino, 0) + 1
+
+        with self._lock:
+            posicion = len(self._ids)
+            self._ids.append(noticia_id)
+            largo = sum(frecuencias.values())
+            self._largos.append(largo)
+            self._largo_total += largo
+            self._normalizacion = None
+            self._ultimo_id = max(self._ultimo_id, noticia_id)
+            for termino, frecuencia in frecuencias.items():
+                posting = self._postings.get(termino)
+                if posting is None:
+                    posting = self._postings[termino] = (array("I"), array("I"))
+                posting[0].append(posicion)
+                posting[1].append(frecuencia)
+
+    def actualizar(self, lote: int = 500) -> int:
+        """Indexa las noticias con id mayor al último indexado. Devuelve cuántas agregó."""
+        db = SessionLocal()
+        agregadas = 0
+        try:
+            consulta = (
+                select(Noticia.id, Noticia.titulo, Noticia.contenido)
+                .where(Noticia.id > self._ultimo_id)
+                .order_by(Noticia.id)
+                .execution_options(yield_per=lote)
+            )
+            for noticia_id, titulo, contenido in db.execute(consulta):
+                self.agregar(noticia_id, titulo or "", contenido or "")
+                agregadas += 1
+        finally:
+            db.close()
+        return agregadas
+
+    def construir(self) -> int:
+        """Indexa todo el archivo de noticias y marca el índice como listo."""
+        inicio = time.time()
+        print("🔄 Construyendo índice BM25 de noticias...")
+        with self._lock_refresco:
+            agregadas = self.actualizar()
+        self.segundos_construccion = time.time() - inicio
+        self.listo = True
+        print(f"✅ Índice BM25 listo: {agregadas} noticias en {self.segundos_construccion:.2f} segundos")
+        return agregadas
+
+    def mantener_actualizado(self):
+        """Construye el índice y luego incorpora las noticias nuevas cada BM25_REFRESH_SECONDS."""
+        self.construir()
+        while True:
+            time.sleep(BM25_REFRESH_SECONDS)
+            try:
+                with self._lock_refresco:
+                    agregadas = self.actualizar()
+                if agregadas:
+                    print(f"🔄 Índice BM25: {agregadas} noticias nuevas")
+            except Exception as e:
+                # Un error de la base no detiene el hilo: se reintenta en el próximo intervalo
+                print(f"⚠️  No se pudo actualizar el índice BM25: {e}")
+
+    def buscar(self, consulta: str, limite: int = 10) -> List[Tuple[int, float]]:
+        """Devuelve hasta `limite` pares (id de noticia, puntaje BM25) ordenados por puntaje."""
+        terminos = set(tokenizar(consulta))
+        if not terminos:
+            return []
+        with self._lock:
+            # Las vistas de NumPy sobre los arreglos deben liberarse antes de soltar
+            # el lock: un arreglo con vistas vivas no puede crecer en `agregar`
+            return self._puntuar(terminos, limite)
+
+    def _puntuar(self, terminos, limite: int) -> List[Tuple[int, float]]:
+        total_docs = len(self._ids)
+        if total_docs == 0:
+            return []
+        if self._normalizacion is None:
+            largos = np.frombuffer(self._largos, dtype=np.uint32, count=total_docs).astype(np.float32)
+            promedio = self._largo_total / total_docs
+            self._normalizacion = self.k1 * (1 - self.b + self.b * largos / promedio)
+        normalizacion = self._normalizacion
+
+        puntajes = np.zeros(total_docs, dtype=np.float32)
+        for termino in terminos:
+            posting = self._postings.get(termino)
+            if posting is None:
+                continue
+            posiciones = np.frombuffer(posting[0], dtype=np.uint32)
+            frecuencias = np.frombuffer(posting[1], dtype=np.uint32).astype(np.float32)
+            df = len(posiciones)
+            idf = math.log(1 + (total_docs - df + 0.5) / (df + 0.5))
+            # Cada documento aparece una sola vez por término, así que la suma indexada es segura
+            puntajes[posiciones] += idf * frecuencias * (self.k1 + 1) / (frecuencias + normalizacion[posiciones])
+
+        candidatos = np.flatnonzero(puntajes)
+        if len(candidatos) > limite:
+            candidatos = candidatos[np.argpartition(puntajes[candidatos], -limite)[-limite:]]
+        candidatos = candidatos[np.argsort(puntajes[candidatos])[::-1]]
+        return [(self._ids[i], float(puntajes[i])) for i in candidatos]
+
+    def estadisticas(self) -> Dict:
+        """Tamaño del índice, tiempo de construcción y memoria aproximada."""
+        with self._lock:
+            memoria = sys.getsizeof(self._postings) + sys.getsizeof(self._ids) + sys.getsizeof(self._largos)
+            postings = 0
+            for termino, (posiciones, frecuencias) in self._postings.items():
+                memoria += sys.getsizeof(termino) + sys.getsizeof(posiciones) + sys.getsizeof(frecuencias)
+                postings += len(posiciones)
+            return {
+                "listo": self.listo,
+                "noticias": len(self._ids),
+                "terminos": len(self._postings),
+                "postings": postings,
+                "ultimo_id": self._ultimo_id,
+                "segundos_construccion": self.segundos_construccion,
+                "memoria_mb": round(memoria / 1024 / 1024, 2),
+            }
+
+_indice: Optional[IndiceBM25] = None
+_indice_lock = threading.Lock()
+
+def get_indice() -> Optional[IndiceBM25]:
+    """Índice del proceso si SEARCH_BACKEND=bm25, o None si la búsqueda usa la base."""
+    global _indice
+    if SEARCH_BACKEND != "bm25":
+        return None
+    if _indice is None:
+        with _indice_lock:
+            if _indice is None:
+                _indice = IndiceBM25()
+    return _indice
+
+def warm_up():
+    """
+    Construye el índice en un hilo aparte, que después lo mantiene actualizado;
+    mientras tanto la búsqueda usa la base.
+    """
+    indice = get_indice()
+    if indice is not None and not indice.listo:
+        threading.Thread(target=indice.mantener_actualizado, name="indice-bm25", daemon=True).start()
@@ -0,0 +1,225 @@
+"""
+Recuperación semántica de noticias con embeddings locales.
+
+Cada noticia (título + comienzo del contenido) se convierte en un vector con un
+modelo local: por defecto el endpoint de embeddings de Ollama, o los vectores de
+documento de spaCy (EMBEDDING_BACKEND=spacy, conviene un modelo con vectores como
+es_core_news_md). Los vectores normalizados se guardan en archivos binarios de
+solo agregado que se abren como matrices de NumPy mapeadas en memoria, así que
+la API no carga el archivo completo en RAM y la similitud coseno se calcula con
+un único producto matriz-vector.
+
+`actualizar_embeddings` es el trabajo incremental: procesa solo las noticias con
+id mayor al último ya guardado (ver scripts/embed_noticias.py).
+"""
+import json
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import select
+
+from app.db import SessionLocal, Noticia
+
+# Cómo elige query_with_llm el contexto: keyword (search_news), semantic o hybrid
+RETRIEVAL_BACKEND = os.getenv("RETRIEVAL_BACKEND", "keyword")
+EMBEDDING_BACKEND = os.getenv("EMBEDDING_BACKEND", "ollama")
+EMBEDDING_MODEL = os.getenv("EMBEDDING_MODEL", "nomic-embed-text")
+EMBEDDINGS_DIR = os.getenv("EMBEDDINGS_DIR", os.path.join("data", "embeddings"))
+# Caracteres del contenido que entran en el embedding (el comienzo de la nota es lo más informativo)
+EMBEDDING_MAX_CHARS = int(os.getenv("EMBEDDING_MAX_CHARS", "2000"))
+# Pedidos de embeddings simultáneos a Ollama (su API recibe un texto por pedido)
+EMBEDDING_WORKERS = int(os.getenv("EMBEDDING_WORKERS", "4"))
+# Peso de la similitud semántica frente a la de palabras clave en la búsqueda híbrida
+HYBRID_ALPHA = float(os.getenv("HYBRID_ALPHA", "0.7"))
+
+def _texto_noticia(titulo: str, contenido: str) -> str:
+    return f"{titulo or ''}. {(contenido or '')[:EMBEDDING_MAX_CHARS]}"
+
+def _normalizar(matriz: np.ndarray) -> np.ndarray:
+    normas = np.linalg.norm(matriz, axis=1, keepdims=True)
+    normas[normas == 0] = 1
+    return (matriz / normas).astype(np.float32)
+
+def _identificador_modelo() -> str:
+    return f"{EMBEDDING_BACKEND}:{EMBEDDING_MODEL if EMBEDDING_BACKEND == 'ollama' else 'spacy'}"
+
+def embed_textos(textos: Sequence[str]) -> np.ndarray:
+    """Matriz (len(textos) x dim) de embeddings normalizados."""
+    if EMBEDDING_BACKEND == "spacy":
+        from app.nlp import vectores_en_lote
+        vectores = vectores_en_lote(textos)
+    else:
+        from app.llm_client import llm_client
+        if not llm_client.is_available():
+            raise RuntimeError("Ollama no está disponible para calcular embeddings")
+
+        def embedding(texto):
+            return llm_client.client.embeddings(model=EMBEDDING_MODEL, prompt=texto)["embedding"]
+
+        if len(textos) == 1 or EMBEDDING_WORKERS <= 1:
+            vectores = [embedding(texto) for texto in textos]
+        else:
+            # Ollama no tiene un endpoint de embeddings por lote en esta versión del
+            # cliente: los pedidos de un lote se hacen en paralelo
+            with ThreadPoolExecutor(max_workers=EMBEDDING_WORKERS) as executor:
+                vectores = list(executor.map(embedding, textos))
+    return _normalizar(np.asarray(vectores, dtype=np.float32))
+
+class AlmacenVectores:
+    """
+    Vectores de noticias en disco: `vectores.f32` (filas float32), `ids.i32`
+    (id de noticia de cada fila, en orden creciente) y `meta.json` (modelo y
+    dimensión). Los archivos solo crecen, por lo que un lector puede seguir
+    usando su mapeo mientras el trabajo incremental agrega filas; `reiniciar`
+    no los trunca sino que los reemplaza por archivos nuevos.
+    """
+
+    def __init__(self, directorio: str = EMBEDDINGS_DIR):
+        self.directorio = directorio
+        self._ruta_vectores = os.path.join(directorio, "vectores.f32")
+        self._ruta_ids = os.path.join(directorio, "ids.i32")
+        self._ruta_meta = os.path.join(directorio, "meta.json")
+        self._lock = threading.Lock()
+        self._archivo_mapeado = None
+        self._ids = None
+        self._matriz = None
+
+    def meta(self) -> Optional[Dict]:
+        if not os.path.exists(self._ruta_meta):
+            return None
+        with open(self._ruta_meta) as f:
+            return json.load(f)
+
+    def _vistas(self) -> Tuple[np.ndarray, np.ndarray]:
+        """ids y matriz mapeados en memoria; se vuelven a mapear solo si los archivos crecieron o se reemplazaron."""
+        meta = self.meta()
+        if meta is None or not os.path.exists(self._ruta_ids):
+            return np.empty(0, dtype=np.int32), np.empty((0, 0), dtype=np.float32)
+        estado = os.stat(self._ruta_ids)
+        # El inodo cambia cuando `reiniciar` reemplaza los archivos
+        archivo = (estado.st_ino, estado.st_size)
+        with self._lock:
+            if archivo != self._archivo_mapeado:
+                dim = meta["dim"]
+                # Las filas válidas son las que tienen id (los ids se escriben después de los vectores)
+                filas = min(estado.st_size // 4, os.path.getsize(self._ruta_vectores) // (4 * dim))
+                if filas == 0:
+                    self._ids = np.empty(0, dtype=np.int32)
+                    self._matriz = np.empty((0, dim), dtype=np.float32)
+                else:
+                    self._ids = np.memmap(self._ruta_ids, dtype=np.int32, mode="r", shape=(filas,))
+                    self._matriz = np.memmap(self._ruta_vectores, dtype=np.float32, mode="r", shape=(filas, dim))
+                self._archivo_mapeado = archivo
+            return self._ids, self._matriz
+
+    def __len__(self):
+        return len(self._vistas()[0])
+
+    def ultimo_id(self) -> int:
+        ids, _ = self._vistas()
+        return int(ids[-1]) if len(ids) else 0
+
+    def reiniciar(self, dim: int):
+        """
+        Borra los vectores guardados (por ejemplo, al cambiar de modelo). Se
+        escriben archivos nuevos y se reemplazan con `os.replace`: truncar los
+        actuales haría fallar (SIGBUS) a los lectores que los tienen mapeados.
+        """
+        os.makedirs(self.directorio, exist_ok=True)
+        for ruta in (self._ruta_vectores, self._ruta_ids):
+            open(f"{ruta}.tmp", "wb").close()
+            os.replace(f"{ruta}.tmp", ruta)
+        with open(f"{self._ruta_meta}.tmp", "w") as f:
+            json.dump({"modelo": _identificador_modelo(), "dim": dim}, f)
+        os.replace(f"{self._ruta_meta}.tmp", self._ruta_meta)
+        self._archivo_mapeado = None
+
+    def agregar(self, ids: Sequence[int], matriz: np.ndarray):
+        # Descarta vectores sin id de una escritura interrumpida: si no, desplazarían
+        # a todas las filas agregadas después
+        filas = os.path.getsize(self._ruta_ids) // 4 if os.path.exists(self._ruta_ids) else 0
+        tamano_valido = filas * matriz.shape[1] * 4
+        if os.path.exists(self._ruta_vectores) and os.path.getsize(self._ruta_vectores) > tamano_valido:
+            os.truncate(self._ruta_vectores, tamano_valido)
+        with open(self._ruta_vectores, "ab") as f:
+            f.write(np.ascontiguousarray(matriz, dtype=np.float32).tobytes())
+        with open(self._ruta_ids, "ab") as f:
+            f.write(np.asarray(ids, dtype=np.int32).tobytes())
+
+    def buscar(self, vector: np.ndarray, limite: int, palabras_clave: Sequence[int] = (),
+               alfa: float = HYBRID_ALPHA) -> List[Tuple[int, float]]:
+        """
+        Ids más similares al vector de la consulta (similitud coseno). Si se pasan
+        ids de una búsqueda por palabras clave (ordenados por relevancia), el
+        puntaje combina ambas señales: alfa * coseno + (1 - alfa) * puntaje por posición.
+        """
+        ids, matriz = self._vistas()
+        if len(ids) == 0:
+            return []
+        puntajes = matriz @ vector
+        if palabras_clave:
+            # Posición en el ranking de palabras clave -> puntaje en (0, 1]
+            clave = np.asarray(palabras_clave, dtype=np.int32)
+            filas = np.searchsorted(ids, clave)
+            validas = (filas < len(ids)) & (ids[np.minimum(filas, len(ids) - 1)] == clave)
+            por_posicion = np.zeros(len(ids), dtype=np.float32)
+            por_posicion[filas[validas]] = 1 - np.arange(len(clave), dtype=np.float32)[validas] / len(clave)
+            puntajes = alfa * puntajes + (1 - alfa) * por_posicion
+        limite = min(limite, len(ids))
+        mejores = np.argpartition(puntajes, -limite)[-limite:]
+        mejores = mejores[np.argsort(puntajes[mejores])[::-1]]
+        return [(int(ids[i]), float(puntajes[i])) for i in mejores]
+
+_almacen: Optional[AlmacenVectores] = None
+
+def get_almacen() -> AlmacenVectores:
+    global _almacen
+    if _almacen is None:
+        _almacen = AlmacenVectores()
+    return _almacen
+
+def buscar_semantico(consulta: str, limite: int = 5, palabras_clave: Sequence[int] = ()) -> List[Tuple[int, float]]:
+    """Ids de noticias más cercanas a la consulta (híbrido si se pasan ids por palabras clave)."""
+    almacen = get_almacen()
+    meta = almacen.meta()
+    if meta is None or len(almacen) == 0:
+        return []
+    if meta["modelo"] != _identificador_modelo():
+        logging.warning(f"Los embeddings guardados son de '{meta['modelo']}'; ejecutar scripts/embed_noticias.py")
+        return []
+    vector = embed_textos([consulta])[0]
+    return almacen.buscar(vector, limite, palabras_clave)
+
+def actualizar_embeddings(lote: int = 32) -> int:
+    """Calcula y guarda los embeddings de las noticias nuevas. Devuelve cuántas agregó."""
+    almacen = get_almacen()
+    meta = almacen.meta()
+    if meta is not None and meta["modelo"] != _identificador_modelo():
+        print(f"🔄 Cambió el modelo de embeddings ({meta['modelo']} -> {_identificador_modelo()}), se recalculan todos")
+        meta = None
+    desde = almacen.ultimo_id() if meta is not None else 0
+
+    db = SessionLocal()
+    agregadas = 0
+    try:
+        consulta = (
+            select(Noticia.id, Noticia.titulo, Noticia.contenido)
+            .where(Noticia.id > desde)
+            .order_by(Noticia.id)
+            .execution_options(yield_per=lote)
+        )
+        for particion in db.execute(consulta).partitions():
+            matriz = embed_textos([_texto_noticia(titulo, contenido) for _, titulo, contenido in particion])
+            if meta is None:
+                almacen.reiniciar(matriz.shape[1])
+                meta = almacen.meta()
+            almacen.agregar([noticia_id for noticia_id, _, _ in particion], matriz)
+            agregadas += len(particion)
+            print(f"💾 Embeddings calculados: {agregadas}")
+    finally:
+        db.close()
+    return agregadas
@@ -17,6 +17,19 @@ document.addEventListener('DOMContentLoaded', function () {
             const container = document.querySelector('.container');
             container.innerHTML = '<h2>Error al cargar las estadísticas</h2><p>No se pudieron obtener los datos del servidor. Por favor, inténtelo de nuevo más tarde.</p>';
         });
+
+    // La serie diaria sale del resumen stats_daily
+    const desde = new Date();
+    desde.setDate(desde.getDate() - 90);
+    fetch(`/estadisticas/serie?desde=${desde.toISOString().slice(0, 10)}`)
+        .then(response => {
+            if (!response.ok) {
+                throw new Error(`HTTP error! status: ${response.status}`);
+            }
+            return response.json();
+        })
+        .then(data => renderDailyChart(data.serie))
+        .catch(error => console.error('Error fetching daily series:', error));
 });
 
 function populateKPIs(stats) {
@@ -99,4 +112,46 @@ function renderClassificationChart(stats) {
             }
         }
     });
-} 
\ No newline at end of file
+}
+
+function renderDailyChart(serie) {
+    const ctx = document.getElementById('daily-chart').getContext('2d');
+
+    new Chart(ctx, {
+        type: 'line',
+        data: {
+            labels: serie.map(dia => dia.fecha),
+            datasets: [
+                {
+                    label: 'Accidentes',
+                    data: serie.map(dia => dia.cantidad_accidentes),
+                    borderColor: 'rgba(255, 99, 132, 1)',
+                    backgroundColor: 'rgba(255, 99, 132, 0.2)',
+                    fill: true,
+                    tension: 0.2
+                },
+                {
+                    label: 'Total de Noticias',
+                    data: serie.map(dia => dia.total_noticias),
+                    borderColor: 'rgba(54, 162, 235, 1)',
+                    backgroundColor: 'rgba(54, 162, 235, 0.2)',
+                    tension: 0.2
+                }
+            ]
+        },
+        options: {
+            responsive: true,
+            maintainAspectRatio: false,
+            scales: {
+                y: {
+                    beginAtZero: true
+                }
+            },
+            plugins: {
+                legend: {
+                    position: 'top',
+                }
+            }
+        }
+    });
+}
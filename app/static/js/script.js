@@ -22,7 +22,7 @@ document.addEventListener('DOMContentLoaded', () => {
         loader.classList.remove('hidden');
 
         try {
-            const response = await fetch('/consultar', {
+            const response = await fetch('/consultar/stream', {
                 method: 'POST',
                 headers: {
                     'Content-Type': 'application/json'
@@ -30,15 +30,30 @@ document.addEventListener('DOMContentLoaded', () => {
                 body: JSON.stringify({ pregunta: query })
             });
 
-            loader.classList.add('hidden');
-
             if (!response.ok) {
+                loader.classList.add('hidden');
                 const errorData = await response.json();
                 throw new Error(errorData.detail || 'Ocurrió un error en el servidor.');
             }
 
-            const data = await response.json();
-            displayResults(data);
+            // La respuesta llega como un evento JSON por línea
+            const reader = response.body.getReader();
+            const decoder = new TextDecoder();
+            let buffer = '';
+
+            while (true) {
+                const { done, value } = await reader.read();
+                if (done) {
+                    break;
+                }
+                buffer += decoder.decode(value, { stream: true });
+                const lines = buffer.split('\n');
+                buffer = lines.pop();
+                lines.filter(line => line.trim()).forEach(line => handleEvent(JSON.parse(line)));
+            }
+            if (buffer.trim()) {
+                handleEvent(JSON.parse(buffer));
+            }
 
         } catch (error) {
             loader.classList.add('hidden');
@@ -46,8 +61,21 @@ document.addEventListener('DOMContentLoaded', () => {
         }
     };
 
-    const displayResults = (data) => {
-        llmResponse.textContent = data.respuesta;
+    const handleEvent = (event) => {
+        if (event.tipo === 'noticias') {
+            // Las fuentes se muestran antes de que el modelo empiece a responder
+            loader.classList.add('hidden');
+            llmResponse.textContent = '';
+            displaySources(event);
+        } else if (event.tipo === 'fragmento') {
+            llmResponse.textContent += event.contenido;
+        } else if (event.tipo === 'error') {
+            loader.classList.add('hidden');
+            showError(event.sugerencia ? `${event.detalle} ${event.sugerencia}` : event.detalle);
+        }
+    };
+
+    const displaySources = (data) => {
         sourcesContainer.innerHTML = '';
 
         if (data.noticias_relevantes && data.noticias_relevantes.length > 0) {
@@ -0,0 +1,170 @@
+"""
+Barrido de thresholds sobre puntajes precalculados.
+
+Los puntajes crudos de cada clasificador se calculan una sola vez por noticia y
+se guardan en `puntajes_clasificacion`. A partir de ahí cualquier grilla de
+thresholds y de reglas de votación se evalúa con operaciones vectorizadas de
+NumPy, sin volver a ejecutar NLP ni modificar las filas de `noticias`.
+"""
+import itertools
+import time
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import select, delete, insert
+
+from app.db import SessionLocal, Noticia, PuntajeClasificacion, tabla_existe
+from app.classifier import puntajes_lote
+from app.classifiers import CLASIFICADORES, VOTOS_MINIMOS
+from app.classifiers.fingerprint import version_puntajes, huella
+
+def calcular_puntajes(batch_size: int = 64, n_process: int = 1) -> int:
+    """
+    Calcula y guarda los puntajes de las noticias que no los tienen o cuyo texto
+    o configuración de términos cambió desde el último cálculo. Devuelve la
+    cantidad de noticias procesadas.
+    """
+    if not tabla_existe(PuntajeClasificacion):
+        print("❌ No existe la tabla puntajes_clasificacion: crearla con "
+              "scripts/migrate_add_puntajes_clasificacion.py")
+        return 0
+    version = version_puntajes()
+    # El cursor de lectura queda abierto mientras se escribe, así que se usan dos sesiones
+    lectura = SessionLocal()
+    escritura = SessionLocal()
+    procesadas = 0
+    try:
+        consulta = (
+            select(Noticia.id, Noticia.titulo, Noticia.contenido, PuntajeClasificacion.huella)
+            .outerjoin(PuntajeClasificacion, PuntajeClasificacion.noticia_id == Noticia.id)
+            .execution_options(yield_per=batch_size)
+        )
+        for lote in lectura.execute(consulta).partitions():
+            pendientes = []
+            for noticia_id, titulo, contenido, huella_guardada in lote:
+                huella_actual = huella(titulo, contenido, version)
+                if huella_actual != huella_guardada:
+                    pendientes.append((noticia_id, titulo, contenido, huella_actual))
+            if not pendientes:
+                continue
+
+            puntajes = puntajes_lote(
+                [(titulo, contenido) for _, titulo, contenido, _ in pendientes],
+                batch_size=batch_size,
+                n_process=n_process
+            )
+            filas = [
+                {"noticia_id": noticia_id, "huella": huella_actual, **valores}
+                for (noticia_id, _, _, huella_actual), valores in zip(pendientes, puntajes)
+            ]
+            # Reemplazar los puntajes viejos (si los hay) en una misma transacción
+            ids = [fila["noticia_id"] for fila in filas]
+            escritura.execute(delete(PuntajeClasificacion).where(PuntajeClasificacion.noticia_id.in_(ids)))
+            escritura.execute(insert(PuntajeClasificacion), filas)
+            escritura.commit()
+            procesadas += len(filas)
+            print(f"💾 Puntajes calculados: {procesadas}")
+        return procesadas
+    except Exception:
+        escritura.rollback()
+        raise
+    finally:
+        lectura.close()
+        escritura.close()
+
+def cargar_puntajes() -> pd.DataFrame:
+    """Puntajes guardados junto con la clasificación actual de cada noticia."""
+    consulta = (
+        select(
+            PuntajeClasificacion.noticia_id,
+            PuntajeClasificacion.excluido,
+            *[getattr(PuntajeClasificacion, nombre) for nombre in CLASIFICADORES],
+            Noticia.classification
+        )
+        .join(Noticia, Noticia.id == PuntajeClasificacion.noticia_id)
+    )
+    db = SessionLocal()
+    try:
+        resultado = db.execute(consulta)
+        return pd.DataFrame(resultado.all(), columns=list(resultado.keys()))
+    finally:
+        db.close()
+
+def evaluar_grilla(puntajes: pd.DataFrame, grilla: dict, votos_minimos=(VOTOS_MINIMOS,),
+                   etiquetas: pd.Series = None) -> pd.DataFrame:
+    """
+    Evalúa todas las combinaciones de thresholds y reglas de votación.
+
+    Args:
+        puntajes: DataFrame devuelto por `cargar_puntajes`
+        grilla: Valores de threshold a probar por clasificador, ej. {'simple': [1, 2, 3], ...}
+        votos_minimos: Votos positivos mínimos para considerar accidente
+        etiquetas: Serie booleana indexada por noticia_id con la clasificación correcta (opcional)
+
+    Returns:
+        DataFrame con una fila por combinación: volumen de accidentes, concordancia
+        con la clasificación guardada y, si hay etiquetas, precisión/recall/F1.
+    """
+    habilitado = ~puntajes['excluido'].to_numpy(dtype=bool)
+    clasificacion_actual = (puntajes['classification'] == 'ACCIDENTE').to_numpy()
+    tiene_clasificacion = puntajes['classification'].notna().to_numpy()
+    total = len(puntajes)
+
+    # Votos de cada clasificador para cada threshold: matriz (noticias x thresholds)
+    votos = {}
+    for nombre in CLASIFICADORES:
+        valores = np.asarray(grilla[nombre], dtype=float)
+        columna = puntajes[nombre].to_numpy(dtype=float)
+        votos[nombre] = (columna[:, None] >= valores[None, :]) & habilitado[:, None]
+
+    verdad = None
+    if etiquetas is not None:
+        alineadas = etiquetas.reindex(puntajes['noticia_id'])
+        con_etiqueta = alineadas.notna().to_numpy()
+        verdad = alineadas.fillna(False).to_numpy(dtype=bool)
+
+    filas = []
+    indices = [range(len(grilla[nombre])) for nombre in CLASIFICADORES]
+    for combinacion in itertools.product(*indices):
+        positivos = sum(
+            votos[nombre][:, i].astype(np.int8) for nombre, i in zip(CLASIFICADORES, combinacion)
+        )
+        for minimo in votos_minimos:
+            prediccion = positivos >= minimo
+            fila = {nombre: grilla[nombre][i] for nombre, i in zip(CLASIFICADORES, combinacion)}
+            fila['votos_minimos'] = minimo
+            fila['accidentes'] = int(prediccion.sum())
+            fila['porcentaje'] = fila['accidentes'] / total * 100 if total else 0.0
+            fila['concordancia'] = (
+                float((prediccion == clasificacion_actual)[tiene_clasificacion].mean()) * 100
+                if tiene_clasificacion.any() else float('nan')
+            )
+            if verdad is not None:
+                fila.update(_metricas(prediccion[con_etiqueta], verdad[con_etiqueta]))
+            filas.append(fila)
+    return pd.DataFrame(filas)
+
+def _metricas(prediccion, verdad):
+    verdaderos_positivos = int((prediccion & verdad).sum())
+    predichos = int(prediccion.sum())
+    reales = int(verdad.sum())
+    precision = verdaderos_positivos / predichos if predichos else 0.0
+    recall = verdaderos_positivos / reales if reales else 0.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+    exactitud = float((prediccion == verdad).mean()) if len(verdad) else 0.0
+    return {'precision': precision, 'recall': recall, 'f1': f1, 'exactitud': exactitud}
+
+def barrido(grilla: dict, votos_minimos=(VOTOS_MINIMOS,), etiquetas: pd.Series = None,
+            batch_size: int = 64, n_process: int = 1) -> pd.DataFrame:
+    """Actualiza los puntajes pendientes y evalúa la grilla completa."""
+    print("🔄 Actualizando puntajes de clasificadores...")
+    inicio = time.time()
+    procesadas = calcular_puntajes(batch_size=batch_size, n_process=n_process)
+    print(f"✅ {procesadas} noticias puntuadas en {time.time() - inicio:.2f} segundos")
+
+    puntajes = cargar_puntajes()
+    print(f"📊 Evaluando grilla sobre {len(puntajes)} noticias...")
+    inicio = time.perf_counter()
+    resultados = evaluar_grilla(puntajes, grilla, votos_minimos, etiquetas)
+    print(f"✅ {len(resultados)} combinaciones evaluadas en {(time.perf_counter() - inicio) * 1000:.1f}ms")
+    return resultados
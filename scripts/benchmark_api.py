@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Script para medir la latencia (p50/p99) de los endpoints principales de la API.
+"""
+
+import sys
+import time
+import statistics
+import requests
+
+ENDPOINTS = [
+    ("GET", "/buscar", {"params": {"q": "accidente ruta", "limit": 10}}),
+    ("GET", "/estadisticas", {}),
+]
+
+def percentil(valores, p):
+    """Percentil por el método del rango más cercano"""
+    ordenados = sorted(valores)
+    indice = max(0, int(round(p / 100 * len(ordenados))) - 1)
+    return ordenados[indice]
+
+def benchmark(base_url="http://localhost:8000", repeticiones=50):
+    """Ejecuta cada endpoint N veces y reporta p50/p99 en milisegundos"""
+    print(f"⏱️  Midiendo latencia en {base_url} ({repeticiones} repeticiones por endpoint)")
+    session = requests.Session()
+
+    for metodo, path, kwargs in ENDPOINTS:
+        tiempos = []
+        for _ in range(repeticiones):
+            inicio = time.perf_counter()
+            response = session.request(metodo, f"{base_url}{path}", timeout=60, **kwargs)
+            tiempos.append((time.perf_counter() - inicio) * 1000)
+            if response.status_code != 200:
+                print(f"❌ {path} devolvió {response.status_code}")
+                break
+
+        if tiempos:
+            print(f"  {metodo} {path}: p50={percentil(tiempos, 50):.1f}ms "
+                  f"p99={percentil(tiempos, 99):.1f}ms media={statistics.mean(tiempos):.1f}ms")
+
+if __name__ == "__main__":
+    base_url = sys.argv[1] if len(sys.argv) > 1 else "http://localhost:8000"
+    repeticiones = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    benchmark(base_url, repeticiones)
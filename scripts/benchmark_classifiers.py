@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Script para medir el costo de clasificación por noticia.
+
+Compara la ejecución de los cuatro clasificadores preprocesando el texto cada
+uno por su cuenta (comportamiento anterior) contra `clasificar_noticia_completa`,
+que preprocesa una sola vez y comparte el documento.
+"""
+
+import sys
+import os
+import time
+
+# Agregar el directorio app al path para poder importar los módulos
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from app.db import SessionLocal, Noticia
+from app.classifier import clasificar_noticia_completa
+from app.classifiers.simple import es_accidente_simple
+from app.classifiers.stemmer import es_accidente_stemmer
+from app.classifiers.lemmatizer import es_accidente_lemmatizer
+from app.classifiers.ml_weighted import es_accidente_ml_weighted
+from app.nlp import warm_up
+
+def clasificar_por_separado(titulo, contenido):
+    """Cada clasificador repite su propio preprocesamiento"""
+    es_accidente_simple(titulo, contenido)
+    es_accidente_stemmer(titulo, contenido)
+    es_accidente_lemmatizer(titulo, contenido)
+    es_accidente_ml_weighted(titulo, contenido)
+
+def medir(nombre, funcion, noticias):
+    inicio = time.perf_counter()
+    for titulo, contenido in noticias:
+        funcion(titulo, contenido)
+    total = time.perf_counter() - inicio
+    por_noticia = total / len(noticias) * 1000
+    print(f"  {nombre}: {total:.2f}s en total, {por_noticia:.2f}ms por noticia")
+    return por_noticia
+
+def benchmark(limit=200):
+    db = SessionLocal()
+    try:
+        noticias = db.query(Noticia.titulo, Noticia.contenido).limit(limit).all()
+    finally:
+        db.close()
+
+    if not noticias:
+        print("❌ No hay noticias en la base de datos")
+        return
+
+    # Cargar los modelos antes de medir para no contar su inicialización
+    warm_up()
+
+    print(f"⏱️  Clasificando {len(noticias)} noticias...")
+    antes = medir("Preprocesamiento por clasificador", clasificar_por_separado, noticias)
+    despues = medir("Preprocesamiento compartido", clasificar_noticia_completa, noticias)
+    print(f"📊 Mejora: {antes / despues:.2f}x")
+
+if __name__ == "__main__":
+    limit = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    benchmark(limit)
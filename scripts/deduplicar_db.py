@@ -8,6 +8,7 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from app.db import SessionLocal, Noticia
+from app.daily_stats import reconstruir as reconstruir_stats_daily
 from sqlalchemy import func
 
 def deduplicar_noticias():
@@ -45,6 +46,7 @@ def deduplicar_noticias():
                 total_eliminadas += len(ids_a_eliminar)
         
         print(f"\n🎉 Proceso completado. Se eliminaron un total de {total_eliminadas} noticias duplicadas.")
+        reconstruir_stats_daily()
 
     except Exception as e:
         print(f"❌ Error durante el proceso de deduplicación: {e}")
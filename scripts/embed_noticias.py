@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""
+Script para calcular los embeddings de las noticias nuevas (búsqueda semántica).
+
+Solo procesa las noticias con id mayor al último embedding guardado, así que se
+puede ejecutar periódicamente o después de cada scraping. Si cambia el modelo
+(EMBEDDING_BACKEND / EMBEDDING_MODEL) se recalculan todos.
+"""
+
+import sys
+import os
+import time
+import argparse
+
+# Agregar el directorio app al path para poder importar los módulos
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from app.semantic_search import actualizar_embeddings, get_almacen, EMBEDDINGS_DIR
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Calcular embeddings de noticias nuevas.")
+    parser.add_argument("--batch-size", type=int, default=32, help="Noticias por lote de embeddings")
+    args = parser.parse_args()
+
+    print(f"🔄 Actualizando embeddings en {EMBEDDINGS_DIR}...")
+    inicio = time.time()
+    agregadas = actualizar_embeddings(lote=args.batch_size)
+    print(f"✅ {agregadas} noticias nuevas en {time.time() - inicio:.2f} segundos "
+          f"({len(get_almacen())} en total)")
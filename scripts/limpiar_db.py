@@ -8,6 +8,7 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from app.db import SessionLocal, Noticia
+from app.daily_stats import reconstruir as reconstruir_stats_daily
 
 if __name__ == "__main__":
     db = SessionLocal()
@@ -15,6 +16,7 @@ if __name__ == "__main__":
         deleted = db.query(Noticia).delete()
         db.commit()
         print(f"Se eliminaron {deleted} registros de la tabla 'noticias'.")
+        reconstruir_stats_daily()
     except Exception as e:
         db.rollback()
         print(f"Error al limpiar la base de datos: {e}")
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Script para agregar la columna clasificacion_huella a la tabla noticias.
+Las noticias existentes quedan sin huella y se vuelven a clasificar una única
+vez en la próxima re-clasificación; a partir de ahí solo se procesan las que
+cambien de texto o de configuración de clasificadores.
+"""
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.db import engine
+from sqlalchemy import text
+
+COLUMN_NAME = "clasificacion_huella"
+
+def column_exists(connection, table_name, column_name):
+    """Verifica si una columna existe en una tabla."""
+    query = f"""
+    SELECT 1 FROM INFORMATION_SCHEMA.COLUMNS
+    WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = '{table_name}' AND COLUMN_NAME = '{column_name}'
+    LIMIT 1
+    """
+    return connection.execute(text(query)).scalar() == 1
+
+def migrate():
+    print(f"Iniciando migración de la columna {COLUMN_NAME}...")
+
+    with engine.connect() as connection:
+        if column_exists(connection, 'noticias', COLUMN_NAME):
+            print(f"✅ La columna '{COLUMN_NAME}' ya existe, nada que hacer.")
+            return
+
+        connection.execute(text(f"ALTER TABLE noticias ADD COLUMN {COLUMN_NAME} VARCHAR(64) NULL"))
+        connection.commit()
+        print(f"   ✅ Columna '{COLUMN_NAME}' agregada.")
+
+    print("✅ Migración completada.")
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Script para agregar el índice FULLTEXT sobre noticias.titulo y noticias.contenido.
+- Permite que /buscar y la búsqueda de contexto del LLM usen MATCH ... AGAINST
+  ordenando por relevancia en lugar de recorrer todo el contenido con LIKE.
+- Solo aplica a MariaDB/MySQL (InnoDB).
+"""
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.db import engine, FULLTEXT_INDEX
+from sqlalchemy import text
+
+def index_exists(connection, table_name, index_name):
+    """Verifica si un índice existe en una tabla."""
+    query = f"""
+    SELECT 1 FROM INFORMATION_SCHEMA.STATISTICS
+    WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = '{table_name}' AND INDEX_NAME = '{index_name}'
+    LIMIT 1
+    """
+    return connection.execute(text(query)).scalar() == 1
+
+def migrate():
+    print("Iniciando migración del índice FULLTEXT de noticias...")
+
+    if engine.dialect.name not in ("mysql", "mariadb"):
+        print(f"⚠️  El motor '{engine.dialect.name}' no soporta FULLTEXT; la búsqueda seguirá usando LIKE.")
+        return
+
+    with engine.connect() as connection:
+        if index_exists(connection, 'noticias', FULLTEXT_INDEX):
+            print(f"✅ El índice '{FULLTEXT_INDEX}' ya existe, nada que hacer.")
+            return
+
+        # Puede tardar en bases grandes: InnoDB reconstruye la tabla al crear el primer índice FULLTEXT
+        print(f"Creando índice FULLTEXT '{FULLTEXT_INDEX}' (titulo, contenido)...")
+        connection.execute(text(f"ALTER TABLE noticias ADD FULLTEXT INDEX {FULLTEXT_INDEX} (titulo, contenido)"))
+        connection.commit()
+        print("   ✅ Índice creado.")
+
+    print("✅ Migración completada.")
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""
+Script para crear la tabla puntajes_clasificacion en bases existentes.
+Guarda los puntajes crudos de cada clasificador por noticia, para re-clasificar
+con otros thresholds (recalcular_clasificacion, barrido de thresholds) sin
+volver a ejecutar NLP. Las noticias existentes se puntúan en el próximo
+run_classifiers.
+"""
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.db import engine, PuntajeClasificacion, tabla_existe
+
+def migrate():
+    print("Iniciando migración de la tabla puntajes_clasificacion...")
+
+    if tabla_existe(PuntajeClasificacion):
+        print("✅ La tabla 'puntajes_clasificacion' ya existe, nada que hacer.")
+        return
+
+    PuntajeClasificacion.__table__.create(bind=engine)
+    print("   ✅ Tabla 'puntajes_clasificacion' creada.")
+
+    print("✅ Migración completada.")
+
+if __name__ == "__main__":
+    migrate()
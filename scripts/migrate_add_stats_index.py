@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Script para agregar los índices compuestos de estadísticas sobre noticias.
+- (media_id, es_accidente_transito): /estadisticas cuenta noticias por medio y
+  clasificación leyendo solo el índice, sin recorrer la tabla.
+- (fecha, media_id, es_accidente_transito): actualizar una celda (día, medio)
+  del resumen stats_daily lee solo el índice.
+- Crea y llena la tabla stats_daily si no existe.
+"""
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.db import engine
+from app.daily_stats import asegurar_tabla
+from sqlalchemy import text
+
+INDICES = {
+    "ix_noticias_media_accidente": "media_id, es_accidente_transito",
+    "ix_noticias_fecha_media_accidente": "fecha, media_id, es_accidente_transito",
+}
+
+def index_exists(connection, table_name, index_name):
+    """Verifica si un índice existe en una tabla."""
+    query = f"""
+    SELECT 1 FROM INFORMATION_SCHEMA.STATISTICS
+    WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = '{table_name}' AND INDEX_NAME = '{index_name}'
+    LIMIT 1
+    """
+    return connection.execute(text(query)).scalar() == 1
+
+def migrate():
+    print("Iniciando migración del índice de estadísticas...")
+
+    with engine.connect() as connection:
+        for index_name, columnas in INDICES.items():
+            if index_exists(connection, 'noticias', index_name):
+                print(f"✅ El índice '{index_name}' ya existe.")
+                continue
+
+            print(f"Creando índice '{index_name}' ({columnas})...")
+            connection.execute(text(f"ALTER TABLE noticias ADD INDEX {index_name} ({columnas})"))
+            connection.commit()
+            print("   ✅ Índice creado.")
+
+    print("Verificando la tabla stats_daily...")
+    asegurar_tabla()
+
+    print("✅ Migración completada.")
+
+if __name__ == "__main__":
+    migrate()
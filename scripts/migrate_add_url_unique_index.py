@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Script para agregar el índice único sobre noticias.url.
+- Elimina las noticias duplicadas por URL (conserva la de menor ID).
+- Crea el índice único 'ux_noticias_url'.
+"""
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.db import engine
+from sqlalchemy import text
+
+INDEX_NAME = "ux_noticias_url"
+
+def index_exists(connection, table_name, index_name):
+    """Verifica si un índice existe en una tabla."""
+    query = f"""
+    SELECT 1 FROM INFORMATION_SCHEMA.STATISTICS
+    WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = '{table_name}' AND INDEX_NAME = '{index_name}'
+    LIMIT 1
+    """
+    return connection.execute(text(query)).scalar() == 1
+
+def migrate():
+    print("Iniciando migración del índice único de URL...")
+
+    with engine.connect() as connection:
+        if index_exists(connection, 'noticias', INDEX_NAME):
+            print(f"✅ El índice '{INDEX_NAME}' ya existe, nada que hacer.")
+            return
+
+        # Paso 1: eliminar duplicados, de lo contrario el índice único no se puede crear
+        print("1. Eliminando noticias duplicadas por URL...")
+        result = connection.execute(text("""
+            DELETE FROM noticias
+            WHERE id NOT IN (
+                SELECT min_id FROM (SELECT MIN(id) AS min_id FROM noticias GROUP BY url) AS primeras
+            )
+        """))
+        print(f"   ✅ {result.rowcount} duplicados eliminados.")
+
+        # Paso 2: crear el índice único (url es VARCHAR(255): entra completo en el índice con utf8mb4)
+        print(f"2. Creando índice único '{INDEX_NAME}'...")
+        connection.execute(text(f"ALTER TABLE noticias ADD UNIQUE INDEX {INDEX_NAME} (url)"))
+        print("   ✅ Índice creado.")
+
+        connection.commit()
+
+    print("✅ Migración completada.")
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+"""
+Script para reconstruir la tabla resumen stats_daily desde noticias.
+- La ingesta y la clasificación la mantienen al día; usarlo después de
+  modificar noticias por fuera de esos caminos (limpiezas, deduplicación,
+  correcciones manuales) o para crearla en una base existente.
+"""
+import sys
+import os
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.daily_stats import reconstruir
+
+if __name__ == "__main__":
+    print("🔄 Reconstruyendo stats_daily...")
+    inicio = time.time()
+    celdas = reconstruir()
+    print(f"✅ {celdas} celdas (día, medio) en {time.time() - inicio:.2f} segundos")
@@ -5,20 +5,30 @@ Script para ejecutar solo los clasificadores en las noticias existentes.
 
 import sys
 import os
+import argparse
 
 # Agregar el directorio app al path para poder importar los módulos
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
-from app.scraper_runner import run_classifiers, force_reclassify_all
+from app.scraper_runner import run_classifiers, force_reclassify_all, recalcular_clasificacion, CLASSIFIER_BATCH_SIZE, CLASSIFIER_N_PROCESS, CLASSIFIER_WORKERS
 
 if __name__ == "__main__":
-    # Verificar argumentos
-    if len(sys.argv) > 1 and sys.argv[1] == "--force":
+    parser = argparse.ArgumentParser(description="Ejecutar solo los clasificadores.")
+    parser.add_argument("--force", action="store_true", help="Re-clasifica TODAS las noticias")
+    parser.add_argument("--batch-size", type=int, default=CLASSIFIER_BATCH_SIZE, help="Noticias por lote de clasificación")
+    parser.add_argument("--n-process", type=int, default=CLASSIFIER_N_PROCESS, help="Procesos que usa spaCy para lematizar")
+    parser.add_argument("--workers", type=int, default=CLASSIFIER_WORKERS, help="Procesos que clasifican en paralelo")
+    parser.add_argument("--recalcular", action="store_true", help="Recalcula la clasificación desde los puntajes guardados (sin NLP)")
+    args = parser.parse_args()
+
+    if args.recalcular:
+        recalcular_clasificacion()
+    elif args.force:
         print("🔄 Ejecutando re-clasificación forzada de todas las noticias...")
-        clasificadas = force_reclassify_all()
+        clasificadas = force_reclassify_all(batch_size=args.batch_size, n_process=args.n_process, workers=args.workers)
         print(f"Re-clasificación completada. Total noticias procesadas: {clasificadas}")
     else:
         print("Ejecutando solo clasificadores...")
-        clasificadas = run_classifiers()
+        clasificadas = run_classifiers(batch_size=args.batch_size, n_process=args.n_process, workers=args.workers)
         print(f"Clasificación completada. Total noticias clasificadas: {clasificadas}")
-        print("\n💡 Para re-clasificar TODAS las noticias, usa: python scripts/run_classifiers.py --force") 
\ No newline at end of file
+        print("\n💡 Para re-clasificar TODAS las noticias, usa: python scripts/run_classifiers.py --force")
\ No newline at end of file
@@ -32,7 +32,7 @@ def test_elsubmarino_scraper():
 
         # Crear y ejecutar el scraper
         scraper = ElSubmarinoJujuyScraper(fecha_limite=fecha_limite)
-        noticias_guardadas = scraper.scrape(db)
+        noticias_guardadas = scraper.run(db)
         
         print("\n📊 Resultados del Scraping:")
         print(f"   ✅ Noticias nuevas guardadas: {noticias_guardadas}")
@@ -23,7 +23,7 @@ def test_eltribuno_salta_scraper():
     
     try:
         # Run scraper
-        noticias_guardadas = scraper.scrape(db)
+        noticias_guardadas = scraper.run(db)
         print(f"✅ Scraping completado. Se guardaron {noticias_guardadas} noticias.")
         
         # Verify some articles were saved
@@ -25,7 +25,7 @@ def test_informate_salta_scraper():
     
     try:
         # Ejecutar el scraper
-        noticias_guardadas = scraper.scrape(db)
+        noticias_guardadas = scraper.run(db)
         
         print(f"✅ Scraping completado. Se guardaron {noticias_guardadas} noticias.")
         
@@ -20,7 +20,7 @@ def test_jujuyalmomento_tags_scraper():
     db = SessionLocal()
     
     try:
-        noticias_guardadas = scraper.scrape(db)
+        noticias_guardadas = scraper.run(db)
         print(f"\n🎉 Prueba completada. Se guardaron {noticias_guardadas} noticias.")
         
     except Exception as e:
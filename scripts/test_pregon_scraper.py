@@ -29,7 +29,7 @@ def test_pregon_vermas():
         scraper = PregonScraper(fecha_limite=fecha_limite)
         
         # Ejecutar scraping
-        noticias_guardadas = scraper.scrape(db)
+        noticias_guardadas = scraper.run(db)
         
         print(f"\n📊 Resultados:")
         print(f"   ✅ Noticias guardadas: {noticias_guardadas}")
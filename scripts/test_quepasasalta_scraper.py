@@ -31,7 +31,7 @@ def test_quepasasalta_scraper():
     try:
         # Ejecutar el scraper
         print("\n🚀 Ejecutando scraper...")
-        noticias_guardadas = scraper.scrape(db)
+        noticias_guardadas = scraper.run(db)
         
         print(f"\n✅ Scraping completado. Noticias guardadas: {noticias_guardadas}")
         
@@ -1,51 +1,87 @@
 #!/usr/bin/env python3
 """
 Script para probar diferentes thresholds en los clasificadores.
+
+Los puntajes crudos de cada clasificador se calculan una sola vez por noticia
+(y solo se recalculan si cambia el texto o la configuración de términos). Las
+combinaciones de thresholds y reglas de votación se evalúan sobre esos
+puntajes, sin modificar la clasificación guardada de las noticias.
+
+Ejemplos:
+    python scripts/test_thresholds.py
+    python scripts/test_thresholds.py --ml-weighted 1 2 3 4 5 --votos 1 2 3 --top 30
+    python scripts/test_thresholds.py --etiquetas etiquetas.csv --ordenar f1 --salida barrido.csv
 """
 
 import sys
 import os
+import argparse
 
 # Agregar el directorio app al path para poder importar los módulos
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
-from app.scraper_runner import run_classifiers_with_custom_thresholds
-from app.classifiers import DEFAULT_THRESHOLDS
-
-def test_different_thresholds():
-    """Prueba diferentes configuraciones de thresholds"""
-    
-    print("=== PRUEBAS DE THRESHOLDS ===\n")
-    
-    # 1. Thresholds por defecto
-    print("1. Ejecutando con thresholds por defecto:")
-    print(f"   {DEFAULT_THRESHOLDS}")
-    run_classifiers_with_custom_thresholds(DEFAULT_THRESHOLDS)
-    print()
-    
-    # 2. Thresholds más estrictos (requiere más términos)
-    strict_thresholds = {
-        'simple': 2,        # Requiere al menos 2 términos
-        'stemmer': 2,       # Requiere al menos 2 términos
-        'lemmatizer': 2,    # Requiere al menos 2 términos
-        'ml_weighted': 3    # Requiere score mínimo de 3
-    }
-    print("2. Ejecutando con thresholds estrictos:")
-    print(f"   {strict_thresholds}")
-    run_classifiers_with_custom_thresholds(strict_thresholds)
-    print()
-    
-    # 3. Thresholds más permisivos (requiere menos términos)
-    lenient_thresholds = {
-        'simple': 1,        # Requiere al menos 1 término
-        'stemmer': 1,       # Requiere al menos 1 término
-        'lemmatizer': 1,    # Requiere al menos 1 término
-        'ml_weighted': 1    # Requiere score mínimo de 1
-    }
-    print("3. Ejecutando con thresholds permisivos:")
-    print(f"   {lenient_thresholds}")
-    run_classifiers_with_custom_thresholds(lenient_thresholds)
-    print()
+import pandas as pd
+
+from app.threshold_sweep import barrido
+from app.classifiers import DEFAULT_THRESHOLDS, VOTOS_MINIMOS, CLASIFICADORES
+
+# Configuraciones que antes se probaban re-clasificando toda la base
+PRESETS = {
+    'por defecto': DEFAULT_THRESHOLDS,
+    'estrictos': {'simple': 2, 'stemmer': 2, 'lemmatizer': 2, 'ml_weighted': 3},
+    'permisivos': {'simple': 1, 'stemmer': 1, 'lemmatizer': 1, 'ml_weighted': 1},
+}
+
+def cargar_etiquetas(ruta):
+    """CSV con columnas `id` y `es_accidente` (1/0) con la clasificación revisada a mano"""
+    etiquetas = pd.read_csv(ruta)
+    return etiquetas.set_index('id')['es_accidente'].astype(bool)
+
+def test_different_thresholds(args):
+    """Evalúa la grilla de thresholds y muestra las mejores combinaciones y los presets"""
+    grilla = {nombre: getattr(args, nombre) for nombre in CLASIFICADORES}
+    # Los presets siempre forman parte de la grilla
+    for thresholds in PRESETS.values():
+        for nombre in CLASIFICADORES:
+            if thresholds[nombre] not in grilla[nombre]:
+                grilla[nombre].append(thresholds[nombre])
+    grilla = {nombre: sorted(valores) for nombre, valores in grilla.items()}
+    # Los votos mínimos de los presets también
+    votos = sorted(set(args.votos) | {VOTOS_MINIMOS})
+
+    etiquetas = cargar_etiquetas(args.etiquetas) if args.etiquetas else None
+    resultados = barrido(grilla, votos_minimos=votos, etiquetas=etiquetas, batch_size=args.batch_size)
+
+    if resultados.empty:
+        print("❌ No hay noticias con puntajes para evaluar")
+        return
+
+    print("\n=== PRESETS ===")
+    for nombre, thresholds in PRESETS.items():
+        mascara = (resultados['votos_minimos'] == VOTOS_MINIMOS)
+        for clasificador in CLASIFICADORES:
+            mascara &= resultados[clasificador] == thresholds[clasificador]
+        print(f"\n{nombre}: {thresholds}")
+        print(resultados[mascara].to_string(index=False))
+
+    orden = args.ordenar or ('f1' if etiquetas is not None else 'concordancia')
+    print(f"\n=== MEJORES {args.top} COMBINACIONES (por {orden}) ===")
+    print(resultados.sort_values(orden, ascending=False).head(args.top).to_string(index=False))
+
+    if args.salida:
+        resultados.to_csv(args.salida, index=False)
+        print(f"\n💾 Resultados completos guardados en {args.salida}")
 
 if __name__ == "__main__":
-    test_different_thresholds() 
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Barrido de thresholds de los clasificadores")
+    parser.add_argument("--simple", type=float, nargs="+", default=[1, 2, 3, 4])
+    parser.add_argument("--stemmer", type=float, nargs="+", default=[1, 2, 3, 4])
+    parser.add_argument("--lemmatizer", type=float, nargs="+", default=[1, 2, 3, 4])
+    parser.add_argument("--ml-weighted", dest="ml_weighted", type=float, nargs="+", default=[1, 2, 3, 4, 5])
+    parser.add_argument("--votos", type=int, nargs="+", default=[1, 2, 3, 4], help="Votos positivos mínimos a probar")
+    parser.add_argument("--etiquetas", help="CSV con columnas id,es_accidente para medir precisión y recall")
+    parser.add_argument("--ordenar", help="Columna por la que ordenar los resultados")
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--salida", help="Guardar la tabla completa en un CSV")
+    parser.add_argument("--batch-size", type=int, default=64, help="Noticias por lote al calcular puntajes")
+    test_different_thresholds(parser.parse_args())
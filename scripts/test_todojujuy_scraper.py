@@ -24,7 +24,7 @@ def test_todojujuy_scraper():
     
     try:
         # Ejecuta el scraper
-        noticias_guardadas = scraper.scrape(db)
+        noticias_guardadas = scraper.run(db)
         print(f"\n🎉 Prueba completada. Se guardaron {noticias_guardadas} noticias.")
         
     except Exception as e: